@@ -0,0 +1,92 @@
+import os
+
+import cv2
+import numpy as np
+
+
+def _windows_affinity():
+    """(get, set) for the process affinity mask through kernel32."""
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    kernel32.GetProcessAffinityMask.argtypes = (
+        wintypes.HANDLE,
+        ctypes.POINTER(ctypes.c_size_t),
+        ctypes.POINTER(ctypes.c_size_t),
+    )
+    kernel32.SetProcessAffinityMask.argtypes = (wintypes.HANDLE, ctypes.c_size_t)
+    process = kernel32.GetCurrentProcess()
+
+    def get():
+        process_mask = ctypes.c_size_t()
+        system_mask = ctypes.c_size_t()
+        if not kernel32.GetProcessAffinityMask(
+            process, ctypes.byref(process_mask), ctypes.byref(system_mask)
+        ):
+            raise ctypes.WinError(ctypes.get_last_error())
+        mask = process_mask.value
+        return {bit for bit in range(mask.bit_length()) if mask >> bit & 1}
+
+    def set_(cores):
+        if not kernel32.SetProcessAffinityMask(process, sum(1 << core for core in cores)):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    return get, set_
+
+
+def _linux_affinity():
+    return (lambda: os.sched_getaffinity(0)), (lambda cores: os.sched_setaffinity(0, cores))
+
+
+if hasattr(os, "sched_getaffinity"):
+    _get_affinity, _set_affinity = _linux_affinity()
+elif os.name == "nt":
+    _get_affinity, _set_affinity = _windows_affinity()
+else:
+    _get_affinity = _set_affinity = None
+
+_ALL_CPUS = sorted(_get_affinity()) if _get_affinity is not None else None
+
+
+def load_clip(path, max_frames=None, flip=True):
+    """Read a recorded clip into memory; returns (frames, fps).
+
+    Frames are mirrored like the live loop in ``main.py`` unless ``flip`` is off.
+    """
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        raise RuntimeError(f"Cannot open clip: {path}")
+    fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+    frames = []
+    while max_frames is None or len(frames) < max_frames:
+        ok, frame = capture.read()
+        if not ok or frame is None:
+            break
+        frames.append(cv2.flip(frame, 1) if flip else frame)
+    capture.release()
+    if not frames:
+        raise RuntimeError(f"Clip has no frames: {path}")
+    return frames, float(fps)
+
+
+def latency_percentiles(seconds, percentiles=(50, 90, 99)):
+    if len(seconds) == 0:
+        return {f"p{p}_ms": None for p in percentiles}
+    values = np.percentile(np.asarray(seconds, dtype=np.float64) * 1000.0, percentiles)
+    return {f"p{p}_ms": round(float(v), 3) for p, v in zip(percentiles, values)}
+
+
+def limit_cpus(count):
+    """Pin the process to ``count`` cores (0 = all). Returns False if unsupported.
+
+    MediaPipe does not expose the inference thread count, so core affinity is
+    the closest available knob: ``sched_setaffinity`` on Linux,
+    ``SetProcessAffinityMask`` on Windows. macOS has no affinity API.
+    """
+    if _ALL_CPUS is None:
+        return count <= 0
+    cores = _ALL_CPUS if count <= 0 else _ALL_CPUS[:count]
+    _set_affinity(cores)
+    return True
@@ -0,0 +1,91 @@
+"""Achieved rate and tick jitter of the MouseDriver loop.
+
+    python -m benchmarks.driver_rate --rate 120 --seconds 3 --work-ms 0.3
+
+Runs the previous relative-sleep loop (``time.sleep(dt - elapsed)``) and
+``DeadlineScheduler`` for the same time, each with a stand-in for
+``MouseDriver.step`` that burns ``--work-ms``, and reports the achieved
+rate, tick interval percentiles, jitter against the nominal period, missed
+deadlines and the CPU the loop thread used. Run it on the target machine:
+sleep granularity is what differs between systems.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from src.mouse_driver import DeadlineScheduler
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def sleep_loop(rate, seconds, work):
+    """The loop ``MouseDriver._loop`` used before the scheduler."""
+    dt = 1.0 / rate
+    stamps = []
+    stop = time.perf_counter() + seconds
+    while time.perf_counter() < stop:
+        start_time = time.time()
+        stamps.append(time.perf_counter())
+        busy(work)
+        elapsed = time.time() - start_time
+        time.sleep(max(0, dt - elapsed))
+    return stamps, 0
+
+
+def deadline_loop(rate, seconds, work, spin):
+    scheduler = DeadlineScheduler(rate, spin=spin)
+    stamps = []
+    stop = time.perf_counter() + seconds
+    while time.perf_counter() < stop:
+        scheduler.wait()
+        stamps.append(time.perf_counter())
+        busy(work)
+    return stamps, scheduler.missed
+
+
+def report(name, stamps, missed, rate, cpu):
+    intervals = np.diff(stamps) * 1000.0
+    period = 1000.0 / rate
+    jitter = np.abs(intervals - period)
+    return {
+        "loop": name,
+        "rate_hz": round(len(intervals) / ((stamps[-1] - stamps[0]) or 1.0), 1),
+        "interval_ms": {
+            f"p{p}": round(float(np.percentile(intervals, p)), 3) for p in (50, 90, 99)
+        },
+        "jitter_ms": {f"p{p}": round(float(np.percentile(jitter, p)), 3) for p in (50, 90, 99)},
+        "max_ms": round(float(intervals.max()), 3),
+        "missed": missed,
+        "cpu_pct": round(cpu * 100.0, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=120.0)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--work-ms", type=float, default=0.3, help="Simulated step cost")
+    parser.add_argument("--spin", type=float, default=0.002)
+    args = parser.parse_args()
+
+    work = args.work_ms / 1000.0
+    runs = (
+        ("sleep", lambda: sleep_loop(args.rate, args.seconds, work)),
+        ("deadline", lambda: deadline_loop(args.rate, args.seconds, work, args.spin)),
+    )
+    for name, run in runs:
+        cpu_start = time.thread_time()
+        stamps, missed = run()
+        cpu = (time.thread_time() - cpu_start) / args.seconds
+        print(json.dumps(report(name, stamps, missed, args.rate, cpu)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Cursor backend calls and CPU of the MouseDriver tick, with and without coalescing.
+
+    python -m benchmarks.driver_syscalls --seconds 60
+    python -m benchmarks.driver_syscalls --backend auto   # real cursor, on the target machine
+
+Replays a session on simulated time at ``MOUSE_REFRESH_RATE``: stretches of
+30 Hz target motion, rests with sub-pixel target noise, and a rest during
+which the user moves the mouse by hand. A recording backend counts and
+times ``get_position`` and ``move``; by default it wraps an in-memory
+cursor, with ``--backend`` a real ``MouseController``. Reported per
+simulated second: calls of each kind, time spent in them, and CPU of the
+whole tick, plus how many user overrides were detected.
+"""
+
+import argparse
+import json
+import math
+import time
+
+import numpy as np
+
+from src.config import Config
+from src.mouse_driver import MouseDriver
+
+
+class MemoryCursor:
+    def __init__(self):
+        self.position = (500, 500)
+
+    def get_position(self):
+        return self.position
+
+    def move(self, x, y):
+        self.position = (math.floor(x + 0.5), math.floor(y + 0.5))
+
+
+class RecordingController:
+    """Counts and times the backend calls the driver makes."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.calls = {"get_position": 0, "move": 0}
+        self.seconds = {"get_position": 0.0, "move": 0.0}
+
+    def get_position(self):
+        start = time.perf_counter()
+        position = self.inner.get_position()
+        self.seconds["get_position"] += time.perf_counter() - start
+        self.calls["get_position"] += 1
+        return position
+
+    def move(self, x, y):
+        start = time.perf_counter()
+        self.inner.move(x, y)
+        self.seconds["move"] += time.perf_counter() - start
+        self.calls["move"] += 1
+
+
+def session(seconds, seed=0):
+    """Per 30 Hz frame: (target or None, user hand offset applied this frame)."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    phase = 0.0
+    while len(frames) < seconds * 30:
+        for k in range(60):
+            phase += 0.05
+            frames.append(((900 + 300 * math.sin(phase), 500 + 200 * math.cos(phase)), None))
+        rest = frames[-1][0]
+        for _ in range(90):
+            frames.append(((rest[0] + rng.normal(0, 0.15), rest[1] + rng.normal(0, 0.15)), None))
+        for k in range(30):
+            # Hand on the mouse: 6 px per frame, no new target.
+            frames.append((None, (6, 0)))
+    return frames[: int(seconds * 30)]
+
+
+def run(backend, coalesce, seconds):
+    controller = RecordingController(backend)
+    driver = MouseDriver(controller)
+    driver.coalesce = coalesce
+    rate = driver.refresh_rate
+    ticks_per_frame = max(int(round(rate / 30.0)), 1)
+    dt = 1.0 / rate
+    now = 0.0
+    overrides = 0
+    cpu_start = time.thread_time()
+    for target, hand in session(seconds):
+        if target is not None:
+            driver.update_target(target[0], target[1], timestamp=now)
+        if hand is not None:
+            x, y = backend.get_position()
+            backend.move(x + hand[0], y + hand[1])
+        for _ in range(ticks_per_frame):
+            before = driver._override_until
+            driver.tick(now, dt)
+            overrides += driver._override_until != before
+            now += dt
+    cpu = time.thread_time() - cpu_start
+    return {
+        "coalesce": coalesce,
+        "get_position_per_s": round(controller.calls["get_position"] / seconds, 1),
+        "move_per_s": round(controller.calls["move"] / seconds, 1),
+        "backend_ms_per_s": round(sum(controller.seconds.values()) / seconds * 1000.0, 3),
+        "tick_cpu_ms_per_s": round(cpu / seconds * 1000.0, 3),
+        "overrides": overrides,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--backend", default="", help="Wrap a real MouseController (e.g. auto, pynput)")
+    args = parser.parse_args()
+
+    for coalesce in (False, True):
+        if args.backend:
+            from src.controller import MouseController
+
+            backend = MouseController(backend=args.backend)
+        else:
+            backend = MemoryCursor()
+        print(json.dumps(run(backend, coalesce, args.seconds)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""Offline parameter sweep of the cursor filters over a recorded target series.
+
+    python -m benchmarks.filter_sweep targets.csv \\
+        --grid min_cutoff=0.3:0.6:1.0,beta=0.001:0.003:0.01,damping=0.3:0.4:0.6
+
+``targets.csv`` comes from a live session with ``MOTION_RECORD_PATH`` set
+(without one, synthetic reaches are used). ``MotionAccelerator``,
+``OneEuroFilter`` and ``MotionSmoother`` are replayed over the whole series
+with every grid combination as one column of a NumPy batch, so thousands
+of settings cost about as much as a handful. Results match the online
+classes. For each combination the report gives lag, jitter while resting
+and overshoot at the end of movements.
+
+Grid keys: ``min_cutoff``, ``beta``, ``damping``, ``max_speed``,
+``accel_gain``, ``precision_radius``, ``precision_damping``,
+``micro_radius``, ``micro_damping``, ``ref_fps``. Unlisted keys take their ``Config``
+value; ``accel_gain=1`` turns acceleration off. When ``ACCEL_CURVE`` is
+set it defines the gain for every combination instead.
+"""
+
+import argparse
+import itertools
+import json
+import math
+
+import numpy as np
+
+from benchmarks.landmark_precision import lag_frames
+from src.config import Config
+from src.curves import curve_from_config
+from src.one_euro import OneEuroBank
+from src.smoother import MotionSmoother
+
+
+def default_params():
+    return {
+        "min_cutoff": Config.SMOOTHING_MIN_CUTOFF,
+        "beta": Config.SMOOTHING_BETA,
+        "damping": Config.MOTION_DAMPING,
+        "ref_fps": Config.FILTER_FPS_REFERENCE,
+        "max_speed": Config.MOTION_MAX_SPEED,
+        "accel_gain": Config.ACCEL_MAX_GAIN if Config.ACCEL_ENABLED else 1.0,
+        "accel_min_speed": Config.ACCEL_MIN_SPEED,
+        "accel_max_speed": Config.ACCEL_MAX_SPEED,
+        "accel_exp": Config.ACCEL_EXP,
+        "precision_radius": Config.HEAD_PRECISION_RADIUS,
+        "precision_damping": Config.HEAD_PRECISION_DAMPING,
+        "micro_radius": Config.HEAD_MICRO_RADIUS,
+        "micro_damping": Config.HEAD_MICRO_DAMPING,
+    }
+
+
+def parse_grid(text):
+    """``key=v1:v2,key2=...`` -> {key: [values]}."""
+    grid = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        key, values = part.split("=")
+        grid[key.strip()] = [float(v) for v in values.split(":") if v.strip()]
+    return grid
+
+
+def expand_grid(grid):
+    """Cartesian product as {key: array of length P}, filled from ``default_params``."""
+    keys = list(grid)
+    combos = list(itertools.product(*(grid[k] for k in keys))) or [()]
+    params = {}
+    for key, value in default_params().items():
+        if key in grid:
+            params[key] = np.array([combo[keys.index(key)] for combo in combos], dtype=np.float64)
+        else:
+            params[key] = np.full(len(combos), float(value))
+    unknown = set(grid) - set(params)
+    if unknown:
+        raise ValueError(f"Unknown grid keys: {', '.join(sorted(unknown))}")
+    return params
+
+
+def load_recording(path):
+    """Columns t, x, y, accelerate, precision from a ``RecordStage`` CSV."""
+    data = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2)
+    return {
+        "t": data[:, 0],
+        "x": data[:, 1],
+        "y": data[:, 2],
+        "accelerate": data[:, 3] > 0.5,
+        "precision": data[:, 4] > 0.5,
+    }
+
+
+def synthetic_recording(reaches=20, fps=30.0, noise=1.5, seed=1):
+    from benchmarks.prediction import reach_path
+
+    path, _ = reach_path(reaches, rate=fps)
+    rng = np.random.default_rng(seed)
+    noisy = path + rng.normal(0.0, noise, path.shape)
+    count = len(path)
+    return {
+        "t": np.arange(count) / fps,
+        "x": noisy[:, 0],
+        "y": noisy[:, 1],
+        "accelerate": np.ones(count, dtype=bool),
+        "precision": np.zeros(count, dtype=bool),
+    }
+
+
+def accel_batch(rec, params, curve=None):
+    """``MotionAccelerator.apply`` for every combination; returns (T, P) x and y.
+
+    The accelerator only keeps the raw input as state, so speeds are the same
+    for every combination and the whole series is computed at once; only the
+    gain differs. With a ``curve`` (``ACCEL_CURVE``) the gain comes from its
+    table for all combinations.
+    """
+    width = len(params["accel_gain"])
+    x = rec["x"][:, None]
+    y = rec["y"][:, None]
+    out_x = np.repeat(x, width, axis=1)
+    out_y = np.repeat(y, width, axis=1)
+    # Frames the accelerator saw; the first of them only primes its state.
+    seen = np.flatnonzero(rec["accelerate"])
+    if len(seen) < 2:
+        return out_x, out_y
+    cur, prev = seen[1:], seen[:-1]
+    dt = np.maximum(rec["t"][cur] - rec["t"][prev], 1e-6)[:, None]
+    dx = (rec["x"][cur] - rec["x"][prev])[:, None]
+    dy = (rec["y"][cur] - rec["y"][prev])[:, None]
+    speed = np.hypot(dx, dy) / dt
+    if curve is not None:
+        gain = np.broadcast_to(curve.evaluate(speed), (len(cur), width))
+    else:
+        min_speed = params["accel_min_speed"]
+        max_speed = params["accel_max_speed"]
+        flat = max_speed <= min_speed
+        span = np.where(flat, 1.0, max_speed - min_speed)
+        frac = np.clip((speed - min_speed) / span, 0.0, 1.0) ** params["accel_exp"]
+        gain = np.where(flat, 1.0, 1.0 + frac * (params["accel_gain"] - 1.0))
+    out_x[cur] = x[cur] + dx * (gain - 1.0)
+    out_y[cur] = y[cur] + dy * (gain - 1.0)
+    return out_x, out_y
+
+
+def one_euro_batch(times, xs, ys, params):
+    width = xs.shape[1]
+    bank = OneEuroBank(
+        2 * width,
+        min_cutoff=np.tile(params["min_cutoff"], 2),
+        beta=np.tile(params["beta"], 2),
+    )
+    out_x = np.empty_like(xs)
+    out_y = np.empty_like(ys)
+    for i, t in enumerate(times):
+        out = bank.filter(np.concatenate((xs[i], ys[i])), float(t))
+        out_x[i] = out[:width]
+        out_y[i] = out[width:]
+    return out_x, out_y
+
+
+def smoother_batch(times, xs, ys, precision, params):
+    """``MotionSmoother.apply`` for every combination."""
+    out_x = np.empty_like(xs)
+    out_y = np.empty_like(ys)
+    sx = xs[0].copy()
+    sy = ys[0].copy()
+    out_x[0] = sx
+    out_y[0] = sy
+    last_time = float(times[0])
+    micro_r = params["micro_radius"]
+    micro_d = params["micro_damping"]
+    prec_r = params["precision_radius"]
+    prec_d = params["precision_damping"]
+    blend_span = np.where(micro_r < prec_r, prec_r - micro_r, 1.0)
+    ref_fps = params["ref_fps"]
+    timed = ref_fps > 0.0
+    for i in range(1, len(times)):
+        t = float(times[i])
+        dt = max(t - last_time, 1e-6)
+        last_time = t
+        substeps = np.ones_like(ref_fps)
+        if precision[i]:
+            substeps = np.where(
+                timed,
+                np.clip(
+                    np.ceil(dt * ref_fps * MotionSmoother.PRECISION_SUBSTEPS - 1e-6),
+                    1,
+                    MotionSmoother.MAX_SUBSTEPS,
+                ),
+                1.0,
+            )
+        h = dt / substeps
+        for k in range(int(substeps.max())):
+            active = k < substeps
+            dx = xs[i] - sx
+            dy = ys[i] - sy
+            max_step = params["max_speed"] * h
+            step = (dx * dx + dy * dy) ** 0.5
+            over = step > max_step
+            scale = np.where(over, max_step / np.where(over, step, 1.0), 1.0)
+            dx = np.where(over, dx * scale, dx)
+            dy = np.where(over, dy * scale, dy)
+            damping = params["damping"]
+            if precision[i]:
+                blend = np.clip((step - micro_r) / blend_span, 0.0, 1.0)
+                ramp = np.where(
+                    micro_r < prec_r, micro_d + (prec_d - micro_d) * blend, prec_d
+                )
+                damping = np.where(
+                    step <= micro_r, micro_d, np.where(step <= prec_r, ramp, damping)
+                )
+            damping = np.where(timed, 1.0 - (1.0 - damping) ** (h * ref_fps), damping)
+            sx = np.where(active, sx + dx * damping, sx)
+            sy = np.where(active, sy + dy * damping, sy)
+        out_x[i] = sx
+        out_y[i] = sy
+    return out_x, out_y
+
+
+def evaluate(rec, params, accel_curve=None):
+    """Run accel -> One Euro -> smoother for every combination; returns (T, P, 2)."""
+    xs, ys = accel_batch(rec, params, accel_curve)
+    xs, ys = one_euro_batch(rec["t"], xs, ys, params)
+    xs, ys = smoother_batch(rec["t"], xs, ys, rec["precision"], params)
+    return np.stack((xs, ys), axis=-1)
+
+
+def reference_path(rec, window=5):
+    """Zero-phase moving average of the raw target: the 'intended' path."""
+    kernel = np.ones(window) / window
+    points = np.stack((rec["x"], rec["y"]), axis=1)
+    padded = np.pad(points, ((window // 2, window // 2), (0, 0)), mode="edge")
+    return np.stack(
+        [np.convolve(padded[:, k], kernel, mode="valid") for k in range(2)], axis=1
+    )
+
+
+def movement_stops(reference, times, speed_on=400.0, speed_off=60.0):
+    """(start index, stop index) of each movement, with hysteresis on speed."""
+    dt = np.maximum(np.diff(times), 1e-6)
+    speed = np.hypot(*np.diff(reference, axis=0).T) / dt
+    stops = []
+    start = None
+    for i, value in enumerate(speed):
+        if start is None and value >= speed_on:
+            start = i
+        elif start is not None and value <= speed_off:
+            stops.append((start, i + 1))
+            start = None
+    return stops, np.concatenate(([0.0], speed))
+
+
+def settled_mask(speed, frames, threshold=30.0):
+    """True where the reference has been still for at least ``frames`` samples."""
+    still = speed < threshold
+    run = np.zeros(len(speed), dtype=int)
+    for i in range(len(speed)):
+        run[i] = run[i - 1] + 1 if still[i] and i else int(still[i])
+    return run > frames
+
+
+def score(outputs, rec, window=0.5, settle=0.3):
+    """Lag (ms), resting jitter (px RMS) and mean overshoot (px) per combination.
+
+    Jitter is the RMS second difference of the output once the reference has
+    been still for ``settle`` seconds, so a cursor still catching up does not
+    count as jitter.
+    """
+    times = rec["t"]
+    reference = reference_path(rec)
+    dt = float(np.median(np.diff(times))) if len(times) > 1 else 1.0 / 30.0
+    stops, speed = movement_stops(reference, times)
+    resting = settled_mask(speed, int(settle / dt))[2:]
+    horizon = max(int(window / dt), 1)
+    rows = []
+    for p in range(outputs.shape[1]):
+        out = outputs[:, p]
+        lag = lag_frames(out, reference, max_lag=min(int(0.5 / dt), len(out) - 3)) * dt
+        accel = (out[2:] - 2.0 * out[1:-1] + out[:-2])[resting]
+        jitter = float(math.sqrt(np.mean(np.sum(accel * accel, axis=1)))) if len(accel) else 0.0
+        overshoots = []
+        for start, stop in stops:
+            direction = reference[stop] - reference[start]
+            length = float(np.hypot(*direction))
+            if length < 20.0:
+                continue
+            segment = out[stop : stop + horizon] - reference[stop]
+            if len(segment):
+                overshoots.append(max(0.0, float(np.max(segment @ (direction / length)))))
+        rows.append(
+            {
+                "lag_ms": round(lag * 1000.0, 1),
+                "jitter_px": round(jitter, 3),
+                "overshoot_px": round(float(np.mean(overshoots)), 2) if overshoots else 0.0,
+            }
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", nargs="?", help="CSV written via MOTION_RECORD_PATH")
+    parser.add_argument(
+        "--grid", default="min_cutoff=0.3:0.6:1.0:1.5,beta=0.001:0.003:0.01,damping=0.3:0.4:0.6"
+    )
+    parser.add_argument("--sort", default="jitter_px", choices=("lag_ms", "jitter_px", "overshoot_px"))
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    rec = load_recording(args.recording) if args.recording else synthetic_recording()
+    grid = parse_grid(args.grid)
+    params = expand_grid(grid)
+    outputs = evaluate(
+        rec, params, curve_from_config(Config.ACCEL_CURVE, Config.CURVE_INTERPOLATION)
+    )
+    rows = score(outputs, rec)
+    for index, row in enumerate(rows):
+        row.update({key: float(params[key][index]) for key in grid})
+    rows.sort(key=lambda row: row[args.sort])
+    print(json.dumps({"samples": len(rec["t"]), "combinations": len(rows)}))
+    for row in rows[: args.top]:
+        print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
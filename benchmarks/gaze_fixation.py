@@ -0,0 +1,108 @@
+"""Gaze smoothing: fixed EMA against the fixation/saccade filter.
+
+    python -m benchmarks.gaze_fixation --fps 30 --noise 0.012
+
+Synthetic gaze (screen-normalized units, as ``EyeTracker`` produces after
+gain) alternates fixations of 0.3-0.9 s with 40 ms saccades, plus landmark
+noise. Each method replays it and reports jitter and error while the eyes
+rest on a target and the time the output needs to land after a saccade.
+"""
+
+import argparse
+import json
+import math
+
+import numpy as np
+
+from src.config import Config
+from src.fixation import FixationFilter
+
+
+def gaze_trace(fixations=60, fps=30.0, noise=0.012, saccade=0.04, seed=0):
+    """(times, observed (T, 2), true (T, 2), [(saccade start index, target)])."""
+    rng = np.random.default_rng(seed)
+    point = np.array([0.5, 0.5])
+    true = []
+    jumps = []
+    for _ in range(fixations):
+        target = rng.uniform(0.1, 0.9, 2)
+        steps = max(int(round(saccade * fps)), 1)
+        jumps.append((len(true), target))
+        for k in range(1, steps + 1):
+            blend = 0.5 - 0.5 * math.cos(math.pi * k / steps)
+            true.append(point + (target - point) * blend)
+        point = target
+        true.extend([point] * int(rng.uniform(0.3, 0.9) * fps))
+    true = np.asarray(true)
+    observed = true + rng.normal(0.0, noise, true.shape)
+    return np.arange(len(true)) / fps, observed, true, jumps
+
+
+class EmaGaze:
+    """``EyeTracker``'s smoothing step on its own."""
+
+    def __init__(self, alpha, ref_fps):
+        self.alpha = alpha
+        self.ref_dt = 1.0 / ref_fps
+        self.state = None
+        self.last = None
+
+    def update(self, x, y, t):
+        if self.state is None:
+            self.state = [x, y]
+        else:
+            a = 1.0 - (1.0 - self.alpha) ** ((t - self.last) / self.ref_dt)
+            self.state[0] += (x - self.state[0]) * a
+            self.state[1] += (y - self.state[1]) * a
+        self.last = t
+        return tuple(self.state)
+
+
+def evaluate(method, times, observed, true, jumps, fps, settle=0.15):
+    out = np.array([method.update(x, y, t) for t, (x, y) in zip(times.tolist(), observed.tolist())])
+    resting = np.zeros(len(times), dtype=bool)
+    latencies = []
+    bounds = [start for start, _ in jumps] + [len(times)]
+    for (start, target), end in zip(jumps, bounds[1:]):
+        amplitude = np.hypot(*(target - true[start - 1])) if start else 0.0
+        error = np.hypot(*(out[start:end] - target).T)
+        landed = np.flatnonzero(error <= max(0.1 * amplitude, 0.02))
+        if amplitude > 0.1 and len(landed):
+            latencies.append((landed[0] + 1) / fps)
+        resting[min(start + int((0.04 + settle) * fps), end) : end] = True
+    steps = np.diff(out, axis=0)[resting[1:] & resting[:-1]]
+    return {
+        "jitter": round(float(math.sqrt(np.mean(np.sum(steps * steps, axis=1)))), 4),
+        "error": round(float(math.sqrt(np.mean(np.sum((out - true)[resting] ** 2, axis=1)))), 4),
+        "saccade_ms": round(float(np.median(latencies)) * 1000.0, 1) if latencies else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--noise", type=float, default=0.012)
+    parser.add_argument("--fixations", type=int, default=80)
+    args = parser.parse_args()
+
+    times, observed, true, jumps = gaze_trace(args.fixations, args.fps, args.noise)
+    ref = Config.EYE_SMOOTH_FPS_REFERENCE
+    methods = {
+        f"ema_{Config.EYE_SMOOTH_ALPHA}": EmaGaze(Config.EYE_SMOOTH_ALPHA, ref),
+        "ema_0.1": EmaGaze(0.1, ref),
+        "fixation": FixationFilter(
+            velocity=Config.EYE_FIXATION_VELOCITY,
+            dispersion=Config.EYE_FIXATION_DISPERSION,
+            duration=Config.EYE_FIXATION_DURATION,
+            saccade_alpha=Config.EYE_SACCADE_ALPHA,
+            ref_fps=ref,
+        ),
+    }
+    for name, method in methods.items():
+        row = {"method": name}
+        row.update(evaluate(method, times, observed, true, jumps, args.fps))
+        print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
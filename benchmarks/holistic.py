@@ -0,0 +1,79 @@
+"""Per-frame cost of the holistic backend against separate hand and face models.
+
+    python -m benchmarks.holistic clip.mp4 --frames 600
+
+Both paths get one shared RGB conversion per frame, as in ``main.py``.
+"""
+
+import argparse
+import json
+import time
+
+import cv2
+
+from benchmarks.common import latency_percentiles, load_clip
+from benchmarks.input_size import detection_rate, landmark_error
+from src.config import Config
+from src.face_blink import FaceBlinkDetector
+from src.frame_cache import landmark_array
+from src.hand_detector import HandDetector
+from src.holistic_detector import HolisticDetector
+
+
+def run_pair(hand, face, frames, fps):
+    """Run one hand + face view pair over the clip; returns latencies and tracks."""
+    face.reset()
+    latencies, hand_tracks, face_tracks = [], [], []
+    for index, frame in enumerate(frames):
+        start = time.perf_counter()
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        face.process(frame, index / fps, rgb=rgb)
+        hand.find_hands(frame, draw=False, rgb=rgb)
+        latencies.append(time.perf_counter() - start)
+        landmarks = hand.normalized_landmarks()
+        hand_tracks.append(landmark_array(landmarks)[:, :2] if landmarks else None)
+        face_tracks.append(
+            landmark_array(face.last_landmarks)[:468, :2] if face.last_landmarks else None
+        )
+    return {"latencies": latencies, "hand": hand_tracks, "face": face_tracks}
+
+
+def summarize(run, reference, frame_size):
+    row = latency_percentiles(run["latencies"])
+    row["hand_detection_rate"] = round(detection_rate(run["hand"]), 4)
+    row["face_detection_rate"] = round(detection_rate(run["face"]), 4)
+    if reference is not None:
+        row["hand_err_px"] = landmark_error(reference["hand"], run["hand"], frame_size)
+        row["face_err_px"] = landmark_error(reference["face"], run["face"], frame_size)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("clip", help="Recorded camera clip (any format OpenCV reads)")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    frames, fps = load_clip(args.clip, max_frames=args.frames)
+    frame_size = (frames[0].shape[1], frames[0].shape[0])
+
+    hand = HandDetector(input_size=Config.HAND_INPUT_SIZE)
+    face = FaceBlinkDetector(frame_skip=0, input_size=Config.BLINK_INPUT_SIZE)
+    hand.warmup()
+    face.warmup()
+    separate = run_pair(hand, face, frames, fps)
+
+    holistic = HolisticDetector(input_size=Config.HOLISTIC_INPUT_SIZE)
+    holistic.warmup()
+    combined = run_pair(holistic.hand, holistic.face, frames, fps)
+
+    report = {
+        "frames": len(frames),
+        "two_model": summarize(separate, None, frame_size),
+        "holistic": summarize(combined, separate, frame_size),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""Sweep detector input sizes and CPU counts over a recorded clip.
+
+    python -m benchmarks.input_size clip.mp4 --sizes 320x180,256x144,192x108
+        --cpus 0,2,4 --write
+
+Every setting is compared with a full-resolution, all-core reference run.
+Record the clip with still and moving segments and a few deliberate blinks;
+jitter is measured frame to frame, so still segments dominate it.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from benchmarks.common import latency_percentiles, limit_cpus, load_clip
+from src.config import Config
+from src.face_blink import FaceBlinkDetector
+from src.frame_cache import landmark_array
+from src.hand_detector import HandDetector
+from src.machine_tuning import save_machine_tuning, tuning_path
+
+
+DEFAULT_SIZES = "native,480x270,320x180,256x144,192x108"
+
+
+def parse_sizes(text):
+    sizes = []
+    for item in text.split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        if item == "native":
+            sizes.append(None)
+            continue
+        w, h = item.split("x")
+        sizes.append((int(w), int(h)))
+    return sizes
+
+
+def size_label(size):
+    return "native" if not size else f"{size[0]}x{size[1]}"
+
+
+def run_face(detector, frames, fps, input_size):
+    detector.input_size = input_size
+    detector.reset()
+    latencies, ratios, tracks, events = [], [], [], []
+    for index, frame in enumerate(frames):
+        start = time.perf_counter()
+        blink_type, long_blink = detector.process(frame, index / fps)
+        latencies.append(time.perf_counter() - start)
+        if detector.last_landmarks and detector.last_ratio is not None:
+            ratios.append(detector.last_ratio)
+            tracks.append(landmark_array(detector.last_landmarks)[:, :2])
+        else:
+            ratios.append(None)
+            tracks.append(None)
+        if blink_type is not None:
+            events.append((index, blink_type))
+        if long_blink:
+            events.append((index, "long"))
+    return {"latencies": latencies, "ratios": ratios, "tracks": tracks, "events": events}
+
+
+def run_hand(detector, frames, input_size):
+    detector.input_size = input_size
+    latencies, tracks = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        detector.find_hands(frame, draw=False)
+        latencies.append(time.perf_counter() - start)
+        landmarks = detector.normalized_landmarks()
+        tracks.append(landmark_array(landmarks)[:, :2] if landmarks else None)
+    return {"latencies": latencies, "tracks": tracks}
+
+
+def detection_rate(tracks):
+    if not tracks:
+        return 0.0
+    return sum(1 for t in tracks if t is not None) / len(tracks)
+
+
+def landmark_jitter(tracks, frame_size):
+    """RMS second difference of landmark positions in camera pixels."""
+    scale = np.asarray(frame_size, dtype=np.float32)
+    squared = []
+    for a, b, c in zip(tracks, tracks[1:], tracks[2:]):
+        if a is None or b is None or c is None or not (len(a) == len(b) == len(c)):
+            continue
+        accel = (a - 2.0 * b + c) * scale
+        squared.append(float(np.mean(np.sum(accel * accel, axis=1))))
+    if not squared:
+        return None
+    return float(np.sqrt(np.mean(squared)))
+
+
+def landmark_error(reference, candidate, frame_size):
+    """Mean distance in camera pixels to the reference landmarks."""
+    scale = np.asarray(frame_size, dtype=np.float32)
+    errors = []
+    for ref, cand in zip(reference, candidate):
+        if ref is None or cand is None or len(ref) != len(cand):
+            continue
+        errors.append(float(np.mean(np.linalg.norm((ref - cand) * scale, axis=1))))
+    return float(np.mean(errors)) if errors else None
+
+
+def event_agreement(reference, candidate, tolerance=2):
+    """F1 score of matching (frame, type) events within ``tolerance`` frames."""
+    if not reference and not candidate:
+        return 1.0
+    unmatched = list(candidate)
+    matched = 0
+    for index, kind in reference:
+        for i, (other_index, other_kind) in enumerate(unmatched):
+            if other_kind == kind and abs(other_index - index) <= tolerance:
+                matched += 1
+                del unmatched[i]
+                break
+    precision = matched / len(candidate) if candidate else 0.0
+    recall = matched / len(reference) if reference else 0.0
+    if precision + recall == 0.0:
+        return 0.0
+    return 2.0 * precision * recall / (precision + recall)
+
+
+def ratio_error(reference, candidate):
+    """Mean absolute eye aspect ratio difference on frames where both saw a face."""
+    errors = [
+        abs(ref - cand)
+        for ref, cand in zip(reference, candidate)
+        if ref is not None and cand is not None
+    ]
+    return float(np.mean(errors)) if errors else None
+
+
+def summarize_face(run, reference, frame_size):
+    row = latency_percentiles(run["latencies"])
+    row.update(
+        {
+            "detection_rate": round(detection_rate(run["tracks"]), 4),
+            "jitter_px": landmark_jitter(run["tracks"], frame_size),
+            "landmark_err_px": landmark_error(reference["tracks"], run["tracks"], frame_size),
+            "blink_agreement": round(event_agreement(reference["events"], run["events"]), 4),
+            "ear_err": ratio_error(reference["ratios"], run["ratios"]),
+        }
+    )
+    return row
+
+
+def summarize_hand(run, reference, frame_size):
+    row = latency_percentiles(run["latencies"])
+    row.update(
+        {
+            "detection_rate": round(detection_rate(run["tracks"]), 4),
+            "jitter_px": landmark_jitter(run["tracks"], frame_size),
+            "landmark_err_px": landmark_error(reference["tracks"], run["tracks"], frame_size),
+        }
+    )
+    return row
+
+
+def acceptable(row, reference, detector, args):
+    if row["detection_rate"] < reference["detection_rate"] * args.min_detection:
+        return False
+    ref_jitter = reference.get("jitter_px")
+    if ref_jitter and row["jitter_px"] is not None:
+        if row["jitter_px"] > ref_jitter * args.max_jitter_ratio:
+            return False
+    if detector == "face":
+        if row["blink_agreement"] < args.min_blink_agreement:
+            return False
+        if row["ear_err"] is not None and row["ear_err"] > args.max_ear_err:
+            return False
+    return True
+
+
+def recommend(rows, references, args):
+    """Core count and the fastest acceptable size per detector at that count.
+
+    Per ``--cpus`` value, each detector takes its fastest acceptable size by
+    p90 latency, and the count costs the sum of those p90s. Counts that
+    leave a detector without an acceptable size are out. The fewest cores
+    within ``core_tolerance`` of the cheapest count win: the cores left
+    over go to the rest of the app. Returns ``(cpus, {detector: row})``.
+    """
+    per_count = {}
+    for row in rows:
+        name = row["detector"]
+        if not acceptable(row, references[name], name, args):
+            continue
+        if row["p90_ms"] is None:
+            continue
+        best = per_count.setdefault(row.get("cpus", 0), {})
+        if name not in best or row["p90_ms"] < best[name]["p90_ms"]:
+            best[name] = row
+    costs = {
+        cpus: sum(row["p90_ms"] for row in best.values())
+        for cpus, best in per_count.items()
+        if set(best) == set(references)
+    }
+    if not costs:
+        return None, {}
+    limit = min(costs.values()) * (1.0 + args.core_tolerance)
+    # 0 means every core, so it ranks after any explicit count.
+    cpus = min(
+        (cpus for cpus, cost in costs.items() if cost <= limit),
+        key=lambda count: count if count > 0 else float("inf"),
+    )
+    return cpus, per_count[cpus]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("clip", help="Recorded camera clip (any format OpenCV reads)")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES)
+    parser.add_argument("--cpus", default="0", help="Comma list of core counts, 0 = all")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--detectors", default="face,hand")
+    parser.add_argument("--min-detection", type=float, default=0.98)
+    parser.add_argument("--max-jitter-ratio", type=float, default=1.3)
+    parser.add_argument("--min-blink-agreement", type=float, default=0.95)
+    parser.add_argument("--max-ear-err", type=float, default=0.02)
+    parser.add_argument(
+        "--core-tolerance",
+        type=float,
+        default=0.05,
+        help="Prefer fewer cores while the summed p90 stays within this fraction of the best",
+    )
+    parser.add_argument("--write", action="store_true", help=f"Write {tuning_path()}")
+    parser.add_argument("--out", default=None, help="Tuning file path override")
+    args = parser.parse_args()
+
+    frames, fps = load_clip(args.clip, max_frames=args.frames)
+    frame_size = (frames[0].shape[1], frames[0].shape[0])
+    sizes = parse_sizes(args.sizes)
+    cpu_counts = [int(c) for c in args.cpus.split(",") if c.strip()]
+    names = [n.strip() for n in args.detectors.split(",") if n.strip()]
+    print(f"{len(frames)} frames at {fps:.1f} fps, {frame_size[0]}x{frame_size[1]}")
+
+    def build(name):
+        if name == "face":
+            return FaceBlinkDetector(
+                frame_skip=0,
+                input_size=None,
+                blink_threshold=Config.BLINK_THRESHOLD,
+                blink_frames=Config.BLINK_FRAMES,
+                cooldown=Config.BLINK_COOLDOWN,
+            )
+        return HandDetector(min_detection_confidence=0.7, min_tracking_confidence=0.5)
+
+    def run(name, detector, size):
+        if name == "face":
+            return run_face(detector, frames, fps, size)
+        return run_hand(detector, frames, size)
+
+    def summarize(name, result, reference):
+        if name == "face":
+            return summarize_face(result, reference, frame_size)
+        return summarize_hand(result, reference, frame_size)
+
+    limit_cpus(0)
+    raw_refs = {}
+    references = {}
+    for name in names:
+        detector = build(name)
+        raw_refs[name] = run(name, detector, None)
+        references[name] = summarize(name, raw_refs[name], raw_refs[name])
+
+    rows = []
+    for cpus in cpu_counts:
+        if not limit_cpus(cpus):
+            print(f"Core limits need Linux or Windows; skipping cpus={cpus}")
+            continue
+        for name in names:
+            # Built after pinning so the inference thread pool sees the limit.
+            detector = build(name)
+            for size in sizes:
+                row = {"detector": name, "cpus": cpus, "size": size_label(size)}
+                row.update(summarize(name, run(name, detector, size), raw_refs[name]))
+                rows.append(row)
+                print(json.dumps(row))
+    limit_cpus(0)
+
+    cpus, best = recommend(rows, references, args)
+    overrides = {}
+    if cpus is not None:
+        overrides["THREAD_CORES"] = cpus
+    if "face" in best:
+        overrides["BLINK_INPUT_SIZE"] = parse_sizes(best["face"]["size"])[0] or ()
+    if "hand" in best:
+        overrides["HAND_INPUT_SIZE"] = parse_sizes(best["hand"]["size"])[0] or ()
+    print(f"Recommended cores: {cpus if cpus else 'all'}")
+    print("Recommended:", json.dumps(best, indent=2))
+    if args.write:
+        report = {
+            "clip": args.clip,
+            "references": references,
+            "results": rows,
+            "cpus": cpus,
+            "best": best,
+        }
+        path = save_machine_tuning(overrides, path=args.out, report=report)
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
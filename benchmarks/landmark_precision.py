@@ -0,0 +1,142 @@
+"""Jitter/lag trade-off of integer vs sub-pixel hand landmarks.
+
+    python -m benchmarks.landmark_precision clip.mp4
+    python -m benchmarks.landmark_precision --synthetic
+
+The index fingertip track goes through ``CoordinateMapper`` and the cursor
+``OneEuroFilter`` pair over a sweep of ``min_cutoff`` values. Each path is
+run twice, once truncated to camera pixels as before and once in float.
+For each setting the report gives output jitter and lag against the
+unfiltered float signal. ``--synthetic`` replaces the clip with a smooth
+path plus sub-pixel noise, so the quantization effect can be seen without
+a recording.
+"""
+
+import argparse
+import json
+import math
+
+import numpy as np
+
+from src.config import Config
+from src.mapper import CoordinateMapper
+from src.one_euro import OneEuroFilter
+
+
+def synthetic_track(frames=600, fps=30.0, cam_size=(640, 480), noise_px=0.3, seed=0):
+    """Slow figure-eight with still segments, in camera pixels."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(frames) / fps
+    w, h = cam_size
+    # Alternate 2 s of motion with 2 s of holding still.
+    moving = (t // 2.0) % 2 == 0
+    phase = np.cumsum(moving) / fps
+    x = w * 0.5 + w * 0.2 * np.sin(phase * 0.8)
+    y = h * 0.5 + h * 0.15 * np.sin(phase * 1.6)
+    track = np.stack([x, y], axis=1) + rng.normal(0.0, noise_px, size=(frames, 2))
+    return track, t
+
+
+def clip_track(path, frames):
+    from benchmarks.common import load_clip
+    from src.hand_detector import HandDetector
+
+    images, fps = load_clip(path, max_frames=frames)
+    detector = HandDetector(input_size=Config.HAND_INPUT_SIZE)
+    h, w = images[0].shape[:2]
+    points, times = [], []
+    for index, image in enumerate(images):
+        detector.find_hands(image, draw=False)
+        landmarks = detector.normalized_landmarks()
+        if landmarks:
+            points.append((landmarks[8].x * w, landmarks[8].y * h))
+            times.append(index / fps)
+    if len(points) < 3:
+        raise RuntimeError("Hand was not detected in the clip")
+    return np.asarray(points, dtype=np.float64), np.asarray(times, dtype=np.float64)
+
+
+def map_track(track, mapper, quantize=False):
+    source = np.floor(track) if quantize else track
+    return np.asarray([mapper.map(x, y) for x, y in source], dtype=np.float64)
+
+
+def filter_track(track, times, min_cutoff, beta):
+    fx = OneEuroFilter(min_cutoff=min_cutoff, beta=beta)
+    fy = OneEuroFilter(min_cutoff=min_cutoff, beta=beta)
+    return np.asarray(
+        [(fx.filter(x, t), fy.filter(y, t)) for (x, y), t in zip(track, times)],
+        dtype=np.float64,
+    )
+
+
+def jitter(track):
+    """RMS second difference in screen pixels."""
+    if len(track) < 3:
+        return 0.0
+    accel = track[2:] - 2.0 * track[1:-1] + track[:-2]
+    return float(math.sqrt(np.mean(np.sum(accel * accel, axis=1))))
+
+
+def lag_frames(output, reference, max_lag=15):
+    """Delay in frames that best aligns ``output`` with ``reference``.
+
+    Integer lags are scanned and the minimum is refined with a parabola, so
+    the result resolves less than a frame.
+    """
+    errors = []
+    for lag in range(0, min(max_lag, len(output) - 2) + 1):
+        diff = output[lag:] - reference[: len(reference) - lag]
+        errors.append(float(np.mean(np.sum(diff * diff, axis=1))))
+    best = int(np.argmin(errors))
+    if 0 < best < len(errors) - 1:
+        left, mid, right = errors[best - 1], errors[best], errors[best + 1]
+        curvature = left - 2.0 * mid + right
+        if curvature > 0:
+            return best + 0.5 * (left - right) / curvature
+    return float(best)
+
+
+def sweep(track, times, cam_size, screen_size, cutoffs, beta):
+    mapper = CoordinateMapper(cam_size, screen_size, Config.FRAME_MARGIN)
+    reference = map_track(track, mapper)
+    dt = float(np.median(np.diff(times))) if len(times) > 1 else 1.0 / 30.0
+    rows = []
+    for quantize in (True, False):
+        mapped = map_track(track, mapper, quantize=quantize)
+        for cutoff in cutoffs:
+            output = filter_track(mapped, times, cutoff, beta)
+            rows.append(
+                {
+                    "path": "int" if quantize else "float",
+                    "min_cutoff": cutoff,
+                    "jitter_px": round(jitter(output), 3),
+                    "lag_ms": round(lag_frames(output, reference) * dt * 1000.0, 1),
+                }
+            )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("clip", nargs="?", help="Recorded camera clip")
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--screen", default="2560x1440")
+    parser.add_argument("--cutoffs", default="0.3,0.6,1.0,1.5,2.5")
+    parser.add_argument("--beta", type=float, default=Config.SMOOTHING_BETA)
+    args = parser.parse_args()
+
+    cam_size = (Config.CAM_WIDTH, Config.CAM_HEIGHT)
+    if args.synthetic or not args.clip:
+        track, times = synthetic_track(args.frames, cam_size=cam_size)
+    else:
+        track, times = clip_track(args.clip, args.frames)
+    screen_size = tuple(int(v) for v in args.screen.split("x"))
+    cutoffs = [float(c) for c in args.cutoffs.split(",") if c.strip()]
+    for row in sweep(track, times, cam_size, screen_size, cutoffs, args.beta):
+        print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
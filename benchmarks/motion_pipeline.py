@@ -0,0 +1,142 @@
+"""Per-stage cost and output of the cursor motion pipeline in offline replay.
+
+    python -m benchmarks.motion_pipeline --order accel,one_euro,smoother,predict,clamp
+
+Builds the same stages ``main.py`` uses from ``Config`` (minus the driver),
+replays synthetic reaches sampled at the camera rate, and reports the mean
+and p99 cost of each stage together with lag and hold jitter of the final
+output. ``--order`` drops or reorders stages to compare arrangements.
+"""
+
+import argparse
+import json
+import math
+
+import numpy as np
+
+from benchmarks.landmark_precision import lag_frames
+from benchmarks.prediction import reach_path
+from src.accel import MotionAccelerator
+from src.config import Config
+from src.curves import curve_from_config
+from src.motion_pipeline import (
+    AccelStage,
+    ClampStage,
+    MotionPipeline,
+    MotionSample,
+    OneEuroStage,
+    PredictStage,
+    SmootherStage,
+)
+from src.one_euro import OneEuroFilter
+from src.predictor import LatencyPredictor
+from src.smoother import MotionSmoother
+
+
+class ReplayClock:
+    """Wall clock for ``PredictStage``: capture time plus a fixed pipeline latency."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.capture = 0.0
+
+    def __call__(self):
+        return self.capture + self.latency
+
+
+def build_stages(screen, clock):
+    return {
+        "accel": AccelStage(
+            MotionAccelerator(
+                min_speed=Config.ACCEL_MIN_SPEED,
+                max_speed=Config.ACCEL_MAX_SPEED,
+                max_gain=Config.ACCEL_MAX_GAIN,
+                exp=Config.ACCEL_EXP,
+                curve=curve_from_config(Config.ACCEL_CURVE, Config.CURVE_INTERPOLATION),
+            )
+        ),
+        "one_euro": OneEuroStage(
+            OneEuroFilter(min_cutoff=Config.SMOOTHING_MIN_CUTOFF, beta=Config.SMOOTHING_BETA),
+            OneEuroFilter(min_cutoff=Config.SMOOTHING_MIN_CUTOFF, beta=Config.SMOOTHING_BETA),
+        ),
+        "smoother": SmootherStage(
+            MotionSmoother(
+                max_speed=Config.MOTION_MAX_SPEED,
+                damping=Config.MOTION_DAMPING,
+                ref_fps=Config.FILTER_FPS_REFERENCE,
+            )
+        ),
+        "predict": PredictStage(
+            LatencyPredictor(
+                alpha=Config.PREDICT_ALPHA,
+                beta=Config.PREDICT_BETA,
+                gain=Config.PREDICT_GAIN if Config.PREDICT_ENABLED else 0.0,
+                max_horizon=Config.PREDICT_MAX_HORIZON,
+                extra_latency=Config.PREDICT_EXTRA_LATENCY,
+                min_speed=Config.PREDICT_MIN_SPEED,
+                damping=Config.PREDICT_DAMPING,
+            ),
+            clock=clock,
+        ),
+        "clamp": ClampStage(0, 0, screen[0], screen[1]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--order", default="accel,one_euro,smoother,predict,clamp")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--latency", type=float, default=0.04, help="Capture-to-output seconds")
+    parser.add_argument("--reaches", type=int, default=40)
+    args = parser.parse_args()
+
+    screen = (2560, 1440)
+    path, moves = reach_path(args.reaches, rate=args.fps, screen=screen)
+    rng = np.random.default_rng(1)
+    clock = ReplayClock(args.latency)
+    stages = build_stages(screen, clock)
+    costs = {}
+
+    def observe(name, sample, t):
+        costs.setdefault(name, []).append(pipeline.timings[name][2])
+
+    order = [name.strip() for name in args.order.split(",") if name.strip()]
+    pipeline = MotionPipeline([stages[name] for name in order], observer=observe)
+    outputs = []
+    for index, (x, y) in enumerate(path + rng.normal(0.0, 1.5, path.shape)):
+        t = index / args.fps
+        clock.capture = t
+        sample = pipeline.process(MotionSample(x, y), t)
+        outputs.append((sample.x, sample.y))
+    outputs = np.asarray(outputs)
+
+    for name in order:
+        values = np.asarray(costs.get(name, [0.0])) * 1e6
+        print(
+            json.dumps(
+                {
+                    "stage": name,
+                    "mean_us": round(float(np.mean(values)), 2),
+                    "p99_us": round(float(np.percentile(values, 99)), 2),
+                }
+            )
+        )
+    still = [
+        np.diff(outputs[int((t_end + 0.3) * args.fps) : int((t_end + 0.6) * args.fps)], axis=0)
+        for _, _, t_end in moves
+    ]
+    still = np.concatenate([s for s in still if len(s)])
+    print(
+        json.dumps(
+            {
+                "order": order,
+                "lag_ms": round(lag_frames(outputs, path, int(args.fps * 0.5)) / args.fps * 1000, 1),
+                "hold_jitter_px": round(float(math.sqrt(np.mean(np.sum(still * still, axis=1)))), 3),
+                "total_us": round(sum(pipeline.average_ms().values()) * 1000.0, 2),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
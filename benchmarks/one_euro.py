@@ -0,0 +1,63 @@
+"""Samples per second of scalar vs vectorized One Euro filtering.
+
+    python -m benchmarks.one_euro --channels 2,63,1434
+
+``63`` is a hand (21 points x 3 axes) and ``1434`` a face mesh (478 x 3).
+The scalar path runs one ``OneEuroFilter`` per channel, as ``main.py`` did
+for the cursor; the vectorized path runs one ``OneEuroBank``.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from src.one_euro import OneEuroBank, OneEuroFilter
+
+
+def make_signal(frames, channels, seed=0):
+    rng = np.random.default_rng(seed)
+    base = np.cumsum(rng.normal(0.0, 1.0, size=(frames, channels)), axis=0)
+    return base + rng.normal(0.0, 0.3, size=(frames, channels))
+
+
+def run_scalar(signal, times, min_cutoff, beta):
+    filters = [OneEuroFilter(min_cutoff=min_cutoff, beta=beta) for _ in range(signal.shape[1])]
+    start = time.perf_counter()
+    for row, t in zip(signal.tolist(), times):
+        for f, value in zip(filters, row):
+            f.filter(value, t)
+    return time.perf_counter() - start
+
+
+def run_bank(signal, times, min_cutoff, beta):
+    bank = OneEuroBank(signal.shape[1], min_cutoff=min_cutoff, beta=beta)
+    start = time.perf_counter()
+    for row, t in zip(signal, times):
+        bank.filter(row, t)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--channels", default="2,63,1434")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--min-cutoff", type=float, default=1.0)
+    parser.add_argument("--beta", type=float, default=0.01)
+    args = parser.parse_args()
+
+    times = (np.arange(args.frames) / 30.0).tolist()
+    for channels in (int(c) for c in args.channels.split(",") if c.strip()):
+        signal = make_signal(args.frames, channels)
+        samples = args.frames * channels
+        row = {"channels": channels}
+        for label, runner in (("scalar", run_scalar), ("bank", run_bank)):
+            elapsed = runner(signal, times, args.min_cutoff, args.beta)
+            row[f"{label}_samples_per_s"] = round(samples / max(elapsed, 1e-9))
+        row["speedup"] = round(row["bank_samples_per_s"] / max(row["scalar_samples_per_s"], 1), 1)
+        print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Effective lag and overshoot of the cursor with and without latency prediction.
+
+    python -m benchmarks.prediction --gains 0,0.5,0.7,1.0
+
+Synthetic point-to-point reaches (minimum-jerk, like a hand moving between
+targets) are sampled at the camera rate, delayed by exposure and inference
+latency, and replayed through ``OneEuroFilter``, ``MotionSmoother``, the
+``LatencyPredictor`` and a ``MouseDriver``-style exponential approach at the
+driver rate. For each predictor gain (``0`` is no prediction) the report gives the lag of the
+cursor behind the true path, the overshoot past each reach's end point, and
+jitter while holding still.
+"""
+
+import argparse
+import json
+import math
+
+import numpy as np
+
+from benchmarks.landmark_precision import lag_frames
+from src.config import Config
+from src.one_euro import OneEuroFilter
+from src.predictor import LatencyPredictor
+from src.smoother import MotionSmoother
+
+
+def reach_path(reaches=20, rate=120.0, screen=(2560, 1440), hold=0.6, seed=0):
+    """True cursor path at ``rate`` Hz plus the (start, end, t_end) of each reach."""
+    rng = np.random.default_rng(seed)
+    w, h = screen
+    point = np.array([w * 0.5, h * 0.5])
+    samples = [point]
+    moves = []
+    t = 0.0
+    for _ in range(reaches):
+        angle = rng.uniform(0.0, 2.0 * math.pi)
+        distance = rng.uniform(150.0, 800.0)
+        target = point + distance * np.array([math.cos(angle), math.sin(angle)])
+        target = np.clip(target, (0.05 * w, 0.05 * h), (0.95 * w, 0.95 * h))
+        duration = rng.uniform(0.4, 0.8)
+        steps = max(int(duration * rate), 2)
+        s = np.arange(1, steps + 1) / steps
+        blend = 10 * s**3 - 15 * s**4 + 6 * s**5
+        samples.extend(point + (target - point) * b for b in blend)
+        t += steps / rate
+        moves.append((point, target, t))
+        held = int(hold * rate)
+        samples.extend([target] * held)
+        t += held / rate
+        point = target
+    return np.asarray(samples), moves
+
+
+def simulate(path, rate, args, gain):
+    """Cursor positions at the driver rate for one predictor setting."""
+    rng = np.random.default_rng(1)
+    fx = OneEuroFilter(min_cutoff=Config.SMOOTHING_MIN_CUTOFF, beta=Config.SMOOTHING_BETA)
+    fy = OneEuroFilter(min_cutoff=Config.SMOOTHING_MIN_CUTOFF, beta=Config.SMOOTHING_BETA)
+    smoother = MotionSmoother(max_speed=Config.MOTION_MAX_SPEED, damping=Config.MOTION_DAMPING)
+    predictor = LatencyPredictor(
+        alpha=Config.PREDICT_ALPHA,
+        beta=Config.PREDICT_BETA,
+        gain=gain,
+        max_horizon=args.horizon,
+        extra_latency=Config.PREDICT_EXTRA_LATENCY,
+        min_speed=Config.PREDICT_MIN_SPEED,
+        damping=args.damping,
+    )
+    dt = 1.0 / rate
+    frame_dt = 1.0 / args.fps
+    # Each camera frame: (capture time, time the target reaches the driver, target).
+    pending = []
+    t = 0.0
+    while t < len(path) * dt:
+        seen = max(t - args.exposure, 0.0)
+        x, y = path[min(int(seen * rate), len(path) - 1)] + rng.normal(0.0, args.noise, 2)
+        ready = t + args.inference + rng.uniform(0.0, args.inference * 0.3)
+        x, y = fx.filter(x, t), fy.filter(y, t)
+        x, y = smoother.apply(x, y, t)
+        pending.append((ready, t, x, y))
+        t += frame_dt
+
+    output = np.empty_like(path)
+    curr = path[0].copy()
+    target = None
+    queue = iter(pending)
+    upcoming = next(queue, None)
+    for index in range(len(path)):
+        now = index * dt
+        while upcoming is not None and upcoming[0] <= now:
+            ready, captured, x, y = upcoming
+            target = np.array(predictor.apply(x, y, captured, ready))
+            upcoming = next(queue, None)
+        if target is not None:
+            curr = curr + (target - curr) * min(Config.MOUSE_SPEED_COEFF * dt, 1.0)
+        output[index] = curr
+    return output
+
+
+def overshoot(output, moves, rate, hold):
+    """Furthest excursion past each reach's end point along the reach direction."""
+    values = []
+    for start, end, t_end in moves:
+        direction = end - start
+        length = float(np.hypot(*direction))
+        if length < 1.0:
+            continue
+        direction = direction / length
+        lo = int(t_end * rate)
+        segment = output[lo : lo + int(hold * rate)]
+        if len(segment):
+            values.append(max(0.0, float(np.max((segment - end) @ direction))))
+    return values
+
+
+def hold_jitter(output, moves, rate, hold):
+    """RMS frame-to-frame motion over the second half of each hold."""
+    steps = []
+    for _, _, t_end in moves:
+        lo = int((t_end + hold * 0.5) * rate)
+        segment = output[lo : int((t_end + hold) * rate)]
+        if len(segment) > 1:
+            steps.append(np.diff(segment, axis=0))
+    if not steps:
+        return 0.0
+    steps = np.concatenate(steps)
+    return float(math.sqrt(np.mean(np.sum(steps * steps, axis=1))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gains", default="0,0.5,0.7,1.0")
+    parser.add_argument("--horizon", type=float, default=Config.PREDICT_MAX_HORIZON)
+    parser.add_argument("--damping", type=float, default=Config.PREDICT_DAMPING)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--exposure", type=float, default=0.02)
+    parser.add_argument("--inference", type=float, default=0.035)
+    parser.add_argument("--noise", type=float, default=1.5, help="Target noise in screen px")
+    parser.add_argument("--reaches", type=int, default=20)
+    args = parser.parse_args()
+
+    rate = float(Config.MOUSE_REFRESH_RATE)
+    hold = 0.6
+    path, moves = reach_path(args.reaches, rate=rate, hold=hold)
+    for gain in (float(g) for g in args.gains.split(",") if g.strip()):
+        output = simulate(path, rate, args, gain)
+        over = overshoot(output, moves, rate, hold)
+        print(
+            json.dumps(
+                {
+                    "gain": gain,
+                    "lag_ms": round(lag_frames(output, path, int(rate * 0.5)) / rate * 1000, 1),
+                    "overshoot_mean_px": round(float(np.mean(over)), 1) if over else 0.0,
+                    "overshoot_p90_px": round(float(np.percentile(over, 90)), 1) if over else 0.0,
+                    "hold_jitter_px": round(hold_jitter(output, moves, rate, hold), 3),
+                }
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Tail latency of the detection loop under different CPU thread budgets.
+
+    python -m benchmarks.thread_budget clip.mp4 --budgets auto,cv=-1:blas=0,cv=1:pin=1
+
+Each budget runs in a fresh interpreter so BLAS limits apply before numpy
+loads. A budget is ``auto`` (the startup planner) or ``key=value`` pairs
+joined by ``:`` with keys ``cv``, ``blas``, ``cores`` and ``pin``;
+``cv=-1`` and ``blas=0`` keep the library defaults. A 120 Hz background
+thread stands in for the mouse driver.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+def parse_budget(text):
+    spec = {"label": text}
+    if text == "auto":
+        return spec
+    for part in text.split(":"):
+        key, value = part.split("=")
+        spec[key.strip()] = int(value)
+    return spec
+
+
+def run_worker(args, spec):
+    from src.config import Config
+    from src.thread_budget import (
+        ThreadBudget,
+        apply_thread_budget,
+        limit_blas_threads,
+        plan_thread_budget,
+        pin_current_thread,
+    )
+
+    cores = spec.get("cores", os.cpu_count() or 1)
+    planned = plan_thread_budget(cores, args.mode, pinning=bool(spec.get("pin", 0)))
+    limit_blas_threads(spec.get("blas", planned.blas_threads))
+    budget = ThreadBudget(
+        cores=planned.cores,
+        opencv_threads=spec.get("cv", planned.opencv_threads),
+        blas_threads=spec.get("blas", planned.blas_threads),
+        inference_cores=planned.inference_cores,
+        service_cores=planned.service_cores,
+        pinning=planned.pinning,
+    )
+
+    import threading
+    import time
+
+    import cv2
+    import numpy as np
+
+    from benchmarks.common import latency_percentiles, load_clip
+    from src.face_blink import FaceBlinkDetector
+    from src.frame_schedule import detectors_needed
+    from src.hand_detector import HandDetector
+
+    apply_thread_budget(budget)
+    frames, fps = load_clip(args.clip, max_frames=args.frames)
+    hand_needed, face_needed = detectors_needed(args.mode, True, True)
+    hand = HandDetector(input_size=Config.HAND_INPUT_SIZE) if hand_needed else None
+    face = (
+        FaceBlinkDetector(frame_skip=0, input_size=Config.BLINK_INPUT_SIZE)
+        if face_needed
+        else None
+    )
+
+    running = True
+    service_late = []
+
+    def service_loop():
+        pin_current_thread("service")
+        dt = 1.0 / 120.0
+        next_tick = time.perf_counter()
+        while running:
+            next_tick += dt
+            np.hypot(np.arange(64.0), np.arange(64.0)).sum()
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                service_late.append(-delay)
+
+    service = threading.Thread(target=service_loop, daemon=True)
+    service.start()
+    latencies = []
+    for index, frame in enumerate(frames):
+        start = time.perf_counter()
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if face is not None:
+            face.process(frame, index / fps, rgb=rgb)
+        if hand is not None:
+            hand.find_hands(frame, draw=False, rgb=rgb)
+        latencies.append(time.perf_counter() - start)
+    running = False
+    service.join(timeout=1.0)
+
+    row = {
+        "budget": spec["label"],
+        "opencv": budget.opencv_threads,
+        "blas": budget.blas_threads,
+        "cores": budget.cores,
+        "pinning": budget.pinning,
+    }
+    row.update(latency_percentiles(latencies, (50, 90, 99, 99.9)))
+    row["service_late_ms"] = latency_percentiles(service_late, (99,))["p99_ms"]
+    print(json.dumps(row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("clip", help="Recorded camera clip (any format OpenCV reads)")
+    parser.add_argument("--budgets", default="auto,cv=-1:blas=0,cv=4:blas=4,cv=1:pin=1")
+    parser.add_argument("--mode", default="EYE_HAND")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        run_worker(args, parse_budget(args.worker))
+        return
+
+    for budget in args.budgets.split(","):
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks.thread_budget",
+            args.clip,
+            "--mode",
+            args.mode,
+            "--frames",
+            str(args.frames),
+            "--worker",
+            budget,
+        ]
+        result = subprocess.run(command, capture_output=True, text=True)
+        lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+        if result.returncode != 0 or not lines:
+            print(f"{budget}: FAILED\n{result.stderr.strip()}")
+            continue
+        print(lines[-1])
+
+
+if __name__ == "__main__":
+    main()
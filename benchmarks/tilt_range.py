@@ -0,0 +1,88 @@
+"""Tilt range tracking: expand-and-decay against sliding-window extrema.
+
+    python -m benchmarks.tilt_range --window 4 --trim 0.02
+
+Synthetic wrist tilt sweeps back and forth with sensor noise and a few
+single-frame spikes (a misdetected hand). Each ``TiltMapper`` variant
+replays it and reports per-sample cost, how far the tracked span strays
+from the true sweep span, the seconds it takes to recover after a spike,
+and how often the sweep peaks still reach the screen edges.
+"""
+
+import argparse
+import json
+import math
+import time
+
+import numpy as np
+
+from src.config import Config
+from src.tilt_mapper import TiltMapper
+
+
+def tilt_signal(seconds=60.0, fps=30.0, amplitude=0.5, period=3.0, noise=0.01, spikes=(12.0, 30.0, 45.0), seed=0):
+    """(times, clean sweep, observed tilt) with spikes of 5x the amplitude."""
+    rng = np.random.default_rng(seed)
+    times = np.arange(int(seconds * fps)) / fps
+    clean = amplitude * np.sin(2.0 * math.pi * times / period)
+    observed = clean + rng.normal(0.0, noise, len(times))
+    for at in spikes:
+        observed[int(at * fps)] += 5.0 * amplitude
+    return times, clean, observed
+
+
+def replay(mapper, times, observed):
+    out = np.empty(len(times))
+    spans = np.empty(len(times))
+    start = time.perf_counter()
+    for i, (t, value) in enumerate(zip(times.tolist(), observed.tolist())):
+        out[i], _ = mapper.update(value, value, t)
+        spans[i] = mapper.max_x - mapper.min_x
+    return out, spans, time.perf_counter() - start
+
+
+def recovery_seconds(spans, times, spikes, true_span, tolerance=0.2):
+    waits = []
+    for at in spikes:
+        after = np.flatnonzero((times > at) & (np.abs(spans - true_span) <= tolerance * true_span))
+        waits.append(float(times[after[0]] - at) if len(after) else float(times[-1] - at))
+    return waits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--window", type=float, default=4.0)
+    parser.add_argument("--trim", type=float, default=0.02)
+    args = parser.parse_args()
+
+    spikes = (12.0, 30.0, 45.0)
+    times, clean, observed = tilt_signal(args.seconds, args.fps, spikes=spikes)
+    true_span = float(clean.max() - clean.min())
+    settled = times >= 5.0
+    peaks = settled & (np.abs(clean) >= 0.98 * np.abs(clean).max())
+    variants = {
+        "decay": dict(decay=Config.TILT_DECAY),
+        "window": dict(window=args.window),
+        "window_trim": dict(window=args.window, trim=args.trim),
+    }
+    for name, options in variants.items():
+        mapper = TiltMapper(min_range=Config.TILT_MIN_RANGE, ref_fps=args.fps, **options)
+        out, spans, elapsed = replay(mapper, times, observed)
+        edges = np.abs(out[peaks] - 0.5) >= 0.45
+        print(
+            json.dumps(
+                {
+                    "method": name,
+                    "us_per_sample": round(elapsed / len(times) * 1e6, 2),
+                    "span_error": round(float(np.median(np.abs(spans[settled] - true_span)) / true_span), 3),
+                    "recovery_s": [round(w, 2) for w in recovery_seconds(spans, times, spikes, true_span)],
+                    "edge_reach": round(float(np.mean(edges)), 3),
+                }
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,70 @@
+import argparse
 import time
 
 import cv2
+import numpy as np
 
 from src.camera import ThreadedCamera
 from src.config import Config
 from src.face_blink import FaceBlinkDetector
 
 
+def draw_ratio(frame, ratio):
+    text = f"Brow ratio: {ratio:.3f}" if ratio is not None else "No face"
+    cv2.putText(
+        frame,
+        text,
+        (20, 40),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        0.7,
+        (0, 255, 255),
+        2,
+        cv2.LINE_AA,
+    )
+
+
+def run_attached():
+    """Read brow ratios from a running landmark service; no camera or model."""
+    from src.landmark_service import LandmarkClient
+
+    try:
+        client = LandmarkClient()
+    except (FileNotFoundError, RuntimeError):
+        print(
+            "No landmark service running. Set LANDMARK_SHARE = True and start main.py,"
+            " or run python -m src.landmark_service."
+        )
+        return
+    print("Attached to landmark service. Press ESC to quit.")
+    last_index = -1
+    h, w = Config.CAM_HEIGHT, Config.CAM_WIDTH
+    while True:
+        landmarks = client.wait(last_index, timeout=0.1)
+        if landmarks is not None:
+            last_index = landmarks.index
+            canvas = np.zeros((h, w, 3), dtype=np.uint8)
+            if landmarks.face is not None:
+                for x, y, _ in landmarks.face:
+                    cv2.circle(canvas, (int(x * w), int(y * h)), 1, (90, 90, 90), -1)
+            draw_ratio(canvas, landmarks.brow_ratio)
+            cv2.imshow("Brow Debug", canvas)
+        if cv2.waitKey(1) & 0xFF == 27:
+            break
+    client.close()
+    cv2.destroyAllWindows()
+
+
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--attach",
+        action="store_true",
+        help="Read landmarks from a running session (LANDMARK_SHARE) instead of the camera",
+    )
+    if parser.parse_args().attach:
+        run_attached()
+        return
+
     cam = ThreadedCamera(Config.CAM_ID, Config.CAM_WIDTH, Config.CAM_HEIGHT)
     cam.start()
 
@@ -38,17 +95,7 @@ def main():
         ratio = None
         if face.last_landmarks:
             ratio = face.brow_ratio(face.last_landmarks)
-        text = f"Brow ratio: {ratio:.3f}" if ratio is not None else "No face"
-        cv2.putText(
-            frame,
-            text,
-            (20, 40),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.7,
-            (0, 255, 255),
-            2,
-            cv2.LINE_AA,
-        )
+        draw_ratio(frame, ratio)
         cv2.imshow("Brow Debug", frame)
         if cv2.waitKey(1) & 0xFF == 27:
             break
@@ -59,4 +106,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
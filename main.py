@@ -1,7 +1,17 @@
+from src.config import Config
+from src.thread_budget import limit_blas_threads
+
+# BLAS pools are sized when numpy loads, so cap them before the first import.
+if Config.THREAD_BUDGET_ENABLED:
+    limit_blas_threads()
+
+import atexit
 import time
 import cv2
 import ctypes
+import numpy as np
 import os
+import threading
 
 # Enable DPI awareness as early as possible
 try:
@@ -12,25 +22,50 @@ except Exception:
     except Exception:
         pass
 
-from src.config import Config
 from src.camera import ThreadedCamera
 from src.controller import MouseController
+from src.curves import curve_from_config
 from src.accel import MotionAccelerator
 from src.event_log import EventLog
 from src.eye_tracker import EyeTracker
 from src.face_blink import FaceBlinkDetector
-from src.head_motion import HeadMotion
+from src.head_motion import HeadMotion, MedianNeutral, landmark_offset, matrix_offset
 from src.hand_detector import HandDetector
+from src.holistic_detector import HolisticDetector
+from src.landmark_service import LandmarkPublisher
 from src.hybrid_motion import HybridMotion
 from src.mapper import CoordinateMapper
+from src.model_store import get_model_store
 from src.mouse_driver import MouseDriver
+from src.noise_adaptive import AdaptiveCutoff
 from src.one_euro import OneEuroFilter
-from src.frame_schedule import schedule_detectors
+from src.detector_registry import DetectorRegistry, FirstMoveTimer
+from src.fixation import FixationFilter
+from src.frame_cache import FrameResultCache
+from src.frame_schedule import DetectorScheduler, detectors_needed, speed_demand
+from src.motion_gate import MotionGate, make_thumbnail, roi_from_landmarks, union_roi
+from src.motion_pipeline import (
+    AccelStage,
+    AdaptiveCutoffStage,
+    ClampStage,
+    DriverStage,
+    MotionPipeline,
+    MotionSample,
+    OneEuroStage,
+    PredictStage,
+    RecordStage,
+    SmootherStage,
+)
+from src.predictor import LatencyPredictor
+from src.presence import PresenceMonitor
 from src.camera_watchdog import is_camera_stalled
+from src.machine_tuning import load_machine_tuning
 from src.presets import apply_preset, next_preset_name
 from src.relative_motion import RelativeMotion
 from src.snap_controller import SnapController
 from src.smoother import MotionSmoother
+from src.telemetry import Telemetry
+from src.thread_budget import apply_thread_budget, plan_thread_budget
 from src.tilt_mapper import TiltMapper
 from src.ui import HudRenderer
 from src.window_utils import (
@@ -42,8 +77,26 @@ from src.window_utils import (
     set_window_topmost,
 )
 def main():
+    startup_time = time.perf_counter()
     active_preset = apply_preset(Config, getattr(Config, "PRESET_NAME", None))
     print(f"Preset: {active_preset}")
+    tuned = load_machine_tuning(Config)
+    if tuned:
+        print(f"Machine tuning: {tuned}")
+    if Config.THREAD_BUDGET_ENABLED:
+        budget = apply_thread_budget(
+            plan_thread_budget(
+                Config.THREAD_CORES,
+                Config.MOVEMENT_MODE,
+                Config.BLINK_ENABLED,
+                Config.LONG_BLINK_SECONDS > 0 or Config.SNAP_TRIGGER_MODE == "BROWS",
+                pinning=Config.THREAD_PINNING,
+            )
+        )
+        print(
+            f"Thread budget: {budget.cores} cores, opencv={budget.opencv_threads}, "
+            f"inference={list(budget.inference_cores)}, service={list(budget.service_cores)}"
+        )
     # Load settings from Config
     cam_w = Config.CAM_WIDTH
     cam_h = Config.CAM_HEIGHT
@@ -54,27 +107,63 @@ def main():
     # Initialize Threaded Camera
     camera = ThreadedCamera(Config.CAM_ID, cam_w, cam_h, backend=Config.CAM_BACKEND)
     camera.start()
-    detector = HandDetector(
-        min_detection_confidence=0.7,
-        min_tracking_confidence=0.5
-    )
-    face_tracker = None
-    if (
-        Config.BLINK_ENABLED
-        or Config.LONG_BLINK_SECONDS > 0
-        or Config.SNAP_TRIGGER_MODE == "BROWS"
-        or Config.MOVEMENT_MODE == "HEAD"
-    ):
-        frame_skip = Config.BLINK_FRAME_SKIP
-        if Config.MOVEMENT_MODE == "HEAD":
-            frame_skip = Config.HEAD_FRAME_SKIP
-        face_tracker = FaceBlinkDetector(
-            frame_skip=frame_skip,
+    event_log = EventLog(Config.EVENT_LOG_PATH, Config.EVENT_LOG_MAX)
+    telemetry = Telemetry(Config.TELEMETRY_PATH, Config.TELEMETRY_INTERVAL)
+    atexit.register(telemetry.close)
+
+    def make_hand_detector():
+        return HandDetector(
+            min_detection_confidence=0.7,
+            min_tracking_confidence=0.5,
+            input_size=Config.HAND_INPUT_SIZE,
+        )
+
+    def make_face_detector():
+        # Frame skipping lives in the scheduler only; detectors run whenever asked.
+        return FaceBlinkDetector(
+            frame_skip=0,
             input_size=Config.BLINK_INPUT_SIZE,
             blink_threshold=Config.BLINK_THRESHOLD,
             blink_frames=Config.BLINK_FRAMES,
             cooldown=Config.BLINK_COOLDOWN,
+            output_matrix=Config.HEAD_POSE_SOURCE == "matrix",
+        )
+
+    def make_holistic_detector():
+        return HolisticDetector(
+            input_size=Config.HOLISTIC_INPUT_SIZE,
+            face_options={
+                "blink_threshold": Config.BLINK_THRESHOLD,
+                "blink_frames": Config.BLINK_FRAMES,
+                "cooldown": Config.BLINK_COOLDOWN,
+            },
         )
+
+    factories = {"hand": make_hand_detector, "face": make_face_detector}
+    if Config.HOLISTIC_BACKEND:
+        factories["holistic"] = make_holistic_detector
+    registry = DetectorRegistry(factories, event_log=event_log, telemetry=telemetry)
+    blink_needed = Config.BLINK_ENABLED
+    long_blink_needed = Config.LONG_BLINK_SECONDS > 0 or Config.SNAP_TRIGGER_MODE == "BROWS"
+
+    def detector_names(mode):
+        """Registry entries the mode needs; one holistic model replaces hand + face."""
+        hand, face = detectors_needed(mode, blink_needed, long_blink_needed)
+        if hand and face and Config.HOLISTIC_BACKEND:
+            return ["holistic"]
+        return [name for name, needed in (("hand", hand), ("face", face)) if needed]
+
+    # Download every missing model in parallel; each load waits only for its own file.
+    threading.Thread(
+        target=get_model_store().prefetch, args=(list(factories),), daemon=True
+    ).start()
+    # Only the current mode's models block startup; the rest warm up in the background.
+    for name in detector_names(Config.MOVEMENT_MODE):
+        registry.load(name)
+    registry.start()
+    registry.prewarm([name for name in registry.names() if not registry.is_loaded(name)])
+    first_move = FirstMoveTimer(event_log=event_log, telemetry=telemetry)
+    first_move.arm("start", startup_time)
     backend = Config.MOUSE_BACKEND
     if backend == "auto":
         if screen_x != 0 or screen_y != 0 or bounds[0] < 0 or bounds[1] < 0:
@@ -101,12 +190,53 @@ def main():
         precision_damping=Config.HEAD_PRECISION_DAMPING,
         micro_radius=Config.HEAD_MICRO_RADIUS,
         micro_damping=Config.HEAD_MICRO_DAMPING,
+        ref_fps=Config.FILTER_FPS_REFERENCE,
+    )
+    predictor = LatencyPredictor(
+        alpha=Config.PREDICT_ALPHA,
+        beta=Config.PREDICT_BETA,
+        gain=Config.PREDICT_GAIN if Config.PREDICT_ENABLED else 0.0,
+        max_horizon=Config.PREDICT_MAX_HORIZON,
+        extra_latency=Config.PREDICT_EXTRA_LATENCY,
+        min_speed=Config.PREDICT_MIN_SPEED,
+        damping=Config.PREDICT_DAMPING,
     )
     accelerator = MotionAccelerator(
         min_speed=Config.ACCEL_MIN_SPEED,
         max_speed=Config.ACCEL_MAX_SPEED,
         max_gain=Config.ACCEL_MAX_GAIN,
         exp=Config.ACCEL_EXP,
+        curve=curve_from_config(Config.ACCEL_CURVE, Config.CURVE_INTERPOLATION),
+    )
+    # Everything after the mode-specific target; stages share the objects above.
+    motion_pipeline = MotionPipeline(
+        ([RecordStage(Config.MOTION_RECORD_PATH)] if Config.MOTION_RECORD_PATH else [])
+        + (
+            [
+                AdaptiveCutoffStage(
+                    AdaptiveCutoff(
+                        target_jitter=Config.ADAPTIVE_TARGET_JITTER,
+                        min_cutoff=Config.ADAPTIVE_MIN_CUTOFF,
+                        max_cutoff=Config.ADAPTIVE_MAX_CUTOFF,
+                        noise_seconds=Config.ADAPTIVE_NOISE_SECONDS,
+                        initial_cutoff=Config.SMOOTHING_MIN_CUTOFF,
+                        telemetry=telemetry,
+                    ),
+                    (smoother_x, smoother_y),
+                )
+            ]
+            if Config.SMOOTHING_ADAPTIVE
+            else []
+        )
+        + [
+            AccelStage(accelerator),
+            OneEuroStage(smoother_x, smoother_y),
+            SmootherStage(motion_smoother),
+            PredictStage(predictor),
+            ClampStage(screen_x, screen_y, screen_w, screen_h),
+            DriverStage(mouse_driver),
+        ],
+        telemetry=telemetry,
     )
     head_motion = HeadMotion(
         (screen_w, screen_h),
@@ -123,14 +253,43 @@ def main():
         return_brake=Config.HEAD_RETURN_BRAKE,
         return_brake_margin=Config.HEAD_RETURN_BRAKE_MARGIN,
         tilt_boost=Config.HEAD_TILT_BOOST,
+        speed_curve=curve_from_config(Config.HEAD_SPEED_CURVE, Config.CURVE_INTERPOLATION),
+        ref_fps=Config.FILTER_FPS_REFERENCE,
+        neutral_estimator=(
+            MedianNeutral(
+                window=Config.HEAD_NEUTRAL_WINDOW,
+                freeze_offset=Config.HEAD_NEUTRAL_FREEZE_OFFSET,
+                freeze_speed=Config.HEAD_NEUTRAL_FREEZE_SPEED,
+                rebase_seconds=Config.HEAD_NEUTRAL_REBASE,
+            )
+            if Config.HEAD_NEUTRAL_WINDOW > 0
+            else None
+        ),
     )
     eye_tracker = EyeTracker(
         smooth_alpha=Config.EYE_SMOOTH_ALPHA,
         gain=Config.EYE_GAIN,
         neutral_alpha=Config.EYE_NEUTRAL_ALPHA,
         ref_fps=Config.EYE_SMOOTH_FPS_REFERENCE,
+        fixation=(
+            FixationFilter(
+                velocity=Config.EYE_FIXATION_VELOCITY,
+                dispersion=Config.EYE_FIXATION_DISPERSION,
+                duration=Config.EYE_FIXATION_DURATION,
+                saccade_alpha=Config.EYE_SACCADE_ALPHA,
+                ref_fps=Config.EYE_SMOOTH_FPS_REFERENCE,
+            )
+            if Config.EYE_FIXATION_ENABLED
+            else None
+        ),
+    )
+    tilt_mapper = TiltMapper(
+        decay=Config.TILT_DECAY,
+        min_range=Config.TILT_MIN_RANGE,
+        ref_fps=Config.FILTER_FPS_REFERENCE,
+        window=Config.TILT_WINDOW_SECONDS,
+        trim=Config.TILT_WINDOW_TRIM,
     )
-    tilt_mapper = TiltMapper(decay=Config.TILT_DECAY, min_range=Config.TILT_MIN_RANGE)
     hybrid_motion = HybridMotion(
         tilt_mapper,
         (screen_w, screen_h),
@@ -146,7 +305,53 @@ def main():
         sensitivity=Config.REL_SENSITIVITY,
     )
     hud = HudRenderer((cam_w, cam_h))
-    event_log = EventLog(Config.EVENT_LOG_PATH, Config.EVENT_LOG_MAX)
+    scheduler = DetectorScheduler(
+        budget=Config.SCHED_FRAME_BUDGET,
+        idle_intervals={
+            "hand": Config.SCHED_HAND_IDLE_INTERVAL,
+            "face": Config.HEAD_FRAME_SKIP + 1,
+        },
+        secondary_interval=Config.BLINK_FRAME_SKIP + 1,
+        max_stale=Config.SCHED_MAX_STALE,
+        telemetry=telemetry,
+    )
+    # Each detector runs at most once per frame; derived features are memoized on its result.
+    result_cache = FrameResultCache(telemetry=telemetry, on_compute=scheduler.record)
+    motion_gates = {
+        name: MotionGate(
+            threshold=Config.GATE_THRESHOLD,
+            refresh_interval=Config.GATE_REFRESH_SECONDS,
+            telemetry=telemetry,
+            name=f"gate.{name}",
+        )
+        for name in ("hand", "face", "holistic")
+    }
+    presence = PresenceMonitor(
+        sleep_after=Config.PRESENCE_SLEEP_SECONDS,
+        telemetry=telemetry,
+        event_log=event_log,
+    )
+    presence_wake = threading.Event()
+    # Other local tools read landmarks from here instead of opening the camera.
+    landmark_publisher = LandmarkPublisher() if Config.LANDMARK_SHARE else None
+
+    def probe_presence(frame):
+        """A face or a hand in view, whatever the mode tracks.
+
+        The current mode's models are probed first (and loaded if missing),
+        then every other model that is already loaded.
+        """
+        current = detector_names(movement_mode)
+        names = current + [name for name in ("face", "hand", "holistic") if name not in current]
+        probes = []
+        for name in names:
+            if name not in current and not registry.is_loaded(name):
+                continue
+            model = registry.get(name)
+            if model is None:
+                continue
+            probes.extend((model.face, model.hand) if name == "holistic" else (model,))
+        return any(probe.detect_presence(frame, Config.PRESENCE_PROBE_SIZE) for probe in probes)
     
     # GDI overlay for snap target visualization
     from src.snap_overlay import GDIOverlay
@@ -159,6 +364,7 @@ def main():
         center_x = screen_x + screen_w * 0.5
         center_y = screen_y + screen_h * 0.5
         motion_smoother.reset()
+        predictor.reset()
         smoother_x.last_time = None
         smoother_y.last_time = None
         mouse_driver.update_target(center_x, center_y, timestamp=now)
@@ -167,6 +373,9 @@ def main():
         return cv2.waitKey(1) & 0xFF == 27
     prev_time = time.time()
     last_frame_id = None
+    hand_demand = 0.0
+    face_demand = 0.0
+    prev_index_tip = None
     camera_restart_at = 0.0
     prev_brows_raised = False
     def restart_camera(reason, timestamp=None):
@@ -180,10 +389,26 @@ def main():
         camera.release()
         camera = ThreadedCamera(Config.CAM_ID, cam_w, cam_h, backend=Config.CAM_BACKEND)
         camera.start()
+        if presence.sleeping:
+            camera.set_frame_interval(Config.PRESENCE_PROBE_INTERVAL)
         last_frame_id = None
+        result_cache.clear()
+        for gate in motion_gates.values():
+            gate.reset()
     print("Handsteer Started. Press ESC to exit.")
     center_cursor("start", timestamp=prev_time)
     # Spacebar Toggle Logic
+    def default_head_deadzone():
+        if Config.HEAD_POSE_SOURCE == "matrix":
+            return Config.HEAD_MATRIX_DEADZONE
+        return Config.HEAD_DEADZONE
+
+    def head_pose_offset(face_tracker):
+        # The holistic backend has no transformation matrix; fall back to the bbox.
+        if face_tracker.last_matrix is not None:
+            return matrix_offset(face_tracker.last_matrix, Config.HEAD_MATRIX_SCALE)
+        return landmark_offset(face_tracker.last_landmarks)
+
     tracking_enabled = True
     movement_mode = Config.MOVEMENT_MODE
     active_preset = getattr(Config, "ACTIVE_PRESET", active_preset)
@@ -194,7 +419,7 @@ def main():
     accel_max_speed = Config.ACCEL_MAX_SPEED
     accel_exp = Config.ACCEL_EXP
     head_sensitivity = Config.HEAD_SENSITIVITY
-    head_deadzone = Config.HEAD_DEADZONE
+    head_deadzone = default_head_deadzone()
     head_speed = Config.HEAD_SPEED_MAX
     head_exp = Config.HEAD_EXP
     head_neutral_alpha = Config.HEAD_NEUTRAL_ALPHA
@@ -225,7 +450,7 @@ def main():
     cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
     from pynput import keyboard
     def on_key_press(key):
-        nonlocal tracking_enabled, movement_mode, face_tracker
+        nonlocal tracking_enabled, movement_mode
         nonlocal active_preset
         nonlocal accel_enabled, accel_max_gain, accel_min_speed, accel_max_speed, accel_exp
         nonlocal head_sensitivity, head_deadzone
@@ -238,6 +463,7 @@ def main():
         nonlocal render_enabled
         nonlocal relative_cursor
         nonlocal mini_mode
+        presence_wake.set()
         if key == keyboard.Key.f6:
             active_preset = next_preset_name(active_preset, direction=1)
             apply_preset(Config, active_preset)
@@ -248,15 +474,19 @@ def main():
             accel_min_speed = Config.ACCEL_MIN_SPEED
             accel_max_speed = Config.ACCEL_MAX_SPEED
             accel_exp = Config.ACCEL_EXP
+            accelerator.curve = curve_from_config(Config.ACCEL_CURVE, Config.CURVE_INTERPOLATION)
 
             head_sensitivity = Config.HEAD_SENSITIVITY
-            head_deadzone = Config.HEAD_DEADZONE
+            head_deadzone = default_head_deadzone()
             head_speed = Config.HEAD_SPEED_MAX
             head_exp = Config.HEAD_EXP
             head_neutral_alpha = Config.HEAD_NEUTRAL_ALPHA
             head_micro_gain = Config.HEAD_MICRO_GAIN
             head_stop_threshold = Config.HEAD_STOP_THRESHOLD
             head_stop_hold = Config.HEAD_STOP_HOLD
+            head_motion.speed_curve = curve_from_config(
+                Config.HEAD_SPEED_CURVE, Config.CURVE_INTERPOLATION
+            )
 
             eye_gain = Config.EYE_GAIN
             eye_smooth = Config.EYE_SMOOTH_ALPHA
@@ -274,6 +504,7 @@ def main():
             motion_smoother.micro_radius = Config.HEAD_MICRO_RADIUS
             motion_smoother.micro_damping = Config.HEAD_MICRO_DAMPING
             motion_smoother.reset()
+            predictor.reset()
             smoother_x.last_time = None
             smoother_y.last_time = None
 
@@ -292,6 +523,7 @@ def main():
             if tracking_enabled:
                 print("Resumed.")
                 motion_smoother.reset()
+                predictor.reset()
                 accelerator.reset()
                 head_motion.reset()
                 relative_motion.reset()
@@ -321,6 +553,7 @@ def main():
                 relative_cursor = None
                 mouse_driver.coast_window = Config.COAST_WINDOW
                 center_cursor("mode")
+                first_move.arm(f"mode_{movement_mode.lower()}")
                 return
             if key.char == '1':
                 movement_mode = "ABSOLUTE"
@@ -334,18 +567,13 @@ def main():
                 relative_cursor = None
                 mouse_driver.coast_window = 0.0
                 center_cursor("mode")
+                first_move.arm(f"mode_{movement_mode.lower()}")
                 return
             if key.char == '2':
                 movement_mode = "HEAD"
                 print("Mode HEAD")
-                if face_tracker is None:
-                    face_tracker = FaceBlinkDetector(
-                        frame_skip=Config.HEAD_FRAME_SKIP,
-                        input_size=Config.BLINK_INPUT_SIZE,
-                        blink_threshold=Config.BLINK_THRESHOLD,
-                        blink_frames=Config.BLINK_FRAMES,
-                        cooldown=Config.BLINK_COOLDOWN,
-                    )
+                for name in detector_names(movement_mode):
+                    registry.request(name)
                 head_motion.reset()
                 calibration_active = False
                 calibration_sampling = False
@@ -355,18 +583,13 @@ def main():
                 relative_cursor = None
                 mouse_driver.coast_window = 0.0
                 center_cursor("mode")
+                first_move.arm(f"mode_{movement_mode.lower()}")
                 return
             if key.char == '3':
                 movement_mode = "EYE_HYBRID"
                 print("Mode EYE_HYBRID")
-                if face_tracker is None:
-                    face_tracker = FaceBlinkDetector(
-                        frame_skip=Config.HEAD_FRAME_SKIP,
-                        input_size=Config.BLINK_INPUT_SIZE,
-                        blink_threshold=Config.BLINK_THRESHOLD,
-                        blink_frames=Config.BLINK_FRAMES,
-                        cooldown=Config.BLINK_COOLDOWN,
-                    )
+                for name in detector_names(movement_mode):
+                    registry.request(name)
                 head_motion.reset()
                 eye_tracker.reset()
                 eye_tracker.start_calibration()
@@ -379,18 +602,13 @@ def main():
                 relative_cursor = None
                 mouse_driver.coast_window = 0.0
                 center_cursor("mode")
+                first_move.arm(f"mode_{movement_mode.lower()}")
                 return
             if key.char == '4':
                 movement_mode = "EYE_HAND"
                 print("Mode EYE_HAND")
-                if face_tracker is None:
-                    face_tracker = FaceBlinkDetector(
-                        frame_skip=Config.HEAD_FRAME_SKIP,
-                        input_size=Config.BLINK_INPUT_SIZE,
-                        blink_threshold=Config.BLINK_THRESHOLD,
-                        blink_frames=Config.BLINK_FRAMES,
-                        cooldown=Config.BLINK_COOLDOWN,
-                    )
+                for name in detector_names(movement_mode):
+                    registry.request(name)
                 eye_tracker.reset()
                 eye_tracker.start_calibration()
                 calibration_active = True
@@ -402,6 +620,7 @@ def main():
                 relative_cursor = None
                 mouse_driver.coast_window = 0.0
                 center_cursor("mode")
+                first_move.arm(f"mode_{movement_mode.lower()}")
                 return
             if key.char == '5':
                 movement_mode = "TILT_HYBRID"
@@ -415,6 +634,7 @@ def main():
                 relative_cursor = None
                 mouse_driver.coast_window = 0.0
                 center_cursor("mode")
+                first_move.arm(f"mode_{movement_mode.lower()}")
                 return
             if key.char in ('a', 'A'):
                 accel_enabled = not accel_enabled
@@ -516,7 +736,10 @@ def main():
     while True:
         success, frame, frame_id, frame_time = camera.read()
         now_wall = time.time()
-        if is_camera_stalled(frame_time, now_wall, Config.CAMERA_STALL_SECONDS):
+        stall_seconds = Config.CAMERA_STALL_SECONDS
+        if presence.sleeping:
+            stall_seconds = max(stall_seconds, 3.0 * Config.PRESENCE_PROBE_INTERVAL)
+        if is_camera_stalled(frame_time, now_wall, stall_seconds):
             restart_camera("stall", timestamp=now_wall)
             if should_exit():
                 break
@@ -531,7 +754,7 @@ def main():
         if frame_id == last_frame_id:
             if should_exit():
                 break
-            time.sleep(0.001)
+            time.sleep(0.02 if presence.sleeping else 0.001)
             continue
         last_frame_id = frame_id
         frame_ts = frame_time if frame_time is not None else now_wall
@@ -558,16 +781,95 @@ def main():
         run_hand = False
         run_face = False
         hand_active = False
+        relative_target = False
 
-        if tracking_enabled:
-            run_hand, run_face = schedule_detectors(
+        detector = None
+        face_tracker = None
+        if presence_wake.is_set() or not tracking_enabled:
+            presence_wake.clear()
+            if presence.wake(now):
+                camera.set_frame_interval(0.0)
+        if tracking_enabled and presence.sleeping:
+            # Low-power state: one tiny probe per throttled frame, no tracking.
+            if presence.update(probe_presence(frame), now):
+                camera.set_frame_interval(0.0)
+        elif tracking_enabled:
+            names = detector_names(movement_mode)
+            holistic = None
+            if "holistic" in names:
+                holistic = registry.get("holistic")
+                if holistic is not None:
+                    detector, face_tracker = holistic.hand, holistic.face
+            if "hand" in names:
+                detector = registry.get("hand")
+            if "face" in names:
+                face_tracker = registry.get("face")
+            if face_tracker is not None and face_tracker.blink_in_progress:
+                face_demand = 1.0
+            run_hand, run_face = scheduler.plan(
                 movement_mode,
                 frame_id,
-                Config.BLINK_ENABLED,
-                Config.LONG_BLINK_SECONDS > 0
-                or Config.SNAP_TRIGGER_MODE == "BROWS",
+                blink_needed,
+                long_blink_needed,
+                demand={"hand": hand_demand, "face": face_demand},
+                holistic="holistic" in names,
             )
-            run_face = run_face and face_tracker is not None
+            if "holistic" in names:
+                # One inference fills both views, so it is skipped as one too.
+                if run_hand and holistic is None:
+                    run_hand = run_face = False
+                    scheduler.skipped("holistic")
+            else:
+                if run_hand and detector is None:
+                    run_hand = False
+                    scheduler.skipped("hand")
+                if run_face and face_tracker is None:
+                    run_face = False
+                    scheduler.skipped("face")
+            gate_thumb = None
+            if Config.GATE_ENABLED and (run_hand or run_face):
+                gate_thumb = make_thumbnail(frame, Config.GATE_THUMB_SIZE)
+                # Static scene and resting cursor: keep the previous landmarks.
+                if holistic is not None:
+                    if (
+                        max(hand_demand, face_demand) <= Config.GATE_MAX_DEMAND
+                        and not face_tracker.blink_in_progress
+                    ):
+                        roi = union_roi(
+                            roi_from_landmarks(face_tracker.eye_region(), margin=0.5),
+                            roi_from_landmarks(detector.normalized_landmarks()),
+                        )
+                        if motion_gates["holistic"].should_skip(
+                            gate_thumb,
+                            roi,
+                            now,
+                            cost=scheduler.estimated_cost("holistic"),
+                        ):
+                            run_hand = run_face = False
+                            scheduler.skipped("holistic", fresh=True)
+                else:
+                    if (
+                        run_face
+                        and face_demand <= Config.GATE_MAX_DEMAND
+                        and not face_tracker.blink_in_progress
+                    ):
+                        run_face = not motion_gates["face"].should_skip(
+                            gate_thumb,
+                            roi_from_landmarks(face_tracker.eye_region(), margin=0.5),
+                            now,
+                            cost=scheduler.estimated_cost("face"),
+                        )
+                        if not run_face:
+                            scheduler.skipped("face", fresh=True)
+                    if run_hand and hand_demand <= Config.GATE_MAX_DEMAND:
+                        run_hand = not motion_gates["hand"].should_skip(
+                            gate_thumb,
+                            roi_from_landmarks(detector.normalized_landmarks()),
+                            now,
+                            cost=scheduler.estimated_cost("hand"),
+                        )
+                        if not run_hand:
+                            scheduler.skipped("hand", fresh=True)
             hand_active = movement_mode in (
                 "ABSOLUTE",
                 "RELATIVE",
@@ -577,17 +879,63 @@ def main():
 
             if run_hand or run_face:
                 frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Holistic: the shared inference is timed once; the views reuse it.
+            shared = holistic is not None and (run_hand or run_face)
+            if shared:
+                result_cache.run("holistic", frame_id, lambda: holistic.detect(frame_rgb))
+                if gate_thumb is not None:
+                    motion_gates["holistic"].mark_ran(gate_thumb, now)
             if run_face:
-                blink_type, long_blink = face_tracker.process(
-                    frame,
-                    frame_ts,
-                    rgb=frame_rgb,
+                face_result = result_cache.run(
+                    "face",
+                    frame_id,
+                    lambda: face_tracker.process(frame, frame_ts, rgb=frame_rgb),
+                    record=not shared,
                 )
+                blink_type, long_blink = face_result.value
                 blink_processed = True
+                if gate_thumb is not None and not shared:
+                    motion_gates["face"].mark_ran(gate_thumb, now)
+            if run_hand:
+                result_cache.run(
+                    "hand",
+                    frame_id,
+                    lambda: detector.find_hands(frame, draw=render_enabled, rgb=frame_rgb),
+                    record=not shared,
+                )
+                if gate_thumb is not None and not shared:
+                    motion_gates["hand"].mark_ran(gate_thumb, now)
+            hand_result = result_cache.latest("hand")
+            if hand_active and detector is not None and hand_result is not None:
+                # Reused across skipped frames without re-running find_position.
+                landmarks = hand_result.feature(
+                    "positions", lambda: detector.find_position(frame)
+                )
+
+            present = None
+            if run_face:
+                present = face_tracker.last_landmarks is not None
             if run_hand:
-                detector.find_hands(frame, draw=render_enabled, rgb=frame_rgb)
-            if run_hand or (hand_active and detector.results):
-                landmarks = detector.find_position(frame)
+                present = bool(present) or detector.normalized_landmarks() is not None
+            if presence.update(present, now, confirm=lambda: probe_presence(frame)):
+                camera.set_frame_interval(Config.PRESENCE_PROBE_INTERVAL)
+
+            if landmark_publisher is not None and (run_hand or run_face):
+                face_points = face_tracker.last_landmarks if face_tracker is not None else None
+                brow = None
+                face_result = result_cache.get("face", frame_id)
+                if face_result is not None and face_points:
+                    brow = face_result.feature(
+                        "brow_ratio", lambda: face_tracker.brow_ratio(face_points)
+                    )
+                landmark_publisher.publish(
+                    frame_id,
+                    frame_ts,
+                    face=face_points,
+                    hand=detector.normalized_landmarks() if detector is not None else None,
+                    eye_ratio=face_tracker.last_ratio if face_tracker is not None else None,
+                    brow_ratio=brow,
+                )
 
         index_tip = None
         thumb_tip = None
@@ -600,19 +948,34 @@ def main():
             elif idx == 4:
                 thumb_tip = (x, y, z)
 
+        frame_dt = max(now - prev_time, 1e-6)
+        if index_tip and prev_index_tip:
+            hand_speed = np.hypot(
+                index_tip[0] - prev_index_tip[0], index_tip[1] - prev_index_tip[1]
+            ) / frame_dt
+            hand_demand = speed_demand(hand_speed, Config.SCHED_HAND_SPEED_REF)
+        elif not index_tip:
+            hand_demand = 0.0
+        prev_index_tip = index_tip
+        face_demand = 0.0
+
         if tracking_enabled and (
             index_tip
             or movement_mode in ("HEAD", "EYE_HYBRID", "EYE_HAND", "RELATIVE", "TILT_HYBRID")
         ):
             if movement_mode in ("HEAD", "EYE_HYBRID", "EYE_HAND"):
-                if face_tracker is None:
-                    face_tracker = FaceBlinkDetector(
-                        frame_skip=Config.HEAD_FRAME_SKIP,
-                        input_size=Config.BLINK_INPUT_SIZE,
-                        blink_threshold=Config.BLINK_THRESHOLD,
-                        blink_frames=Config.BLINK_FRAMES,
-                        cooldown=Config.BLINK_COOLDOWN,
+                face_landmarks = face_tracker.last_landmarks if face_tracker else None
+                face_result = result_cache.latest("face") if face_landmarks else None
+                head_offset = None
+                raw_gaze = None
+                if face_result is not None:
+                    head_offset = face_result.feature(
+                        "head_offset", lambda: head_pose_offset(face_tracker)
                     )
+                    if movement_mode != "HEAD":
+                        raw_gaze = face_result.feature(
+                            "raw_gaze", lambda: eye_tracker.raw_gaze(face_landmarks)
+                        )
                 head_motion.sensitivity = head_sensitivity
                 head_motion.deadzone = head_deadzone
                 head_motion.max_speed = head_speed
@@ -621,20 +984,26 @@ def main():
                 head_motion.micro_gain = head_micro_gain
                 head_motion.stop_threshold = head_stop_threshold
                 head_motion.stop_hold = head_stop_hold
-                delta = head_motion.compute(face_tracker.last_landmarks, now)
+                delta = head_motion.compute(face_landmarks, now, offset=head_offset)
+                if delta is not None:
+                    face_demand = speed_demand(
+                        np.hypot(delta[0], delta[1]) / frame_dt,
+                        Config.SCHED_HEAD_SPEED_REF,
+                    )
                 if movement_mode == "HEAD":
                     if delta is not None:
                         dx, dy = delta
                         curr_x, curr_y = mouse_driver.get_last_pos()
                         x_target = curr_x + dx
                         y_target = curr_y + dy
+                        relative_target = True
                     else:
                         x_target, y_target = None, None
                 elif movement_mode == "EYE_HYBRID":
                     eye_tracker.gain = eye_gain
                     eye_tracker.smooth_alpha = eye_smooth
                     eye_tracker.neutral_alpha = eye_neutral_alpha
-                    gaze = eye_tracker.compute(face_tracker.last_landmarks, now)
+                    gaze = eye_tracker.compute(face_landmarks, now, raw=raw_gaze)
                     last_gaze = gaze
                     if gaze is not None:
                         mapped = eye_tracker.map_to_screen(gaze)
@@ -654,13 +1023,14 @@ def main():
                         curr_x, curr_y = mouse_driver.get_last_pos()
                         x_target = curr_x + dx
                         y_target = curr_y + dy
+                        relative_target = True
                     else:
                         x_target, y_target = None, None
                 else:
                     eye_tracker.gain = eye_gain
                     eye_tracker.smooth_alpha = eye_smooth
                     eye_tracker.neutral_alpha = eye_neutral_alpha
-                    gaze = eye_tracker.compute(face_tracker.last_landmarks, now)
+                    gaze = eye_tracker.compute(face_landmarks, now, raw=raw_gaze)
                     last_gaze = gaze
                     if gaze is not None:
                         mapped = eye_tracker.map_to_screen(gaze)
@@ -697,7 +1067,7 @@ def main():
                 else:
                     x_target, y_target = None, None
             elif movement_mode == "TILT_HYBRID":
-                tilt_target = hybrid_motion.compute(landmarks, (cam_w, cam_h))
+                tilt_target = hybrid_motion.compute(landmarks, (cam_w, cam_h), timestamp=now)
                 if tilt_target is not None:
                     x_target, y_target = tilt_target
                 else:
@@ -711,42 +1081,48 @@ def main():
             accelerator.max_speed = accel_max_speed
             accelerator.exp = accel_exp
 
-            if movement_mode != "HEAD" and x_target is not None and accel_enabled:
-                x_target, y_target = accelerator.apply(x_target, y_target, now)
-
-            # 1. Jitter reduction (Smooth input first)
             if calibration_active:
                 x_target = None
                 y_target = None
 
             if x_target is not None:
-                x_in = smoother_x.filter(x_target, now)
-                y_in = smoother_y.filter(y_target, now)
-
-                x_smooth, y_smooth = motion_smoother.apply(
-                    x_in, y_in, now, precision=movement_mode == "HEAD"
+                # Accel, jitter filters, latency lead, clamp, then the driver.
+                # ``now`` is the capture time of this frame.
+                sample = motion_pipeline.process(
+                    MotionSample(
+                        x_target,
+                        y_target,
+                        accelerate=movement_mode != "HEAD" and accel_enabled,
+                        precision=movement_mode == "HEAD",
+                        predict=not relative_target,
+                    ),
+                    now,
                 )
-                # Clamp to monitor bounds
-                x_smooth = max(screen_x, min(x_smooth, screen_x + screen_w - 1))
-                y_smooth = max(screen_y, min(y_smooth, screen_y + screen_h - 1))
-                mouse_driver.update_target(x_smooth, y_smooth, timestamp=now)
+                x_smooth, y_smooth = sample.x, sample.y
+                telemetry.gauge("predict.horizon_ms", predictor.last_horizon * 1000.0)
                 screen_coords = (x_smooth, y_smooth)
+                ttfm = first_move.observe()
+                if ttfm is not None:
+                    print(f"Time to first cursor move: {ttfm:.2f}s")
 
             # Blink Detection
             if face_tracker:
                 if run_face and not blink_processed:
-                    blink_type, long_blink = face_tracker.process(
-                        frame,
-                        now,
-                        rgb=frame_rgb,
+                    face_result = result_cache.run(
+                        "face",
+                        frame_id,
+                        lambda: face_tracker.process(frame, now, rgb=frame_rgb),
                     )
+                    blink_type, long_blink = face_result.value
                     blink_processed = True
                 probs["blink"] = face_tracker.last_prob
                 if long_blink:
                     center_cursor("long_blink", timestamp=now)
-                if run_face and face_tracker.last_landmarks:
-                    brows_raised = face_tracker.check_brows_raised(
-                        face_tracker.last_landmarks
+                face_result = result_cache.get("face", frame_id)
+                if face_result is not None and face_tracker.last_landmarks:
+                    brows_raised = face_result.feature(
+                        "brows_raised",
+                        lambda: face_tracker.check_brows_raised(face_tracker.last_landmarks),
                     )
                     if brows_raised != prev_brows_raised:
                         event_log.add("BROWS_ON" if brows_raised else "BROWS_OFF", now)
@@ -813,6 +1189,9 @@ def main():
                 (snap_target[0] - screen_x) / max(screen_w, 1),
                 (snap_target[1] - screen_y) / max(screen_h, 1),
             )
+        telemetry.gauge("driver.rate_hz", round(mouse_driver.scheduler.rate(), 1))
+        telemetry.gauge("driver.missed", mouse_driver.scheduler.missed)
+        telemetry.tick(now_wall)
         # Draw HUD even if disabled, but show PAUSED
         now = frame_ts
         fps = 1.0 / max(now - prev_time, 1e-6)
@@ -826,6 +1205,32 @@ def main():
         tune.append(("Mode", f"{movement_mode}", ["0", "1", "2", "3", "4", "5"]))
         tune.append(("Accel", f"{'on' if accel_enabled else 'off'}", ["A"]))
         tune.append(("Gain", f"{accel_max_gain:.2f}", ["[", "]"]))
+        tune.append(
+            (
+                "Sched",
+                f"H{scheduler.run_rate('hand'):.0%} F{scheduler.run_rate('face'):.0%} "
+                f"HF{scheduler.run_rate('holistic'):.0%} over {scheduler.over_budget_ratio():.0%}",
+                [],
+            )
+        )
+        tune.append(
+            (
+                "Power",
+                f"{presence.state.lower()} cpu {presence.cpu_percent():.0f}%",
+                [],
+            )
+        )
+        if Config.GATE_ENABLED:
+            gate_saved = sum(gate.saved_seconds for gate in motion_gates.values())
+            tune.append(
+                (
+                    "Gate",
+                    f"H{motion_gates['hand'].skip_rate():.0%} "
+                    f"F{motion_gates['face'].skip_rate():.0%} "
+                    f"HF{motion_gates['holistic'].skip_rate():.0%} saved {gate_saved:.1f}s",
+                    [],
+                )
+            )
         if movement_mode == "HEAD":
             tune.append(("HeadSens", f"{head_sensitivity:.2f}", ["-", "="]))
             tune.append(("Deadzone", f"{head_deadzone:.3f}", ["z", "x"]))
@@ -903,10 +1308,15 @@ def main():
             time.sleep(0.001)
 
     listener.stop()
+    registry.stop()
     mouse_driver.stop()
     snap_controller.stop()
     snap_overlay.stop()
     camera.release()
+    if landmark_publisher is not None:
+        landmark_publisher.close()
+    motion_pipeline.close()
+    telemetry.close()
     cv2.destroyAllWindows()
 
 
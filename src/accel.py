@@ -2,11 +2,13 @@ import math
 
 
 class MotionAccelerator:
-    def __init__(self, min_speed=200.0, max_speed=1800.0, max_gain=2.2, exp=1.4):
+    def __init__(self, min_speed=200.0, max_speed=1800.0, max_gain=2.2, exp=1.4, curve=None):
         self.min_speed = float(min_speed)
         self.max_speed = float(max_speed)
         self.max_gain = float(max_gain)
         self.exp = float(exp)
+        # Optional ``Curve`` of speed (px/s) -> gain; replaces the pow curve above.
+        self.curve = curve
         self._last_raw_x = None
         self._last_raw_y = None
         self._last_time = None
@@ -30,7 +32,9 @@ class MotionAccelerator:
         dy = float(y) - self._last_raw_y
         speed = math.hypot(dx, dy) / dt
 
-        if self.max_speed <= self.min_speed:
+        if self.curve is not None:
+            gain = self.curve(speed)
+        elif self.max_speed <= self.min_speed:
             gain = 1.0
         else:
             t = (speed - self.min_speed) / (self.max_speed - self.min_speed)
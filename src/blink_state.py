@@ -15,6 +15,7 @@ class BlinkStateMachine:
         self._last_blink_time = 0.0
         self._last_timestamp = None
         self._long_sent = False
+        self.eyes_closed = False
 
     def reset(self):
         self._closed_time = 0.0
@@ -22,6 +23,7 @@ class BlinkStateMachine:
         self._last_blink_time = 0.0
         self._last_timestamp = None
         self._long_sent = False
+        self.eyes_closed = False
 
     def update(self, left_ratio, right_ratio, timestamp):
         left_closed = left_ratio < self.blink_threshold
@@ -34,6 +36,7 @@ class BlinkStateMachine:
             state = "LEFT"
         elif right_closed:
             state = "RIGHT"
+        self.eyes_closed = state is not None
 
         dt = 0.0
         if self._last_timestamp is not None:
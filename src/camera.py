@@ -2,6 +2,8 @@ import cv2
 import threading
 import time
 
+from src.thread_budget import pin_current_thread
+
 class ThreadedCamera:
     def __init__(self, source=0, width=640, height=480, backend="auto"):
         self.capture, self.backend = self._open_capture(source, width, height, backend)
@@ -11,6 +13,8 @@ class ThreadedCamera:
         self.av_fps = 0
         self.stopped = False
         self.lock = threading.Lock()
+        self.frame_interval = 0.0
+        self._wake = threading.Event()
 
     def _open_capture(self, source, width, height, backend):
         backend = (backend or "auto").lower()
@@ -47,11 +51,23 @@ class ThreadedCamera:
         t.start()
         return self
         
+    def set_frame_interval(self, seconds):
+        """Throttle capture to one frame per ``seconds`` (0 = full rate)."""
+        self.frame_interval = max(float(seconds), 0.0)
+        self._wake.set()
+
     def _update(self):
+        pin_current_thread("service")
         last_time = time.time()
         fps_filter = 0
         
         while not self.stopped:
+            if self.frame_interval > 0:
+                # set_frame_interval interrupts the wait so waking is immediate.
+                self._wake.wait(self.frame_interval)
+                self._wake.clear()
+                # Drop the frame buffered while idle so the next one is fresh.
+                self.capture.grab()
             success, frame = self.capture.read()
             with self.lock:
                 if success:
@@ -84,4 +100,5 @@ class ThreadedCamera:
 
     def release(self):
         self.stopped = True
+        self._wake.set()
         self.capture.release()
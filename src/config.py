@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 @dataclass
 class Config:
-    # Tuning preset: "precision", "balanced", "fast", "turbo", "swift", "snappy", "stable", "legacy"
+    # Tuning preset: "precision", "balanced", "fast", "turbo", "swift", "snappy", "stable", "glide", "legacy"
     PRESET_NAME: str = "swift"
 
     # Camera Settings
@@ -15,6 +15,20 @@ class Config:
     MONITOR_INDEX: int = -1
     MOUSE_BACKEND: str = "auto"  # "auto", "autopy", "pynput"
     MODEL_DOWNLOAD_TIMEOUT: float = 12.0
+    MODEL_DOWNLOAD_RETRIES: int = 3
+    MODEL_CACHE_DIR: str = "models"
+    MODEL_BUNDLE_DIR: str = "" # Read-only directory checked first (offline installs)
+    TUNING_DIR: str = "tuning" # Per-machine overrides written by benchmarks.input_size
+
+    # CPU thread budget (see src/thread_budget.py)
+    THREAD_BUDGET_ENABLED: bool = True
+    THREAD_CORES: int = 0 # 0 = os.cpu_count()
+    THREAD_PINNING: bool = False # Pin inference and service threads to separate cores
+
+    # Landmark sharing (see src/landmark_service.py)
+    LANDMARK_SHARE: bool = False # Publish landmarks to shared memory for debug/tuning tools
+    LANDMARK_SHM_NAME: str = "handsteer_landmarks"
+    LANDMARK_SHM_SLOTS: int = 8
     
     # Mapper Settings
     FRAME_MARGIN: int = 100
@@ -38,8 +52,28 @@ class Config:
     BLINK_COOLDOWN: float = 0.4
     BLINK_FRAME_SKIP: int = 2
     BLINK_INPUT_SIZE: tuple = (320, 180)
+    HAND_INPUT_SIZE: tuple = () # Empty = full camera resolution
+    HOLISTIC_BACKEND: bool = False # One holistic model when a mode needs hand and face
+    HOLISTIC_INPUT_SIZE: tuple = ()
     LONG_BLINK_SECONDS: float = 0.7 # Hold both eyes closed to center cursor
 
+    # Detector Scheduling
+    SCHED_FRAME_BUDGET: float = 0.018 # Seconds of inference allowed per frame
+    SCHED_HAND_IDLE_INTERVAL: int = 2 # Frames between hand runs when the hand is still
+    SCHED_MAX_STALE: int = 6 # Frames after which a needed detector always runs
+    SCHED_HAND_SPEED_REF: float = 240.0 # Camera px/s at which hand demand saturates
+    SCHED_HEAD_SPEED_REF: float = 400.0 # Cursor px/s at which face demand saturates
+    # Motion gate: reuse the last landmarks while the tracked region is static
+    GATE_ENABLED: bool = True
+    GATE_THUMB_SIZE: tuple = (96, 72) # Grayscale thumbnail used for the frame difference
+    GATE_THRESHOLD: float = 1.5 # Mean grey-level change that forces inference
+    GATE_REFRESH_SECONDS: float = 0.5 # Always run at least this often
+    GATE_MAX_DEMAND: float = 0.05 # Only gate while the cursor is (nearly) at rest
+    # Presence sleep: low-rate capture and a tiny probe when nobody is there
+    PRESENCE_SLEEP_SECONDS: float = 30.0 # No face/hand for this long -> sleep (0 disables)
+    PRESENCE_PROBE_INTERVAL: float = 0.5 # Seconds between probe frames while asleep
+    PRESENCE_PROBE_SIZE: tuple = (160, 120)
+
     # Smart Snapping - "Gravity Well" magnetic attraction
     SNAP_ENABLED: bool = True
     SNAP_TRIGGER_MODE: str = "ALWAYS" # "BROWS" or "ALWAYS"
@@ -59,6 +93,8 @@ class Config:
     COAST_WINDOW: float = 0.4 # Seconds to coast after losing tracking
     TILT_DECAY: float = 0.006
     TILT_MIN_RANGE: float = 0.18
+    TILT_WINDOW_SECONDS: float = 0.0 # >0 tracks the tilt range over this many seconds instead of TILT_DECAY
+    TILT_WINDOW_TRIM: float = 0.0 # Fraction of window samples ignored at each end (e.g. 0.02 rejects spikes)
     FINE_SCALE: float = 0.16
     FINE_WEIGHT: float = 0.9
     COARSE_WEIGHT: float = 1.0
@@ -69,15 +105,27 @@ class Config:
     ACCEL_MAX_SPEED: float = 1600.0
     ACCEL_MAX_GAIN: float = 4.0
     ACCEL_EXP: float = 1.4
+    # Optional response curves as (input, output) control points; empty keeps
+    # the pow curves above. See src/curves.py.
+    ACCEL_CURVE: tuple = () # (speed px/s, gain)
+    HEAD_SPEED_CURVE: tuple = () # (axis offset 0..1, speed px/s), before tilt boost
+    CURVE_INTERPOLATION: str = "spline" # "spline" (monotone cubic) or "linear"
 
     # Head Motion
     HEAD_SENSITIVITY: float = 6.0
     HEAD_DEADZONE: float = 0.005
+    HEAD_POSE_SOURCE: str = "bbox" # "bbox" (nose in landmark box) or "matrix" (face transform)
+    HEAD_MATRIX_SCALE: float = 0.5 # Direction vector -> bbox-offset units
+    HEAD_MATRIX_DEADZONE: float = 0.002 # The matrix is steadier, so a smaller deadzone works
     HEAD_FRAME_SKIP: int = 0
     HEAD_SPEED_MIN: float = 0.0
     HEAD_SPEED_MAX: float = 2600.0
     HEAD_EXP: float = 1.6
     HEAD_NEUTRAL_ALPHA: float = 0.05
+    HEAD_NEUTRAL_WINDOW: float = 0.0 # >0: neutral is the median of resting offsets over this many seconds (replaces HEAD_NEUTRAL_ALPHA)
+    HEAD_NEUTRAL_FREEZE_OFFSET: float = 0.01 # Raw offset from neutral that counts as steering
+    HEAD_NEUTRAL_FREEZE_SPEED: float = 0.15 # Raw offset units/s that count as a head turn
+    HEAD_NEUTRAL_REBASE: float = 3.0 # Seconds a still deflection is held before it becomes the new neutral
     HEAD_MICRO_GAIN: float = 0.7
     HEAD_STOP_THRESHOLD: float = 0.030
     HEAD_STOP_HOLD: float = 0.34
@@ -96,6 +144,11 @@ class Config:
     EYE_GAIN: float = 2.2
     EYE_NEUTRAL_ALPHA: float = 0.05
     EYE_SMOOTH_FPS_REFERENCE: float = 60.0
+    EYE_FIXATION_ENABLED: bool = False # Hold gaze on fixations, follow saccades (replaces EYE_SMOOTH_ALPHA)
+    EYE_FIXATION_VELOCITY: float = 1.5 # Max gaze units/s across the window for a fixation to start
+    EYE_FIXATION_DISPERSION: float = 0.06 # Max per-axis spread to start a fixation; one sample 2x this far from its centroid, or two 1x, end it
+    EYE_FIXATION_DURATION: float = 0.1 # Seconds of compact gaze before a fixation starts
+    EYE_SACCADE_ALPHA: float = 0.8 # Light smoothing during saccades, per frame at EYE_SMOOTH_FPS_REFERENCE
     EYE_CALIBRATION_SECONDS: float = 1.2
     EYE_CALIBRATION_MIN_SAMPLES: int = 20
 
@@ -104,12 +157,31 @@ class Config:
     
     EVENT_LOG_PATH: str = "events.log"
     EVENT_LOG_MAX: int = 8
+    TELEMETRY_PATH: str = "telemetry.log" # Empty string disables the file
+    TELEMETRY_INTERVAL: float = 5.0
     MOTION_MAX_SPEED: float = 2200.0
     MOTION_DAMPING: float = 0.4
+    FILTER_FPS_REFERENCE: float = 30.0 # Rate per-frame constants (damping, neutral alpha, tilt decay) are tuned at; 0 applies them per call
     
     # Smoothing Settings
     SMOOTHING_MIN_CUTOFF: float = 0.6
     SMOOTHING_BETA: float = 0.003
+    SMOOTHING_ADAPTIVE: bool = False # Set min_cutoff from measured target noise instead of SMOOTHING_MIN_CUTOFF
+    ADAPTIVE_TARGET_JITTER: float = 0.5 # px RMS a resting cursor should keep
+    ADAPTIVE_MIN_CUTOFF: float = 0.3
+    ADAPTIVE_MAX_CUTOFF: float = 3.0
+    ADAPTIVE_NOISE_SECONDS: float = 2.0 # Averaging time of the noise estimate
+    MOTION_RECORD_PATH: str = "" # CSV of raw cursor targets for benchmarks.filter_sweep; empty = off
+
+    # Latency compensation (see src/predictor.py)
+    PREDICT_ENABLED: bool = True
+    PREDICT_GAIN: float = 0.7 # Fraction of the estimated latency to extrapolate (0 = off)
+    PREDICT_MAX_HORIZON: float = 0.12 # Seconds
+    PREDICT_EXTRA_LATENCY: float = 0.04 # Exposure, buffering and driver approach not seen in timestamps
+    PREDICT_MIN_SPEED: float = 60.0 # px/s; prediction fades out below this to keep rests steady
+    PREDICT_DAMPING: float = 4.0 # Shrinks the lead while decelerating; higher = less overshoot
+    PREDICT_ALPHA: float = 0.6
+    PREDICT_BETA: float = 0.15
     
     
     # UI Colors (BGR)
@@ -122,7 +194,11 @@ class Config:
 
     # Mouse Driver Settings
     MOUSE_REFRESH_RATE: int = 120
+    MOUSE_SPIN_SECONDS: float = 0.002 # Busy-wait this long before each driver deadline instead of sleeping
     MOUSE_FRICTION: float = 0.92
     MOUSE_SPEED_COEFF: float = 35.0
     MOUSE_OVERRIDE_DIST: float = 80.0 # Pixels moved by user to trigger override
     MOUSE_OVERRIDE_TIMEOUT: float = 1.0 # Seconds to wait before reclaiming control
+    MOUSE_COALESCE: bool = True # Skip moves to the pixel already sent; poll the real cursor less often at rest
+    MOUSE_IDLE_READ_MAX: float = 0.25 # Longest gap between real-position reads while the cursor rests
+    MOUSE_SUBPIXEL: bool = True # Carry sub-pixel remainders instead of losing them to backend rounding
@@ -1,3 +1,4 @@
+import math
 import time
 from src.config import Config
 
@@ -35,6 +36,11 @@ class MouseController:
         self.button = Button
 
     def move(self, x, y):
+        if getattr(Config, "MOUSE_SUBPIXEL", True):
+            # Round here instead of letting the backend truncate; the driver
+            # keeps the float position, so the fraction carries to the next move.
+            x = math.floor(x + 0.5)
+            y = math.floor(y + 0.5)
         if self.backend == 'autopy':
             if self.screen_size:
                 max_x = max(self.screen_size[0] - 1, 0)
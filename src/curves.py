@@ -0,0 +1,114 @@
+"""Declarative speed -> gain curves compiled into dense lookup tables.
+
+A curve is a list of ``(x, y)`` control points joined either linearly or
+by a monotone cubic spline (Fritsch-Carlson, so the curve never overshoots
+its control points). ``Curve`` samples it once into ``resolution`` evenly
+spaced entries; evaluation is then a table lookup with linear
+interpolation, per sample (``curve(x)``) or over an array
+(``curve.evaluate(xs)``) for offline replay. Inputs outside the control
+range are clamped to the end values.
+"""
+
+import numpy as np
+
+
+INTERPOLATIONS = ("linear", "spline")
+
+
+def _pchip_slopes(xs, ys):
+    h = np.diff(xs)
+    delta = np.diff(ys) / h
+    slopes = np.zeros_like(ys)
+    if len(xs) == 2:
+        slopes[:] = delta[0]
+        return slopes
+    for k in range(1, len(xs) - 1):
+        if delta[k - 1] * delta[k] <= 0.0:
+            slopes[k] = 0.0
+        else:
+            w1 = 2.0 * h[k] + h[k - 1]
+            w2 = h[k] + 2.0 * h[k - 1]
+            slopes[k] = (w1 + w2) / (w1 / delta[k - 1] + w2 / delta[k])
+    slopes[0] = _end_slope(h[0], h[1], delta[0], delta[1])
+    slopes[-1] = _end_slope(h[-1], h[-2], delta[-1], delta[-2])
+    return slopes
+
+
+def _end_slope(h0, h1, d0, d1):
+    slope = ((2.0 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+    if slope * d0 <= 0.0:
+        return 0.0
+    if d0 * d1 <= 0.0 and abs(slope) > abs(3.0 * d0):
+        return 3.0 * d0
+    return slope
+
+
+def _spline(xs, ys, grid):
+    slopes = _pchip_slopes(xs, ys)
+    index = np.clip(np.searchsorted(xs, grid, side="right") - 1, 0, len(xs) - 2)
+    h = xs[index + 1] - xs[index]
+    t = (grid - xs[index]) / h
+    t2 = t * t
+    t3 = t2 * t
+    return (
+        (2.0 * t3 - 3.0 * t2 + 1.0) * ys[index]
+        + (t3 - 2.0 * t2 + t) * h * slopes[index]
+        + (-2.0 * t3 + 3.0 * t2) * ys[index + 1]
+        + (t3 - t2) * h * slopes[index + 1]
+    )
+
+
+class Curve:
+    def __init__(self, points, interpolation="linear", resolution=1024):
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Unknown curve interpolation: {interpolation}")
+        points = sorted((float(x), float(y)) for x, y in points)
+        if len(points) < 2:
+            raise ValueError("A curve needs at least two control points")
+        xs = np.array([p[0] for p in points])
+        ys = np.array([p[1] for p in points])
+        if np.any(np.diff(xs) <= 0.0):
+            raise ValueError("Curve control points need distinct x values")
+        self.points = tuple(points)
+        self.interpolation = interpolation
+        self.x_min = float(xs[0])
+        self.x_max = float(xs[-1])
+        grid = np.linspace(self.x_min, self.x_max, int(resolution))
+        if interpolation == "spline":
+            table = _spline(xs, ys, grid)
+        else:
+            table = np.interp(grid, xs, ys)
+        self.table = table
+        self._scale = (len(table) - 1) / (self.x_max - self.x_min)
+        self._last = len(table) - 1
+        # Plain floats keep the per-sample path free of NumPy scalar overhead.
+        self._values = table.tolist()
+
+    @classmethod
+    def from_function(cls, func, x_min, x_max, resolution=1024):
+        """Tabulate ``func`` on ``[x_min, x_max]`` (e.g. a legacy ``pow`` curve)."""
+        grid = np.linspace(float(x_min), float(x_max), int(resolution))
+        return cls(zip(grid, (func(x) for x in grid)), "linear", resolution)
+
+    def __call__(self, x):
+        pos = (x - self.x_min) * self._scale
+        if pos <= 0.0:
+            return self._values[0]
+        if pos >= self._last:
+            return self._values[-1]
+        index = int(pos)
+        low = self._values[index]
+        return low + (self._values[index + 1] - low) * (pos - index)
+
+    def evaluate(self, xs):
+        pos = np.clip((np.asarray(xs, dtype=np.float64) - self.x_min) * self._scale, 0.0, self._last)
+        index = np.minimum(pos.astype(np.intp), self._last - 1)
+        low = self.table[index]
+        return low + (self.table[index + 1] - low) * (pos - index)
+
+
+def curve_from_config(points, interpolation="spline", resolution=1024):
+    """``Curve`` for a Config/preset point list, or None when it is empty."""
+    if not points:
+        return None
+    return Curve(points, interpolation, resolution)
@@ -0,0 +1,176 @@
+import os
+import threading
+import time
+from collections import deque
+
+from src.thread_budget import pin_current_thread
+
+
+def lower_thread_priority():
+    """Best-effort: make the calling thread yield to capture and inference."""
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        # THREAD_PRIORITY_LOWEST
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), -2)
+        return True
+    except Exception:
+        pass
+    try:
+        # On Linux a native thread id is a valid PRIO_PROCESS target.
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 10)
+        return True
+    except Exception:
+        return False
+
+
+class DetectorRegistry:
+    """Builds detectors on demand and warms the rest up in the background.
+
+    ``get`` never blocks: a missing detector is queued for loading and ``None``
+    is returned until it is ready, so key handlers and the frame loop never
+    stall on a model load.
+    """
+
+    def __init__(self, factories, event_log=None, telemetry=None, warmup=True):
+        self._factories = dict(factories)
+        self.event_log = event_log
+        self.telemetry = telemetry
+        self.warmup = warmup
+        self._detectors = {}
+        self._pending = deque()
+        self._queued = set()
+        self._failed = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._running = False
+        self._thread = None
+        self.load_times = {}
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._wake.set()
+
+    def names(self):
+        return list(self._factories)
+
+    def is_loaded(self, name):
+        with self._lock:
+            return name in self._detectors
+
+    def load(self, name):
+        """Construct ``name`` on the calling thread (used for startup)."""
+        with self._lock:
+            detector = self._detectors.get(name)
+        if detector is not None:
+            return detector
+        return self._build(name)
+
+    def get(self, name):
+        with self._lock:
+            detector = self._detectors.get(name)
+        if detector is None:
+            self.request(name)
+        return detector
+
+    def request(self, name, urgent=True):
+        if name not in self._factories:
+            raise KeyError(f"Unknown detector: {name}")
+        with self._lock:
+            if name in self._detectors or name in self._failed:
+                return
+            if name in self._queued:
+                if urgent and name in self._pending:
+                    self._pending.remove(name)
+                    self._pending.appendleft(name)
+                return
+            self._queued.add(name)
+            if urgent:
+                self._pending.appendleft(name)
+            else:
+                self._pending.append(name)
+        self._wake.set()
+
+    def prewarm(self, names):
+        for name in names:
+            self.request(name, urgent=False)
+
+    def _build(self, name):
+        start = time.perf_counter()
+        try:
+            detector = self._factories[name]()
+            build_time = time.perf_counter() - start
+            if self.warmup and hasattr(detector, "warmup"):
+                detector.warmup()
+        except Exception as exc:
+            with self._lock:
+                self._failed[name] = exc
+                self._queued.discard(name)
+            self._log(f"DETECTOR_FAIL_{name.upper()}")
+            print(f"Failed to load {name} detector: {exc}")
+            return None
+        total = time.perf_counter() - start
+        with self._lock:
+            self._detectors.setdefault(name, detector)
+            self._queued.discard(name)
+            detector = self._detectors[name]
+        self.load_times[name] = total
+        if self.telemetry is not None:
+            self.telemetry.timing(f"load.{name}", build_time)
+            self.telemetry.timing(f"warm.{name}", total)
+        self._log(f"DETECTOR_READY_{name.upper()} {total:.2f}s")
+        return detector
+
+    def _log(self, event):
+        if self.event_log is not None:
+            self.event_log.add(event)
+
+    def _worker(self):
+        lower_thread_priority()
+        # Landmarkers built here size their inference pool from this affinity.
+        pin_current_thread("inference")
+        while self._running:
+            with self._lock:
+                name = self._pending.popleft() if self._pending else None
+            if name is None:
+                self._wake.wait(0.5)
+                self._wake.clear()
+                continue
+            self._build(name)
+
+
+class FirstMoveTimer:
+    """Measures time from startup or a mode switch to the first tracked move."""
+
+    def __init__(self, event_log=None, telemetry=None):
+        self.event_log = event_log
+        self.telemetry = telemetry
+        self._armed = None
+        self.last = None
+
+    def arm(self, reason, start=None):
+        start = time.perf_counter() if start is None else float(start)
+        self._armed = (reason, start)
+
+    def observe(self, now=None):
+        armed = self._armed
+        if armed is None:
+            return None
+        self._armed = None
+        reason, start = armed
+        now = time.perf_counter() if now is None else float(now)
+        elapsed = max(now - start, 0.0)
+        self.last = (reason, elapsed)
+        if self.telemetry is not None:
+            self.telemetry.timing(f"ttfm.{reason}", elapsed)
+        if self.event_log is not None:
+            self.event_log.add(f"TTFM_{reason.upper()} {elapsed:.2f}s")
+        return elapsed
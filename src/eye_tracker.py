@@ -3,12 +3,14 @@ import time
 
 class EyeTracker:
     def __init__(
-        self, smooth_alpha=0.35, gain=2.2, neutral_alpha=0.05, ref_fps=60.0
+        self, smooth_alpha=0.35, gain=2.2, neutral_alpha=0.05, ref_fps=60.0, fixation=None
     ):
         self.smooth_alpha = float(smooth_alpha)
         self.gain = float(gain)
         self.neutral_alpha = float(neutral_alpha)
         self._ref_dt = 1.0 / max(float(ref_fps), 1.0)
+        # Optional ``FixationFilter``; replaces the smooth_alpha EMA.
+        self.fixation = fixation
         self._x = None
         self._y = None
         self._neutral = None
@@ -40,6 +42,8 @@ class EyeTracker:
         self.calibrated = False
         self._calibration = {}
         self._map = None
+        if self.fixation is not None:
+            self.fixation.reset()
 
     def start_calibration(self):
         self._calibration = {}
@@ -90,7 +94,8 @@ class EyeTracker:
         gy = max(0.0, min(1.0, gy))
         return gx, gy
 
-    def compute(self, landmarks, timestamp=None):
+    def raw_gaze(self, landmarks):
+        """Iris position within both eye openings, before neutral and smoothing."""
         if not landmarks:
             return None
 
@@ -107,8 +112,14 @@ class EyeTracker:
             gx = (left[0] + right[0]) * 0.5
             gy = (left[1] + right[1]) * 0.5
 
-        gx = max(0.0, min(1.0, gx))
-        gy = max(0.0, min(1.0, gy))
+        return max(0.0, min(1.0, gx)), max(0.0, min(1.0, gy))
+
+    def compute(self, landmarks, timestamp=None, raw=None):
+        if raw is None:
+            raw = self.raw_gaze(landmarks)
+        if raw is None:
+            return None
+        gx, gy = raw
 
         now = time.time() if timestamp is None else float(timestamp)
         if self._last_time is None:
@@ -133,7 +144,9 @@ class EyeTracker:
         gx = max(0.0, min(1.0, gx))
         gy = max(0.0, min(1.0, gy))
 
-        if self._x is None:
+        if self.fixation is not None:
+            self._x, self._y = self.fixation.update(gx, gy, now)
+        elif self._x is None:
             self._x, self._y = gx, gy
         else:
             a = 1.0 - (1.0 - self.smooth_alpha) ** (dt / self._ref_dt)
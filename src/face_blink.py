@@ -2,6 +2,7 @@ import importlib
 import os
 from src.blink_state import BlinkStateMachine
 from src.config import Config
+from src.model_store import MODELS, get_model_store
 from src.model_utils import download_model
 
 import cv2
@@ -11,14 +12,16 @@ import numpy as np
 class FaceBlinkDetector:
     def __init__(
         self,
-        model_path="models/face_landmarker.task",
+        model_path=None,
         frame_skip=2,
         input_size=(320, 180),
         blink_threshold=0.22,
         blink_frames=2,
         cooldown=0.4,
+        output_matrix=False,
     ):
         self.model_path = model_path
+        self.output_matrix = bool(output_matrix)
         self.frame_skip = max(int(frame_skip), 0)
         self.input_size = input_size
         self.blink_threshold = float(blink_threshold)
@@ -36,6 +39,7 @@ class FaceBlinkDetector:
         self.last_ratio = None
         self.last_prob = 0.0
         self.last_landmarks = None
+        self.last_matrix = None
 
         self._ensure_model()
         self._load_modules()
@@ -51,15 +55,18 @@ class FaceBlinkDetector:
         self._lower_right = 374
 
     def _ensure_model(self):
+        if self.model_path is None:
+            self.model_path = get_model_store().path("face")
+            return
         if os.path.exists(self.model_path):
             return
-        os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
-        url = (
-            "https://storage.googleapis.com/mediapipe-models/face_landmarker/"
-            "face_landmarker/float16/1/face_landmarker.task"
-        )
         print("Downloading face model...")
-        download_model(url, self.model_path, timeout=Config.MODEL_DOWNLOAD_TIMEOUT)
+        download_model(
+            MODELS["face"].url,
+            self.model_path,
+            timeout=Config.MODEL_DOWNLOAD_TIMEOUT,
+            retries=Config.MODEL_DOWNLOAD_RETRIES,
+        )
 
     def _load_modules(self):
         self.mp_image = importlib.import_module(
@@ -80,17 +87,53 @@ class FaceBlinkDetector:
             min_face_presence_confidence=0.5,
             min_tracking_confidence=0.5,
             output_face_blendshapes=False,
-            output_facial_transformation_matrixes=False,
+            output_facial_transformation_matrixes=self.output_matrix,
         )
         self.landmarker = self.face_landmarker_module.FaceLandmarker.create_from_options(
             options
         )
 
+    def warmup(self):
+        w, h = self.input_size if self.input_size else (320, 180)
+        dummy = np.zeros((h, w, 3), dtype=np.uint8)
+        self._detect_landmarks(dummy)
+        self.reset()
+
+    def _detect_landmarks(self, rgb_frame):
+        """Landmarks of the first face in ``rgb_frame``, or None."""
+        mp_img = self.mp_image.Image(self.mp_image.ImageFormat.SRGB, rgb_frame)
+        result = self.landmarker.detect(mp_img)
+        matrices = getattr(result, "facial_transformation_matrixes", None)
+        self.last_matrix = matrices[0] if self.output_matrix and matrices else None
+        return result.face_landmarks[0] if result.face_landmarks else None
+
+    @property
+    def blink_in_progress(self):
+        return self._blink_state.eyes_closed
+
     def reset(self):
         self._blink_state.reset()
         self.last_ratio = None
         self.last_prob = 0.0
         self.last_landmarks = None
+        self.last_matrix = None
+
+    def detect_presence(self, frame, size=(160, 120)):
+        """Cheap probe: run the landmarker on a tiny frame, leaving blink state alone."""
+        small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        return self._detect_landmarks(cv2.cvtColor(small, cv2.COLOR_BGR2RGB)) is not None
+
+    def eye_region(self):
+        """Eye and brow landmarks from the last inference, or None."""
+        landmarks = self.last_landmarks
+        if not landmarks:
+            return None
+        indices = (
+            list(self._left_eye.values())
+            + list(self._right_eye.values())
+            + [self._brow_left, self._brow_right]
+        )
+        return [landmarks[i] for i in indices if i < len(landmarks)]
 
     def process(self, frame, timestamp, rgb=None):
         if self.frame_skip and (self._frame_count % (self.frame_skip + 1)) != 0:
@@ -102,13 +145,14 @@ class FaceBlinkDetector:
         if self.input_size:
             rgb_frame = cv2.resize(rgb_frame, self.input_size, interpolation=cv2.INTER_AREA)
 
-        mp_img = self.mp_image.Image(self.mp_image.ImageFormat.SRGB, rgb_frame)
-        result = self.landmarker.detect(mp_img)
-        if not result.face_landmarks:
+        return self.process_landmarks(self._detect_landmarks(rgb_frame), timestamp)
+
+    def process_landmarks(self, landmarks, timestamp):
+        """Update blink state from face landmarks (None when no face was found)."""
+        if not landmarks:
             self.reset()
             return None, False
 
-        landmarks = result.face_landmarks[0]
         self.last_landmarks = landmarks
         left_ratio = self._ratio_for_eye(landmarks, self._left_eye)
         right_ratio = self._ratio_for_eye(landmarks, self._right_eye)
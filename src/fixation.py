@@ -0,0 +1,128 @@
+"""Streaming fixation/saccade classification for the gaze cursor.
+
+A fixation starts once the last ``duration`` seconds of gaze fit inside
+``dispersion`` on each axis (I-DT) and move slower than ``velocity`` from
+the start to the end of that window (I-VT, measured across the window so
+landmark noise does not read as motion). While fixating, the output is
+held on the running centroid of the fixation. A sample farther than
+twice ``dispersion`` from it, or two in a row farther than ``dispersion``,
+end the fixation, and the output follows the saccade with only
+``saccade_alpha`` smoothing. Window extremes and sums are kept
+incrementally, so each sample costs O(1) amortized.
+"""
+
+from collections import deque
+
+from src.sliding_window import SlidingExtrema
+
+
+class FixationFilter:
+    def __init__(
+        self,
+        velocity=1.5,
+        dispersion=0.06,
+        duration=0.1,
+        saccade_alpha=0.8,
+        ref_fps=60.0,
+    ):
+        self.velocity = float(velocity)
+        self.dispersion = float(dispersion)
+        self.duration = float(duration)
+        self.saccade_alpha = float(saccade_alpha)
+        self._ref_dt = 1.0 / max(float(ref_fps), 1.0)
+        self._range_x = SlidingExtrema(self.duration)
+        self._range_y = SlidingExtrema(self.duration)
+        self.reset()
+
+    def reset(self):
+        self._range_x.reset()
+        self._range_y.reset()
+        self._window = deque()
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._last = None
+        self._x = None
+        self._y = None
+        self.fixating = False
+        self._fix = None
+        self._outside = 0
+
+    def update(self, x, y, timestamp):
+        t = float(timestamp)
+        if self._last is None:
+            self._last = (x, y, t)
+            self._x, self._y = x, y
+            self._push(x, y, t)
+            return self._x, self._y
+
+        last_t = self._last[2]
+        dt = max(t - last_t, 1e-6)
+        self._last = (x, y, t)
+        spread_x, spread_y = self._push(x, y, t)
+
+        if self.fixating:
+            fix = self._fix
+            cx = fix[0] / fix[2]
+            cy = fix[1] / fix[2]
+            distance = ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5
+            if distance <= self.dispersion:
+                self._outside = 0
+                fix[0] += x
+                fix[1] += y
+                fix[2] += 1
+                self._x = fix[0] / fix[2]
+                self._y = fix[1] / fix[2]
+                return self._x, self._y
+            self._outside += 1
+            if self._outside < 2 and distance <= 2.0 * self.dispersion:
+                # One stray sample near the edge is noise, not a saccade yet.
+                return self._x, self._y
+            # Left the fixation: saccade from this sample on.
+            self.fixating = False
+            self._fix = None
+            self._restart(x, y, t)
+        else:
+            first_t, first_x, first_y = self._window[0]
+            span = t - first_t
+            # Window speed: start to end of the window, so noise averages out.
+            speed = ((x - first_x) ** 2 + (y - first_y) ** 2) ** 0.5 / max(span, dt)
+            if (
+                span >= self.duration - dt - 1e-9
+                and speed <= self.velocity
+                and max(spread_x, spread_y) <= self.dispersion
+            ):
+                count = len(self._window)
+                self.fixating = True
+                self._outside = 0
+                self._fix = [self._sum_x, self._sum_y, count]
+                self._x = self._sum_x / count
+                self._y = self._sum_y / count
+                return self._x, self._y
+
+        a = 1.0 - (1.0 - self.saccade_alpha) ** (dt / self._ref_dt)
+        self._x += (x - self._x) * a
+        self._y += (y - self._y) * a
+        return self._x, self._y
+
+    def _push(self, x, y, t):
+        window = self._window
+        window.append((t, x, y))
+        self._sum_x += x
+        self._sum_y += y
+        cutoff = t - self.duration
+        while window[0][0] < cutoff:
+            _, old_x, old_y = window.popleft()
+            self._sum_x -= old_x
+            self._sum_y -= old_y
+        low_x, high_x = self._range_x.push(x, t)
+        low_y, high_y = self._range_y.push(y, t)
+        return high_x - low_x, high_y - low_y
+
+    def _restart(self, x, y, t):
+        """Drop the window so the next fixation only counts post-saccade samples."""
+        self._range_x.reset()
+        self._range_y.reset()
+        self._window.clear()
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._push(x, y, t)
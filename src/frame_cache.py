@@ -0,0 +1,81 @@
+import time
+
+import numpy as np
+
+
+def landmark_array(landmarks):
+    """Pack MediaPipe-style landmarks into an (N, 3) float32 array."""
+    if not landmarks:
+        return np.zeros((0, 3), dtype=np.float32)
+    return np.array(
+        [(lm.x, lm.y, getattr(lm, "z", 0.0)) for lm in landmarks], dtype=np.float32
+    )
+
+
+class DetectionResult:
+    __slots__ = ("name", "frame_id", "value", "elapsed", "_features")
+
+    def __init__(self, name, frame_id, value, elapsed):
+        self.name = name
+        self.frame_id = frame_id
+        self.value = value
+        self.elapsed = elapsed
+        self._features = {}
+
+    def feature(self, key, compute):
+        """Memoize a value derived from this detection."""
+        if key not in self._features:
+            self._features[key] = compute()
+        return self._features[key]
+
+    def has_feature(self, key):
+        return key in self._features
+
+
+class FrameResultCache:
+    """Keeps the latest result per detector, keyed by camera frame id.
+
+    ``run`` executes a detector at most once per ``(name, frame_id)``; later
+    callers in the same frame get the stored result, its timing, and any
+    features already derived from it.
+    """
+
+    def __init__(self, telemetry=None, on_compute=None):
+        self.telemetry = telemetry
+        self.on_compute = on_compute
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self._entries.clear()
+
+    def get(self, name, frame_id):
+        entry = self._entries.get(name)
+        if entry is not None and entry.frame_id == frame_id:
+            return entry
+        return None
+
+    def latest(self, name):
+        return self._entries.get(name)
+
+    def run(self, name, frame_id, compute, record=True):
+        """Stored result for this frame, or ``compute()`` timed and stored.
+
+        ``record=False`` keeps the timing out of ``on_compute``, for work whose
+        cost was already charged under another name (holistic views).
+        """
+        entry = self.get(name, frame_id)
+        if entry is not None:
+            self.hits += 1
+            if self.telemetry is not None:
+                self.telemetry.count(f"cache.{name}.hit")
+            return entry
+        self.misses += 1
+        start = time.perf_counter()
+        value = compute()
+        entry = DetectionResult(name, frame_id, value, time.perf_counter() - start)
+        self._entries[name] = entry
+        if record and self.on_compute is not None:
+            self.on_compute(name, entry.elapsed)
+        return entry
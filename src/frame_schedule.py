@@ -1,10 +1,15 @@
+FACE_MODES = ("HEAD", "EYE_HYBRID", "EYE_HAND")
+HAND_MODES = ("ABSOLUTE", "RELATIVE", "TILT_HYBRID", "EYE_HAND")
+
+
+def detectors_needed(mode, blink_enabled, long_blink_enabled):
+    face_needed = blink_enabled or long_blink_enabled or mode in FACE_MODES
+    hand_needed = mode in HAND_MODES
+    return hand_needed, face_needed
+
+
 def schedule_detectors(mode, frame_id, blink_enabled, long_blink_enabled):
-    face_needed = blink_enabled or long_blink_enabled or mode in (
-        "HEAD",
-        "EYE_HYBRID",
-        "EYE_HAND",
-    )
-    hand_needed = mode in ("ABSOLUTE", "RELATIVE", "TILT_HYBRID", "EYE_HAND")
+    hand_needed, face_needed = detectors_needed(mode, blink_enabled, long_blink_enabled)
     even = (frame_id % 2) == 0
 
     if mode == "HEAD":
@@ -19,3 +24,190 @@ def schedule_detectors(mode, frame_id, blink_enabled, long_blink_enabled):
         return True, False
     return hand_needed, face_needed
 
+
+def speed_demand(speed, reference):
+    if speed is None or reference <= 0:
+        return 0.0
+    return max(0.0, min(1.0, float(speed) / float(reference)))
+
+
+class DetectorScheduler:
+    """Decides per frame which detectors run.
+
+    Each detector has an idle interval (frames between runs when its signal is
+    quiet). Demand in [0, 1] shrinks that interval towards every frame, and the
+    measured inference cost decides how many due detectors fit the per-frame
+    budget. A detector that has waited ``max_stale`` frames always runs.
+
+    With ``holistic`` set and both detectors needed, the single holistic
+    inference is planned and costed as one unit, ``"holistic"``, and
+    serves both.
+    """
+
+    def __init__(
+        self,
+        budget=0.018,
+        idle_intervals=None,
+        secondary_interval=3,
+        max_stale=6,
+        cost_alpha=0.2,
+        telemetry=None,
+    ):
+        self.budget = float(budget)
+        self.idle_intervals = {"hand": 1, "face": 1}
+        if idle_intervals:
+            self.idle_intervals.update(idle_intervals)
+        self.idle_intervals.setdefault(
+            "holistic", min(self.idle_intervals["hand"], self.idle_intervals["face"])
+        )
+        self.secondary_interval = max(int(secondary_interval), 1)
+        self.max_stale = max(int(max_stale), 1)
+        self.cost_alpha = float(cost_alpha)
+        self.telemetry = telemetry
+        self._cost = {}
+        self._last_run = {}
+        self._planned = {}
+        self._frame_spent = None
+        self.frames = 0
+        self.over_budget_frames = 0
+        self.runs = {"hand": 0, "face": 0, "holistic": 0}
+        self.skips = {"hand": 0, "face": 0, "holistic": 0}
+        self.last_decision = (False, False)
+
+    def reset(self):
+        self._last_run = {}
+        self._planned = {}
+        self._frame_spent = None
+
+    def estimated_cost(self, name):
+        return self._cost.get(name, 0.0)
+
+    def record(self, name, seconds):
+        seconds = max(float(seconds), 0.0)
+        prev = self._cost.get(name)
+        if prev is None:
+            self._cost[name] = seconds
+        else:
+            self._cost[name] = prev + (seconds - prev) * self.cost_alpha
+        if self._frame_spent is not None:
+            self._frame_spent += seconds
+        if self.telemetry is not None:
+            self.telemetry.timing(f"infer.{name}", seconds)
+
+    def _interval(self, name, demand, primary):
+        idle = self.idle_intervals.get(name, 1) if primary else self.secondary_interval
+        idle = max(int(idle), 1)
+        demand = max(0.0, min(1.0, float(demand)))
+        return max(1, int(round(idle - (idle - 1) * demand)))
+
+    def _close_frame(self):
+        if self._frame_spent is None:
+            return
+        self.frames += 1
+        if self._frame_spent > self.budget:
+            self.over_budget_frames += 1
+        if self.telemetry is not None:
+            self.telemetry.timing("sched.frame_spent", self._frame_spent)
+            self.telemetry.gauge(
+                "sched.budget_utilization",
+                self._frame_spent / self.budget if self.budget > 0 else 0.0,
+            )
+            self.telemetry.gauge("sched.over_budget_ratio", self.over_budget_ratio())
+
+    def plan(
+        self, mode, frame_id, blink_enabled, long_blink_enabled, demand=None, holistic=False
+    ):
+        self._close_frame()
+        self._frame_spent = 0.0
+        demand = demand or {}
+        hand_needed, face_needed = detectors_needed(mode, blink_enabled, long_blink_enabled)
+        needed = []
+        if holistic and hand_needed and face_needed:
+            needed.append(("holistic", True))
+            demand = {"holistic": max(demand.get("hand", 0.0), demand.get("face", 0.0))}
+        else:
+            if hand_needed:
+                needed.append(("hand", True))
+            if face_needed:
+                needed.append(("face", mode in FACE_MODES))
+
+        due = []
+        forced = []
+        for name, primary in needed:
+            last = self._last_run.get(name)
+            stale = self.max_stale if last is None else frame_id - last
+            interval = self._interval(name, demand.get(name, 0.0), primary)
+            if stale >= self.max_stale:
+                forced.append(name)
+            elif stale >= interval:
+                due.append((stale / interval, name))
+
+        selected = list(forced)
+        spent = sum(self.estimated_cost(name) for name in selected)
+        for _, name in sorted(due, reverse=True):
+            cost = self.estimated_cost(name)
+            if selected and spent + cost > self.budget:
+                continue
+            selected.append(name)
+            spent += cost
+
+        self._planned = {}
+        for name, _ in needed:
+            if name in selected:
+                self._planned[name] = self._last_run.get(name)
+                self._last_run[name] = frame_id
+                self.runs[name] += 1
+            else:
+                self.skips[name] += 1
+            if self.telemetry is not None:
+                key = "run" if name in selected else "skip"
+                self.telemetry.count(f"sched.{name}.{key}")
+
+        unit = "holistic" in selected
+        self.last_decision = (unit or "hand" in selected, unit or "face" in selected)
+        return self.last_decision
+
+    def skipped(self, name, fresh=False):
+        """Take back a planned run the caller dropped (motion gate, model not loaded).
+
+        ``fresh`` means the cached result was confirmed current (the motion gate
+        saw a static scene), so the detector's staleness still restarts from
+        this frame; otherwise it stays due as if it had not been planned.
+        """
+        if name not in self._planned:
+            return
+        previous = self._planned.pop(name)
+        if not fresh:
+            if previous is None:
+                self._last_run.pop(name, None)
+            else:
+                self._last_run[name] = previous
+        self.runs[name] -= 1
+        self.skips[name] += 1
+        if self.telemetry is not None:
+            self.telemetry.count(f"sched.{name}.run", -1)
+            self.telemetry.count(f"sched.{name}.skip")
+        hand, face = self.last_decision
+        self.last_decision = (
+            hand and name not in ("hand", "holistic"),
+            face and name not in ("face", "holistic"),
+        )
+
+    def over_budget_ratio(self):
+        if self.frames == 0:
+            return 0.0
+        return self.over_budget_frames / self.frames
+
+    def run_rate(self, name):
+        total = self.runs.get(name, 0) + self.skips.get(name, 0)
+        if total == 0:
+            return 0.0
+        return self.runs[name] / total
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "over_budget_ratio": self.over_budget_ratio(),
+            "cost_ms": {name: cost * 1000.0 for name, cost in self._cost.items()},
+            "run_rate": {name: self.run_rate(name) for name in self.runs},
+        }
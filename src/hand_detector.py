@@ -1,7 +1,9 @@
 import cv2
 import importlib
+import numpy as np
 import os
 from src.config import Config
+from src.model_store import MODELS, get_model_store
 from src.model_utils import download_model
 
 
@@ -12,13 +14,16 @@ class HandDetector:
         max_num_hands=1,
         min_detection_confidence=0.7,
         min_tracking_confidence=0.5,
-        model_path="models/hand_landmarker.task",
+        model_path=None,
+        input_size=None,
     ):
         self.static_image_mode = static_image_mode
         self.max_num_hands = max_num_hands
         self.min_detection_confidence = min_detection_confidence
         self.min_tracking_confidence = min_tracking_confidence
         self.model_path = model_path
+        # Landmarks are normalized, so downscaling before inference is transparent.
+        self.input_size = tuple(input_size) if input_size else None
 
         self._ensure_model()
         self._load_modules()
@@ -26,15 +31,18 @@ class HandDetector:
         self.results = None
 
     def _ensure_model(self):
+        if self.model_path is None:
+            self.model_path = get_model_store().path("hand")
+            return
         if os.path.exists(self.model_path):
             return
-        os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
-        url = (
-            "https://storage.googleapis.com/mediapipe-models/hand_landmarker/"
-            "hand_landmarker/float16/1/hand_landmarker.task"
-        )
         print("Downloading hand model...")
-        download_model(url, self.model_path, timeout=Config.MODEL_DOWNLOAD_TIMEOUT)
+        download_model(
+            MODELS["hand"].url,
+            self.model_path,
+            timeout=Config.MODEL_DOWNLOAD_TIMEOUT,
+            retries=Config.MODEL_DOWNLOAD_RETRIES,
+        )
 
     def _load_modules(self):
         self.mp_image = importlib.import_module(
@@ -68,10 +76,21 @@ class HandDetector:
             options
         )
 
+    def warmup(self, size=(160, 120)):
+        # First inference allocates buffers; pay for it before the user waits.
+        dummy = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+        self._detect(dummy)
+        self.results = None
+
+    def _detect(self, rgb_frame):
+        mp_img = self.mp_image.Image(self.mp_image.ImageFormat.SRGB, rgb_frame)
+        return self.landmarker.detect(mp_img)
+
     def find_hands(self, frame, draw=True, rgb=None):
         rgb_frame = rgb if rgb is not None else cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        mp_img = self.mp_image.Image(self.mp_image.ImageFormat.SRGB, rgb_frame)
-        self.results = self.landmarker.detect(mp_img)
+        if self.input_size:
+            rgb_frame = cv2.resize(rgb_frame, self.input_size, interpolation=cv2.INTER_AREA)
+        self.results = self._detect(rgb_frame)
         if draw and self.results.hand_landmarks:
             self._draw_landmarks(frame, self.results.hand_landmarks)
         return frame
@@ -87,6 +106,16 @@ class HandDetector:
             for start, end in self._connections:
                 cv2.line(frame, points[start], points[end], (255, 255, 255), 1)
 
+    def detect_presence(self, frame, size=(160, 120)):
+        """Cheap probe on a tiny frame; does not replace the tracked results."""
+        small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        return bool(self._detect(cv2.cvtColor(small, cv2.COLOR_BGR2RGB)).hand_landmarks)
+
+    def normalized_landmarks(self, hand_index=0):
+        if not self.results or len(self.results.hand_landmarks) <= hand_index:
+            return None
+        return self.results.hand_landmarks[hand_index]
+
     def find_position(self, frame, hand_index=0):
         landmark_list = []
         if not self.results or not self.results.hand_landmarks:
@@ -94,7 +123,7 @@ class HandDetector:
 
         hand = self.results.hand_landmarks[hand_index]
         h, w, _ = frame.shape
+        # Sub-pixel camera coordinates; only drawing rounds to integers.
         for idx, lm in enumerate(hand):
-            cx, cy = int(lm.x * w), int(lm.y * h)
-            landmark_list.append((idx, cx, cy, lm.z))
+            landmark_list.append((idx, lm.x * w, lm.y * h, lm.z))
         return landmark_list
@@ -1,3 +1,118 @@
+import math
+
+from src.sliding_window import SlidingMedian
+
+
+def landmark_offset(landmarks):
+    """Nose offset inside the landmark bounding box, normalized by its size."""
+    if not landmarks:
+        return None
+
+    # Single pass to find min/max for both axes
+    first = landmarks[0]
+    min_x = max_x = first.x
+    min_y = max_y = first.y
+    for lm in landmarks[1:]:
+        if lm.x < min_x:
+            min_x = lm.x
+        elif lm.x > max_x:
+            max_x = lm.x
+        if lm.y < min_y:
+            min_y = lm.y
+        elif lm.y > max_y:
+            max_y = lm.y
+    span_x = max(max_x - min_x, 1e-6)
+    span_y = max(max_y - min_y, 1e-6)
+    cx = (min_x + max_x) * 0.5
+    cy = (min_y + max_y) * 0.5
+
+    nose_idx = 1 if len(landmarks) > 1 else 0
+    nose = landmarks[nose_idx]
+
+    return (nose.x - cx) / span_x, (nose.y - cy) / span_y
+
+
+def matrix_offset(matrix, scale=0.5):
+    """Head direction from a 4x4 facial transformation matrix.
+
+    The third rotation column is where the face points in camera space. Its
+    x and y components are sin(yaw) and sin(pitch) scaled by the other angle,
+    so ``scale`` maps them onto roughly the same range as ``landmark_offset``.
+    Camera y points up while image y points down, hence the sign flip.
+    """
+    if matrix is None:
+        return None
+    return scale * float(matrix[0][2]), -scale * float(matrix[1][2])
+
+
+class MedianNeutral:
+    """Neutral pose as the running median of recent resting head offsets.
+
+    Samples enter a ``window``-second median (``SlidingMedian``, two heaps,
+    O(log n) per sample) only while the head is at rest near the neutral: fast
+    turns and deliberate deflections beyond ``freeze_offset`` are left out,
+    so steering does not drag the neutral along. A deflection held still
+    for ``rebase_seconds`` is taken as a new posture and admitted.
+    """
+
+    def __init__(
+        self,
+        window=3.0,
+        freeze_offset=0.01,
+        freeze_speed=0.15,
+        rebase_seconds=3.0,
+    ):
+        self.window = float(window)
+        self.freeze_offset = float(freeze_offset)
+        self.freeze_speed = float(freeze_speed)
+        self.rebase_seconds = float(rebase_seconds)
+        self._x = SlidingMedian(self.window)
+        self._y = SlidingMedian(self.window)
+        self.reset()
+
+    def reset(self):
+        self._x.reset()
+        self._y.reset()
+        self._last = None
+        self._held_since = None
+        self.neutral = None
+        self.frozen = False
+
+    def snap(self, raw_dx, raw_dy, timestamp):
+        """Restart the window at the current pose (stop-hold)."""
+        self.reset()
+        self.update(raw_dx, raw_dy, timestamp)
+
+    def update(self, raw_dx, raw_dy, timestamp):
+        t = float(timestamp)
+        if self.neutral is None:
+            self._last = (raw_dx, raw_dy, t)
+            self.neutral = self._push(raw_dx, raw_dy, t)
+            return self.neutral
+
+        last_x, last_y, last_t = self._last
+        dt = max(t - last_t, 1e-6)
+        self._last = (raw_dx, raw_dy, t)
+        speed = math.hypot(raw_dx - last_x, raw_dy - last_y) / dt
+        deflection = math.hypot(raw_dx - self.neutral[0], raw_dy - self.neutral[1])
+
+        self.frozen = speed > self.freeze_speed or deflection > self.freeze_offset
+        if speed > self.freeze_speed or not self.frozen:
+            # Moving or at rest: any held deflection is over.
+            self._held_since = None
+        elif self._held_since is None:
+            # Deflected but still: steering, unless it lasts long enough to be posture.
+            self._held_since = t
+        elif t - self._held_since >= self.rebase_seconds:
+            self.frozen = False
+        if not self.frozen:
+            self.neutral = self._push(raw_dx, raw_dy, t)
+        return self.neutral
+
+    def _push(self, raw_dx, raw_dy, t):
+        return self._x.push(raw_dx, t), self._y.push(raw_dy, t)
+
+
 class HeadMotion:
     def __init__(
         self,
@@ -15,6 +130,9 @@ class HeadMotion:
         return_brake=0.6,
         return_brake_margin=0.01,
         tilt_boost=0.4,
+        speed_curve=None,
+        ref_fps=None,
+        neutral_estimator=None,
     ):
         self.screen_w, self.screen_h = screen_size
         self.origin_x, self.origin_y = screen_origin
@@ -30,6 +148,14 @@ class HeadMotion:
         self.return_brake = float(return_brake)
         self.return_brake_margin = float(return_brake_margin)
         self.tilt_boost = float(tilt_boost)
+        # Optional ``Curve`` of axis offset (0..1) -> speed (px/s); replaces
+        # min/max speed, exp and micro gain.
+        self.speed_curve = speed_curve
+        # Per-frame constants (neutral_alpha, return brake) are tuned at
+        # ``ref_fps``; None applies them once per call.
+        self.ref_fps = ref_fps
+        # Optional ``MedianNeutral``; replaces the neutral_alpha EMA.
+        self.neutral_estimator = neutral_estimator
         self._neutral = None
         self._last_time = None
         self._below_since = None
@@ -40,48 +166,39 @@ class HeadMotion:
         self._last_time = None
         self._below_since = None
         self._last_mag = None
+        if self.neutral_estimator is not None:
+            self.neutral_estimator.reset()
 
-    def compute(self, landmarks, timestamp):
-        if not landmarks:
+    def compute(self, landmarks, timestamp, offset=None):
+        if offset is None:
+            offset = landmark_offset(landmarks)
+        if offset is None:
             return None
-
-        # Single pass to find min/max for both axes
-        first = landmarks[0]
-        min_x = max_x = first.x
-        min_y = max_y = first.y
-        for lm in landmarks[1:]:
-            if lm.x < min_x:
-                min_x = lm.x
-            elif lm.x > max_x:
-                max_x = lm.x
-            if lm.y < min_y:
-                min_y = lm.y
-            elif lm.y > max_y:
-                max_y = lm.y
-        span_x = max(max_x - min_x, 1e-6)
-        span_y = max(max_y - min_y, 1e-6)
-        cx = (min_x + max_x) * 0.5
-        cy = (min_y + max_y) * 0.5
-
-        nose_idx = 1 if len(landmarks) > 1 else 0
-        nose = landmarks[nose_idx]
-
-        raw_dx = (nose.x - cx) / span_x
-        raw_dy = (nose.y - cy) / span_y
+        raw_dx, raw_dy = offset
 
         if self._neutral is None:
             self._neutral = (raw_dx, raw_dy)
             self._last_time = float(timestamp)
+            if self.neutral_estimator is not None:
+                self.neutral_estimator.update(raw_dx, raw_dy, timestamp)
             return 0.0, 0.0
 
         dt = max(float(timestamp) - self._last_time, 1e-6)
         self._last_time = float(timestamp)
 
-        # Slow adaptive neutral to reduce drift and reduce required head movement.
-        self._neutral = (
-            self._neutral[0] * (1.0 - self.neutral_alpha) + raw_dx * self.neutral_alpha,
-            self._neutral[1] * (1.0 - self.neutral_alpha) + raw_dy * self.neutral_alpha,
-        )
+        frames = dt * float(self.ref_fps) if self.ref_fps else 1.0
+        if self.neutral_estimator is not None:
+            self._neutral = self.neutral_estimator.update(raw_dx, raw_dy, timestamp)
+        else:
+            neutral_alpha = self.neutral_alpha
+            if frames != 1.0:
+                neutral_alpha = 1.0 - (1.0 - neutral_alpha) ** frames
+
+            # Slow adaptive neutral to reduce drift and reduce required head movement.
+            self._neutral = (
+                self._neutral[0] * (1.0 - neutral_alpha) + raw_dx * neutral_alpha,
+                self._neutral[1] * (1.0 - neutral_alpha) + raw_dy * neutral_alpha,
+            )
 
         dx = raw_dx - self._neutral[0]
         dy = raw_dy - self._neutral[1]
@@ -99,6 +216,8 @@ class HeadMotion:
             elif (timestamp - self._below_since) >= self.stop_hold:
                 # Snap neutral to current pose to help stop/hold.
                 self._neutral = (raw_dx, raw_dy)
+                if self.neutral_estimator is not None:
+                    self.neutral_estimator.snap(raw_dx, raw_dy, timestamp)
                 self._last_mag = 0.0
                 return 0.0, 0.0
         else:
@@ -109,10 +228,11 @@ class HeadMotion:
         vy = self._scale_speed(dy, abs(dy), mag_total)
         if (
             self._last_mag is not None
-            and mag + self.return_brake_margin < self._last_mag
+            and mag + self.return_brake_margin * frames < self._last_mag
             and self._last_mag > 0.0
         ):
-            ratio = mag / self._last_mag
+            # Shrink over one reference frame, so the brake does not depend on the rate.
+            ratio = (mag / self._last_mag) ** (1.0 / frames)
             brake = self.return_brake + (1.0 - self.return_brake) * ratio
             vx *= brake
             vy *= brake
@@ -130,9 +250,12 @@ class HeadMotion:
             return 0.0
         sign = 1.0 if value > 0 else -1.0
         axis_mag = min(abs(axis_mag), 1.0)
-        if axis_mag < 0.2:
-            axis_mag = axis_mag * self.micro_gain
-        speed = self.min_speed + (self.max_speed - self.min_speed) * (axis_mag ** self.exp)
+        if self.speed_curve is not None:
+            speed = self.speed_curve(axis_mag)
+        else:
+            if axis_mag < 0.2:
+                axis_mag = axis_mag * self.micro_gain
+            speed = self.min_speed + (self.max_speed - self.min_speed) * (axis_mag ** self.exp)
         total_mag = min(abs(total_mag), 1.0)
         speed *= 1.0 + self.tilt_boost * total_mag
         return sign * speed
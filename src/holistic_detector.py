@@ -0,0 +1,132 @@
+import importlib
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+from src.face_blink import FaceBlinkDetector
+from src.hand_detector import HandDetector
+from src.model_store import get_model_store
+
+
+# Same shape as HandLandmarkerResult for the parts main.py reads.
+HandResult = namedtuple("HandResult", "hand_landmarks")
+
+
+class HolisticDetector:
+    """Hand and face landmarks from one HolisticLandmarker call per frame.
+
+    ``hand`` and ``face`` are drop-in stand-ins for HandDetector and
+    FaceBlinkDetector. Both share the result of the last ``detect`` call made
+    with the same RGB array, so the second view in a frame costs nothing.
+    """
+
+    def __init__(
+        self,
+        model_path=None,
+        input_size=None,
+        min_confidence=0.5,
+        hand_side="right",
+        face_options=None,
+    ):
+        self.model_path = model_path
+        self.input_size = tuple(input_size) if input_size else None
+        self.min_confidence = float(min_confidence)
+        self._last_rgb = None
+        self._last_result = None
+
+        if self.model_path is None:
+            self.model_path = get_model_store().path("holistic")
+        self._load_modules()
+        self._init_landmarker()
+
+        self.hand = HolisticHandView(self, hand_side)
+        self.face = HolisticFaceView(self, **(face_options or {}))
+
+    def _load_modules(self):
+        self.mp_image = importlib.import_module(
+            "mediapipe.tasks.python.vision.core.image"
+        )
+        self.base_options = importlib.import_module(
+            "mediapipe.tasks.python.core.base_options"
+        )
+        self.holistic_module = importlib.import_module(
+            "mediapipe.tasks.python.vision.holistic_landmarker"
+        )
+
+    def _init_landmarker(self):
+        options = self.holistic_module.HolisticLandmarkerOptions(
+            base_options=self.base_options.BaseOptions(model_asset_path=self.model_path),
+            min_face_detection_confidence=self.min_confidence,
+            min_face_landmarks_confidence=self.min_confidence,
+            min_pose_detection_confidence=self.min_confidence,
+            min_pose_landmarks_confidence=self.min_confidence,
+            min_hand_landmarks_confidence=self.min_confidence,
+        )
+        self.landmarker = self.holistic_module.HolisticLandmarker.create_from_options(
+            options
+        )
+
+    def warmup(self, size=(160, 120)):
+        self.detect(np.zeros((size[1], size[0], 3), dtype=np.uint8))
+        self._last_rgb = None
+        self._last_result = None
+        self.hand.results = None
+        self.face.reset()
+
+    def detect(self, rgb_frame):
+        if rgb_frame is self._last_rgb and self._last_result is not None:
+            return self._last_result
+        image = rgb_frame
+        if self.input_size:
+            image = cv2.resize(rgb_frame, self.input_size, interpolation=cv2.INTER_AREA)
+        result = self.landmarker.detect(
+            self.mp_image.Image(self.mp_image.ImageFormat.SRGB, image)
+        )
+        # Keyed by identity; holding the array keeps the id from being reused.
+        self._last_rgb = rgb_frame
+        self._last_result = result
+        return result
+
+
+class HolisticHandView(HandDetector):
+    def __init__(self, source, hand_side="right"):
+        self.source = source
+        self.hand_side = hand_side
+        super().__init__(model_path=source.model_path)
+
+    def _ensure_model(self):
+        return None
+
+    def _init_landmarker(self):
+        self.landmarker = None
+
+    def _detect(self, rgb_frame):
+        result = self.source.detect(rgb_frame)
+        # Stay on the hand we tracked last frame when both are visible.
+        sides = [self.hand_side, "left" if self.hand_side == "right" else "right"]
+        for side in sides:
+            hand = getattr(result, f"{side}_hand_landmarks", None)
+            if hand:
+                self.hand_side = side
+                return HandResult([hand])
+        return HandResult([])
+
+
+class HolisticFaceView(FaceBlinkDetector):
+    def __init__(self, source, **options):
+        self.source = source
+        options.setdefault("frame_skip", 0)
+        # Resizing is done once by the shared landmarker.
+        options["input_size"] = None
+        super().__init__(model_path=source.model_path, **options)
+
+    def _ensure_model(self):
+        return None
+
+    def _init_landmarker(self):
+        self.landmarker = None
+
+    def _detect_landmarks(self, rgb_frame):
+        landmarks = self.source.detect(rgb_frame).face_landmarks
+        return landmarks or None
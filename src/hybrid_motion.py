@@ -21,7 +21,7 @@ class HybridMotion:
     def reset(self):
         self.tilt_mapper.reset()
 
-    def compute(self, landmarks, cam_size):
+    def compute(self, landmarks, cam_size, timestamp=None):
         cam_w, cam_h = cam_size
         wrist = None
         index_mcp = None
@@ -56,7 +56,7 @@ class HybridMotion:
         tilt_x = nx / denom
         tilt_y = ny / denom
 
-        coarse_x, coarse_y = self.tilt_mapper.update(tilt_x, tilt_y)
+        coarse_x, coarse_y = self.tilt_mapper.update(tilt_x, tilt_y, timestamp)
         x_coarse = self.origin_x + coarse_x * self.screen_w
         y_coarse = self.origin_y + coarse_y * self.screen_h
 
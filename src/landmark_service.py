@@ -0,0 +1,276 @@
+"""Publish per-frame landmarks over shared memory for other local tools.
+
+One process (``main.py`` with ``LANDMARK_SHARE`` on, or
+``python -m src.landmark_service``) owns the camera and detectors and
+writes into a small ring of fixed-size slots. Clients such as
+``debug_brows.py --attach`` map the same block and read the newest slot
+without loading any model.
+
+Each slot carries a sequence number that is odd while the slot is being
+written, so a reader that sees the same even value before and after its
+copy has a consistent frame.
+"""
+
+import os
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.config import Config
+from src.frame_cache import landmark_array
+
+
+MAGIC = 0x48534C4D  # "HSLM"
+VERSION = 1
+FACE_POINTS = 478
+HAND_POINTS = 21
+
+HEADER_DTYPE = np.dtype(
+    [("magic", "<u4"), ("version", "<u4"), ("slots", "<u4"), ("pad", "<u4"), ("head", "<u8")]
+)
+SLOT_DTYPE = np.dtype(
+    [
+        ("seq", "<u8"),
+        ("frame_id", "<i8"),
+        ("timestamp", "<f8"),
+        ("face_count", "<u4"),
+        ("hand_count", "<u4"),
+        ("eye_ratio", "<f4"),
+        ("brow_ratio", "<f4"),
+        ("face", "<f4", (FACE_POINTS, 3)),
+        ("hand", "<f4", (HAND_POINTS, 3)),
+    ]
+)
+
+LandmarkFrame = namedtuple(
+    "LandmarkFrame", "index frame_id timestamp face hand eye_ratio brow_ratio"
+)
+
+
+def block_size(slots):
+    return HEADER_DTYPE.itemsize + SLOT_DTYPE.itemsize * slots
+
+
+def _views(buffer, slots):
+    header = np.ndarray((1,), dtype=HEADER_DTYPE, buffer=buffer)
+    ring = np.ndarray(
+        (slots,), dtype=SLOT_DTYPE, buffer=buffer, offset=HEADER_DTYPE.itemsize
+    )
+    return header, ring
+
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == "posix":
+        # Before Python 3.13 every attach registers the block for unlinking
+        # when this process exits, which would pull it from under the owner.
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _fill(points, source, limit):
+    if source is None:
+        return 0
+    array = source if isinstance(source, np.ndarray) else landmark_array(source)
+    count = min(len(array), limit)
+    points[:count] = array[:count]
+    return count
+
+
+def _ratio(value):
+    return np.float32(np.nan if value is None else value)
+
+
+class LandmarkPublisher:
+    def __init__(self, name=None, slots=None):
+        self.name = Config.LANDMARK_SHM_NAME if name is None else name
+        self.slots = int(Config.LANDMARK_SHM_SLOTS if slots is None else slots)
+        size = block_size(self.slots)
+        try:
+            self._shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+        except FileExistsError:
+            # Left behind by a crashed owner; reuse it if it is big enough.
+            self._shm = _attach(self.name)
+            if self._shm.size < size:
+                self._shm.close()
+                self._shm.unlink()
+                self._shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+        self._header, self._ring = _views(self._shm.buf, self.slots)
+        self._ring["seq"] = 0
+        self._header["magic"] = MAGIC
+        self._header["version"] = VERSION
+        self._header["slots"] = self.slots
+        self._header["head"] = 0
+        self.published = 0
+
+    def publish(self, frame_id, timestamp, face=None, hand=None, eye_ratio=None, brow_ratio=None):
+        index = self.published
+        slot = self._ring[index % self.slots : index % self.slots + 1]
+        slot["seq"] = 2 * index + 1
+        slot["frame_id"] = frame_id
+        slot["timestamp"] = timestamp
+        slot["face_count"] = _fill(slot["face"][0], face, FACE_POINTS)
+        slot["hand_count"] = _fill(slot["hand"][0], hand, HAND_POINTS)
+        slot["eye_ratio"] = _ratio(eye_ratio)
+        slot["brow_ratio"] = _ratio(brow_ratio)
+        slot["seq"] = 2 * index + 2
+        self.published = index + 1
+        self._header["head"] = self.published
+
+    def close(self):
+        # Drop numpy views first; the buffer cannot close while they exist.
+        self._header = None
+        self._ring = None
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class LandmarkClient:
+    def __init__(self, name=None):
+        self.name = Config.LANDMARK_SHM_NAME if name is None else name
+        self._shm = _attach(self.name)
+        header = np.ndarray((1,), dtype=HEADER_DTYPE, buffer=self._shm.buf)
+        if int(header["magic"][0]) != MAGIC or int(header["version"][0]) != VERSION:
+            header = None
+            self._shm.close()
+            raise RuntimeError(f"{self.name} is not a landmark service block")
+        self.slots = int(header["slots"][0])
+        del header
+        self._header, self._ring = _views(self._shm.buf, self.slots)
+
+    def head(self):
+        return int(self._header["head"][0])
+
+    def _read(self, index):
+        slot = self._ring[index % self.slots]
+        expected = 2 * index + 2
+        if int(slot["seq"]) != expected:
+            return None
+        face_count = int(slot["face_count"])
+        hand_count = int(slot["hand_count"])
+        frame = LandmarkFrame(
+            index=index,
+            frame_id=int(slot["frame_id"]),
+            timestamp=float(slot["timestamp"]),
+            face=slot["face"][:face_count].copy() if face_count else None,
+            hand=slot["hand"][:hand_count].copy() if hand_count else None,
+            eye_ratio=None if np.isnan(slot["eye_ratio"]) else float(slot["eye_ratio"]),
+            brow_ratio=None if np.isnan(slot["brow_ratio"]) else float(slot["brow_ratio"]),
+        )
+        # Overwritten while copying: the writer has lapped us.
+        if int(slot["seq"]) != expected:
+            return None
+        return frame
+
+    def latest(self):
+        """Newest complete frame, or None if nothing has been published."""
+        head = self.head()
+        for index in range(head - 1, max(head - self.slots, 0) - 1, -1):
+            frame = self._read(index)
+            if frame is not None:
+                return frame
+        return None
+
+    def wait(self, after=-1, timeout=1.0, poll=0.002):
+        """Block until a frame newer than index ``after`` arrives."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            frame = self.latest()
+            if frame is not None and frame.index > after:
+                return frame
+            if time.perf_counter() >= deadline:
+                return None
+            time.sleep(poll)
+
+    def close(self):
+        self._header = None
+        self._ring = None
+        self._shm.close()
+
+
+def run_service(use_face=True, use_hand=True):
+    """Own the camera and detectors and publish every frame until Ctrl+C."""
+    import cv2
+
+    from src.camera import ThreadedCamera
+    from src.face_blink import FaceBlinkDetector
+    from src.hand_detector import HandDetector
+
+    camera = ThreadedCamera(
+        Config.CAM_ID, Config.CAM_WIDTH, Config.CAM_HEIGHT, backend=Config.CAM_BACKEND
+    )
+    camera.start()
+    face = None
+    hand = None
+    if use_face:
+        face = FaceBlinkDetector(
+            frame_skip=0,
+            input_size=Config.BLINK_INPUT_SIZE,
+            blink_threshold=Config.BLINK_THRESHOLD,
+            blink_frames=Config.BLINK_FRAMES,
+            cooldown=Config.BLINK_COOLDOWN,
+        )
+    if use_hand:
+        hand = HandDetector(input_size=Config.HAND_INPUT_SIZE)
+    publisher = LandmarkPublisher()
+    print(f"Publishing landmarks on '{publisher.name}'. Ctrl+C to stop.")
+    last_frame_id = None
+    try:
+        while True:
+            success, frame, frame_id, frame_time = camera.read()
+            if not success or frame is None or frame_id == last_frame_id:
+                time.sleep(0.002)
+                continue
+            last_frame_id = frame_id
+            now = frame_time if frame_time is not None else time.time()
+            frame = cv2.flip(frame, 1)
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            face_points = None
+            brow = None
+            if face is not None:
+                face.process(frame, now, rgb=rgb)
+                face_points = face.last_landmarks
+                if face_points:
+                    brow = face.brow_ratio(face_points)
+            hand_points = None
+            if hand is not None:
+                hand.find_hands(frame, draw=False, rgb=rgb)
+                hand_points = hand.normalized_landmarks()
+            publisher.publish(
+                frame_id,
+                now,
+                face=face_points,
+                hand=hand_points,
+                eye_ratio=face.last_ratio if face is not None else None,
+                brow_ratio=brow,
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.close()
+        camera.release()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Share camera landmarks with local tools.")
+    parser.add_argument("--no-face", action="store_true")
+    parser.add_argument("--no-hand", action="store_true")
+    args = parser.parse_args()
+    run_service(use_face=not args.no_face, use_hand=not args.no_hand)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import json
+import os
+import platform
+import socket
+
+from src.config import Config
+
+
+# Keys a tuning file may override; anything else is ignored.
+TUNABLE_KEYS = ("BLINK_INPUT_SIZE", "HAND_INPUT_SIZE", "THREAD_CORES")
+
+
+def machine_id():
+    return socket.gethostname() or platform.node() or "default"
+
+
+def tuning_path(directory=None, machine=None):
+    directory = Config.TUNING_DIR if directory is None else directory
+    return os.path.join(directory, f"{machine or machine_id()}.json")
+
+
+def load_machine_tuning(config, path=None):
+    """Apply overrides from this machine's tuning file; returns what was applied."""
+    path = tuning_path() if path is None else path
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    overrides = data.get("overrides", {}) if isinstance(data, dict) else {}
+    applied = {}
+    for key in TUNABLE_KEYS:
+        if key not in overrides:
+            continue
+        value = overrides[key]
+        if isinstance(value, list):
+            value = tuple(value)
+        setattr(config, key, value)
+        applied[key] = value
+    return applied
+
+
+def save_machine_tuning(overrides, path=None, report=None):
+    path = tuning_path() if path is None else path
+    data = {
+        "machine": {
+            "id": machine_id(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+        },
+        "overrides": {key: value for key, value in overrides.items() if key in TUNABLE_KEYS},
+    }
+    if report is not None:
+        data["report"] = report
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from src.config import Config
+from src.model_utils import download_model, file_sha256
+
+
+MODEL_BASE_URL = "https://storage.googleapis.com/mediapipe-models"
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    name: str
+    filename: str
+    url: str
+    # Pin a digest here to reject anything else, including the first
+    # download (``python -m src.model_store --pin`` prints them). Without one
+    # the cache trusts its first download and records it in the manifest;
+    # bundle directories need a pin or their own manifest entry.
+    sha256: str | None = None
+
+
+MODELS: dict[str, ModelSpec] = {
+    "hand": ModelSpec(
+        name="hand",
+        filename="hand_landmarker.task",
+        url=f"{MODEL_BASE_URL}/hand_landmarker/hand_landmarker/float16/1/hand_landmarker.task",
+    ),
+    "face": ModelSpec(
+        name="face",
+        filename="face_landmarker.task",
+        url=f"{MODEL_BASE_URL}/face_landmarker/face_landmarker/float16/1/face_landmarker.task",
+    ),
+    "holistic": ModelSpec(
+        name="holistic",
+        filename="holistic_landmarker.task",
+        url=f"{MODEL_BASE_URL}/holistic_landmarker/holistic_landmarker/float16/latest/holistic_landmarker.task",
+    ),
+}
+
+
+def looks_complete(path):
+    """Cheap structural check that catches truncated model files."""
+    try:
+        if os.path.getsize(path) == 0:
+            return False
+        if path.endswith(".task"):
+            # .task bundles are zip archives; truncation loses the central directory.
+            return zipfile.is_zipfile(path)
+        if path.endswith(".tflite"):
+            with open(path, "rb") as handle:
+                header = handle.read(8)
+            return header[4:8] == b"TFL3"
+    except OSError:
+        return False
+    return True
+
+
+class ModelStore:
+    def __init__(
+        self,
+        cache_dir="models",
+        bundle_dirs=(),
+        specs=None,
+        timeout=12.0,
+        retries=3,
+    ):
+        self.cache_dir = cache_dir
+        self.bundle_dirs = [d for d in bundle_dirs if d]
+        self.specs = dict(MODELS if specs is None else specs)
+        self.timeout = float(timeout)
+        self.retries = int(retries)
+        self._locks = {name: threading.Lock() for name in self.specs}
+        self._manifest_lock = threading.Lock()
+
+    def _spec(self, name):
+        spec = self.specs.get(name)
+        if spec is None:
+            raise KeyError(f"Unknown model: {name}")
+        return spec
+
+    @staticmethod
+    def _read_manifest(directory):
+        path = os.path.join(directory, MANIFEST_NAME)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _record_digest(self, filename, digest):
+        with self._manifest_lock:
+            manifest = self._read_manifest(self.cache_dir)
+            manifest[filename] = digest
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, MANIFEST_NAME)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(manifest, handle, indent=2, sort_keys=True)
+            os.replace(tmp_path, path)
+
+    def expected_digest(self, name, directory=None):
+        spec = self._spec(name)
+        if spec.sha256:
+            return spec.sha256.lower()
+        manifest = self._read_manifest(directory or self.cache_dir)
+        digest = manifest.get(spec.filename)
+        return digest.lower() if isinstance(digest, str) else None
+
+    def verify(self, name, path, directory=None, require_digest=False):
+        if not os.path.isfile(path) or not looks_complete(path):
+            return False
+        expected = self.expected_digest(name, directory)
+        if expected is None:
+            return not require_digest
+        return file_sha256(path) == expected
+
+    def locate(self, name):
+        """Return a verified local copy (bundle dirs first), or None.
+
+        Bundle files are only used with a digest to check them against: a
+        pinned ``ModelSpec.sha256`` or an entry in the bundle's manifest.
+        """
+        spec = self._spec(name)
+        for directory in self.bundle_dirs:
+            path = os.path.join(directory, spec.filename)
+            if self.verify(name, path, directory, require_digest=True):
+                return path
+            if os.path.isfile(path) and self.expected_digest(name, directory) is None:
+                print(f"Ignoring {path}: no pinned digest and no {MANIFEST_NAME} entry.")
+        path = os.path.join(self.cache_dir, spec.filename)
+        if self.verify(name, path, self.cache_dir):
+            return path
+        return None
+
+    def path(self, name):
+        """Return a verified model path, downloading into the cache if needed."""
+        spec = self._spec(name)
+        with self._locks[name]:
+            found = self.locate(name)
+            if found is not None:
+                return found
+            dest = os.path.join(self.cache_dir, spec.filename)
+            if os.path.exists(dest):
+                print(f"Model {dest} failed verification; downloading again.")
+                os.remove(dest)
+            print(f"Downloading {name} model...")
+            digest = download_model(
+                spec.url,
+                dest,
+                timeout=self.timeout,
+                expected_sha256=self.expected_digest(name),
+                retries=self.retries,
+            )
+            if not looks_complete(dest):
+                os.remove(dest)
+                raise RuntimeError(f"Downloaded {name} model is not a valid model file")
+            self._record_digest(spec.filename, digest)
+            return dest
+
+    def prefetch(self, names=None, max_workers=4):
+        """Fetch several models in parallel; returns name -> path or exception."""
+        names = list(self.specs) if names is None else list(names)
+        results = {}
+        if not names:
+            return results
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as pool:
+            futures = {name: pool.submit(self.path, name) for name in names}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as exc:
+                    results[name] = exc
+        return results
+
+
+_default_store = None
+_default_lock = threading.Lock()
+
+
+def get_model_store():
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = ModelStore(
+                cache_dir=Config.MODEL_CACHE_DIR,
+                bundle_dirs=[Config.MODEL_BUNDLE_DIR],
+                timeout=Config.MODEL_DOWNLOAD_TIMEOUT,
+                retries=Config.MODEL_DOWNLOAD_RETRIES,
+            )
+        return _default_store
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fetch and verify Handsteer models.")
+    parser.add_argument("--cache", default=Config.MODEL_CACHE_DIR)
+    parser.add_argument("names", nargs="*", help="Models to fetch (default: all)")
+    parser.add_argument(
+        "--pin", action="store_true", help="Print sha256 values to pin in MODELS"
+    )
+    args = parser.parse_args()
+
+    store = ModelStore(cache_dir=args.cache, timeout=Config.MODEL_DOWNLOAD_TIMEOUT)
+    failed = False
+    for name, result in store.prefetch(args.names or None).items():
+        if isinstance(result, Exception):
+            failed = True
+            print(f"{name}: FAILED ({result})")
+        elif args.pin:
+            print(f'{name}: sha256="{file_sha256(result)}",')
+        else:
+            print(f"{name}: {result} sha256={file_sha256(result)}")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,89 @@
+import hashlib
 import os
+import time
+import urllib.error
 import urllib.request
 
 
-def download_model(url, path, timeout=10.0, chunk_size=1024 * 1024):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    tmp_path = f"{path}.tmp"
+def file_sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fetch_into(url, part_path, timeout, chunk_size):
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    request = urllib.request.Request(url)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
     try:
-        with urllib.request.urlopen(url, timeout=timeout) as response, open(
-            tmp_path, "wb"
-        ) as out:
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as exc:
+        # 416: the partial file already holds the whole body.
+        if exc.code == 416 and offset:
+            return offset, None
+        raise
+    with response:
+        status = getattr(response, "status", 200)
+        if offset and status != 206:
+            # Server ignored the range; start over.
+            offset = 0
+        length = response.headers.get("Content-Length")
+        expected_total = int(length) + offset if length is not None else None
+        with open(part_path, "ab" if offset else "wb") as out:
             while True:
                 chunk = response.read(chunk_size)
                 if not chunk:
                     break
                 out.write(chunk)
-        os.replace(tmp_path, path)
-    except Exception as exc:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+                offset += len(chunk)
+    return offset, expected_total
+
+
+def download_model(
+    url,
+    path,
+    timeout=10.0,
+    chunk_size=1024 * 1024,
+    expected_sha256=None,
+    retries=3,
+    retry_delay=0.5,
+):
+    """Download ``url`` to ``path`` atomically, resuming a previous ``.part``.
+
+    Returns the SHA-256 hex digest of the downloaded file. A digest mismatch
+    removes the partial file so the next attempt starts clean.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    part_path = f"{path}.part"
+    last_exc = None
+    for attempt in range(max(int(retries), 0) + 1):
+        try:
+            size, expected_total = _fetch_into(url, part_path, timeout, chunk_size)
+            if expected_total is not None and size < expected_total:
+                raise IOError(f"Truncated download: {size} of {expected_total} bytes")
+            break
+        except Exception as exc:
+            last_exc = exc
+            if attempt < retries:
+                time.sleep(retry_delay * (attempt + 1))
+    else:
+        raise RuntimeError(
+            f"Failed to download model from {url} to {path}: {last_exc}"
+        ) from last_exc
+
+    actual = file_sha256(part_path, chunk_size)
+    if expected_sha256 and actual != expected_sha256.lower():
+        os.remove(part_path)
         raise RuntimeError(
-            f"Failed to download model from {url} to {path}: {exc}"
-        ) from exc
+            f"Checksum mismatch for {url}: expected {expected_sha256}, got {actual}"
+        )
+    os.replace(part_path, path)
+    return actual
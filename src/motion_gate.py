@@ -0,0 +1,110 @@
+import cv2
+import numpy as np
+
+
+def make_thumbnail(frame, size=(64, 48)):
+    """Tiny grayscale copy of ``frame`` used for cheap change detection."""
+    small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    if small.ndim == 3:
+        small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    return small
+
+
+def roi_from_landmarks(landmarks, margin=0.2):
+    """Normalized (x0, y0, x1, y1) box around landmarks, padded by ``margin``."""
+    if not landmarks:
+        return None
+    xs = [lm.x for lm in landmarks]
+    ys = [lm.y for lm in landmarks]
+    x0, x1 = min(xs), max(xs)
+    y0, y1 = min(ys), max(ys)
+    pad_x = (x1 - x0) * margin
+    pad_y = (y1 - y0) * margin
+    return (
+        max(0.0, x0 - pad_x),
+        max(0.0, y0 - pad_y),
+        min(1.0, x1 + pad_x),
+        min(1.0, y1 + pad_y),
+    )
+
+
+def union_roi(*rois):
+    """Smallest box covering every non-None ROI, or None if there are none."""
+    rois = [roi for roi in rois if roi is not None]
+    if not rois:
+        return None
+    return (
+        min(roi[0] for roi in rois),
+        min(roi[1] for roi in rois),
+        max(roi[2] for roi in rois),
+        max(roi[3] for roi in rois),
+    )
+
+
+class MotionGate:
+    """Skips a detector while its region of the image stays unchanged.
+
+    The thumbnail taken at the last real inference is the reference, so slow
+    drift accumulates until it crosses ``threshold`` (mean absolute grey-level
+    difference). ``refresh_interval`` seconds after the last inference the
+    detector runs regardless.
+    """
+
+    def __init__(self, threshold=1.0, refresh_interval=0.5, telemetry=None, name="gate"):
+        self.threshold = float(threshold)
+        self.refresh_interval = float(refresh_interval)
+        self.telemetry = telemetry
+        self.name = name
+        self._reference = None
+        self._last_run = None
+        self.last_diff = None
+        self.checks = 0
+        self.skips = 0
+        self.saved_seconds = 0.0
+
+    def reset(self):
+        self._reference = None
+        self._last_run = None
+        self.last_diff = None
+
+    @staticmethod
+    def _crop(thumb, roi):
+        if roi is None:
+            return thumb
+        h, w = thumb.shape[:2]
+        x0 = int(roi[0] * w)
+        y0 = int(roi[1] * h)
+        x1 = max(int(np.ceil(roi[2] * w)), x0 + 1)
+        y1 = max(int(np.ceil(roi[3] * h)), y0 + 1)
+        return thumb[y0:y1, x0:x1]
+
+    def should_skip(self, thumb, roi, now, cost=0.0):
+        self.checks += 1
+        skip = False
+        if (
+            self._reference is not None
+            and self._last_run is not None
+            and now - self._last_run < self.refresh_interval
+            and self._reference.shape == thumb.shape
+        ):
+            current = self._crop(thumb, roi)
+            reference = self._crop(self._reference, roi)
+            self.last_diff = float(cv2.absdiff(current, reference).mean())
+            skip = self.last_diff < self.threshold
+        if skip:
+            self.skips += 1
+            self.saved_seconds += max(float(cost), 0.0)
+        if self.telemetry is not None:
+            self.telemetry.count(f"{self.name}.{'skip' if skip else 'pass'}")
+            self.telemetry.gauge(f"{self.name}.skip_rate", self.skip_rate())
+            self.telemetry.gauge(f"{self.name}.saved_s", round(self.saved_seconds, 3))
+        return skip
+
+    def mark_ran(self, thumb, now):
+        self._reference = thumb
+        self._last_run = float(now)
+
+    def skip_rate(self):
+        if self.checks == 0:
+            return 0.0
+        return self.skips / self.checks
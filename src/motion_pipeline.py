@@ -0,0 +1,248 @@
+"""Cursor target post-processing as a chain of timed stages.
+
+The mode-specific target (hand, head, gaze, tilt) comes from ``main.py``;
+everything after it runs through a ``MotionPipeline``: acceleration, the
+One Euro filter pair, ``MotionSmoother``, latency prediction, clamping to
+the monitor and the hand-off to ``MouseDriver``. Each stage has the same
+``process(sample, t)`` interface and returns the (possibly new) sample, or
+None to stop the chain. The pipeline times every stage and keeps its last
+output, so the same object can be profiled live or fed recorded samples
+offline with ``replay``. A leading ``RecordStage`` saves the raw targets
+for ``benchmarks.filter_sweep``.
+"""
+
+import os
+import time
+from collections import namedtuple
+
+
+_SampleBase = namedtuple("MotionSample", "x y accelerate precision predict")
+
+
+class MotionSample(_SampleBase):
+    """Target position plus the per-frame flags stages need.
+
+    ``predict`` is False for targets built as the driver position plus a
+    delta: those already start from the lead of the previous frame, so
+    leading them again would compound.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, x, y, accelerate=True, precision=False, predict=True):
+        return super().__new__(
+            cls, float(x), float(y), bool(accelerate), bool(precision), bool(predict)
+        )
+
+    def moved(self, x, y):
+        return self._replace(x=float(x), y=float(y))
+
+
+class Stage:
+    name = "stage"
+
+    def process(self, sample, t):
+        raise NotImplementedError
+
+    def reset(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class RecordStage(Stage):
+    """Pass-through that appends each input sample to a CSV for offline sweeps."""
+
+    name = "record"
+    HEADER = "t,x,y,accelerate,precision\n"
+
+    def __init__(self, path):
+        self.path = path
+        self._handle = None
+
+    def process(self, sample, t):
+        if self._handle is None:
+            new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            self._handle = open(self.path, "a", encoding="utf-8")
+            if new_file:
+                self._handle.write(self.HEADER)
+        self._handle.write(
+            f"{t!r},{sample.x!r},{sample.y!r},{int(sample.accelerate)},{int(sample.precision)}\n"
+        )
+        return sample
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class AdaptiveCutoffStage(Stage):
+    """Pass-through that retunes the One Euro ``min_cutoff`` from measured noise."""
+
+    name = "adaptive_cutoff"
+
+    def __init__(self, adaptive, filters):
+        self.adaptive = adaptive
+        self.filters = filters
+
+    def process(self, sample, t):
+        cutoff = self.adaptive.update(sample.x, sample.y, t)
+        for one_euro in self.filters:
+            one_euro.min_cutoff = cutoff
+        return sample
+
+
+class AccelStage(Stage):
+    name = "accel"
+
+    def __init__(self, accelerator):
+        self.accelerator = accelerator
+
+    def process(self, sample, t):
+        if not sample.accelerate:
+            return sample
+        return sample.moved(*self.accelerator.apply(sample.x, sample.y, t))
+
+    def reset(self):
+        self.accelerator.reset()
+
+
+class OneEuroStage(Stage):
+    name = "one_euro"
+
+    def __init__(self, filter_x, filter_y):
+        self.filter_x = filter_x
+        self.filter_y = filter_y
+
+    def process(self, sample, t):
+        return sample.moved(self.filter_x.filter(sample.x, t), self.filter_y.filter(sample.y, t))
+
+    def reset(self):
+        self.filter_x.last_time = None
+        self.filter_y.last_time = None
+
+
+class SmootherStage(Stage):
+    name = "smoother"
+
+    def __init__(self, smoother):
+        self.smoother = smoother
+
+    def process(self, sample, t):
+        return sample.moved(*self.smoother.apply(sample.x, sample.y, t, precision=sample.precision))
+
+    def reset(self):
+        self.smoother.reset()
+
+
+class PredictStage(Stage):
+    """Leads the target by its age; ``t`` is the capture time of the sample."""
+
+    name = "predict"
+
+    def __init__(self, predictor, clock=time.time):
+        self.predictor = predictor
+        self.clock = clock
+
+    def process(self, sample, t):
+        if not sample.predict:
+            self.predictor.reset()
+            self.predictor.last_horizon = 0.0
+            return sample
+        return sample.moved(*self.predictor.apply(sample.x, sample.y, t, self.clock()))
+
+    def reset(self):
+        self.predictor.reset()
+
+
+class ClampStage(Stage):
+    name = "clamp"
+
+    def __init__(self, left, top, width, height):
+        self.bounds = (left, top, width, height)
+
+    def process(self, sample, t):
+        left, top, width, height = self.bounds
+        return sample.moved(
+            max(left, min(sample.x, left + width - 1)),
+            max(top, min(sample.y, top + height - 1)),
+        )
+
+
+class DriverStage(Stage):
+    name = "driver"
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def process(self, sample, t):
+        self.driver.update_target(sample.x, sample.y, timestamp=t)
+        return sample
+
+
+class MotionPipeline:
+    def __init__(self, stages, telemetry=None, observer=None, clock=time.perf_counter):
+        self.stages = list(stages)
+        self.telemetry = telemetry
+        self.observer = observer
+        self.clock = clock
+        # name -> [calls, total seconds, last seconds]
+        self.timings = {}
+        self.outputs = {}
+
+    def stage(self, name):
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        raise KeyError(name)
+
+    def without(self, *names):
+        """Copy of this pipeline minus the named stages (e.g. "driver" for replay)."""
+        return MotionPipeline(
+            [stage for stage in self.stages if stage.name not in names],
+            telemetry=self.telemetry,
+            observer=self.observer,
+            clock=self.clock,
+        )
+
+    def reset(self):
+        for stage in self.stages:
+            stage.reset()
+        self.outputs.clear()
+
+    def close(self):
+        for stage in self.stages:
+            stage.close()
+
+    def process(self, sample, t):
+        for stage in self.stages:
+            start = self.clock()
+            sample = stage.process(sample, t)
+            elapsed = self.clock() - start
+            stat = self.timings.get(stage.name)
+            if stat is None:
+                stat = [0, 0.0, 0.0]
+                self.timings[stage.name] = stat
+            stat[0] += 1
+            stat[1] += elapsed
+            stat[2] = elapsed
+            if self.telemetry is not None:
+                self.telemetry.timing(f"pipeline.{stage.name}", elapsed)
+            self.outputs[stage.name] = sample
+            if self.observer is not None:
+                self.observer(stage.name, sample, t)
+            if sample is None:
+                return None
+        return sample
+
+    def replay(self, samples):
+        """Run recorded ``(sample, t)`` pairs; returns the final output of each."""
+        return [self.process(sample, t) for sample, t in samples]
+
+    def average_ms(self):
+        return {
+            name: (total / calls) * 1000.0 if calls else 0.0
+            for name, (calls, total, _) in self.timings.items()
+        }
@@ -2,6 +2,58 @@ import time
 import threading
 import math
 from src.config import Config
+from src.thread_budget import pin_current_thread
+
+
+class DeadlineScheduler:
+    """Fixed-rate ticks on absolute deadlines.
+
+    Each deadline is the previous one plus the period, so sleep overshoot
+    does not accumulate. ``wait`` sleeps until ``spin`` seconds before the
+    deadline, then spins on ``perf_counter`` for the rest, and returns the
+    measured time since the previous tick. A tick that starts a whole
+    period late counts as missed and re-anchors the schedule rather than
+    bursting to catch up.
+    """
+
+    def __init__(self, rate, spin=0.002, clock=time.perf_counter, sleep=time.sleep):
+        self.period = 1.0 / max(float(rate), 1.0)
+        self.spin = float(spin)
+        self.clock = clock
+        self.sleep = sleep
+        self.ticks = 0
+        self.missed = 0
+        # Running mean of measured dt, for the achieved rate.
+        self.mean_dt = self.period
+        self._deadline = None
+        self._last = None
+
+    def wait(self):
+        now = self.clock()
+        if self._deadline is None:
+            self._deadline = now
+            self._last = now
+            return self.period
+        self._deadline += self.period
+        if now - self._deadline >= self.period:
+            self.missed += 1
+            self._deadline = now
+        else:
+            remaining = self._deadline - now - self.spin
+            if remaining > 0.0:
+                self.sleep(remaining)
+            while self.clock() < self._deadline:
+                # sleep(0) releases the GIL so the camera loop is not starved.
+                self.sleep(0)
+            now = self.clock()
+        dt = now - self._last
+        self._last = now
+        self.ticks += 1
+        self.mean_dt += (dt - self.mean_dt) * 0.02
+        return dt
+
+    def rate(self):
+        return 1.0 / self.mean_dt if self.mean_dt > 0.0 else 0.0
 
 
 class MouseDriver:
@@ -31,7 +83,21 @@ class MouseDriver:
         self.coast_window = getattr(Config, "COAST_WINDOW", 0.4)
         self.override_dist = getattr(Config, "MOUSE_OVERRIDE_DIST", 80.0)
         self.override_timeout = getattr(Config, "MOUSE_OVERRIDE_TIMEOUT", 1.0)
+        self.subpixel = getattr(Config, "MOUSE_SUBPIXEL", True)
+        self.scheduler = DeadlineScheduler(
+            self.refresh_rate, spin=getattr(Config, "MOUSE_SPIN_SECONDS", 0.002)
+        )
+        # Skip moves that land on the pixel already sent, and read the real
+        # position only when it can matter (see ``_should_read``).
+        self.coalesce = getattr(Config, "MOUSE_COALESCE", True)
+        self.idle_read_max = getattr(Config, "MOUSE_IDLE_READ_MAX", 0.25)
         self._override_until = 0.0
+        self._sent_px = None
+        self._moved = False
+        self._target_changed = False
+        self._resume_pending = False
+        self._last_read = None
+        self._read_interval = 0.0
 
     def set_snap_controller(self, snap_controller):
         """Set the snap controller reference for offset calculation."""
@@ -56,6 +122,7 @@ class MouseDriver:
     def resume(self):
         with self.lock:
             self.paused = False
+            self._resume_pending = True
 
     def update_target(self, x, y, timestamp=None):
         with self.lock:
@@ -63,6 +130,12 @@ class MouseDriver:
                 self.curr_x = x
                 self.curr_y = y
 
+            if (
+                self.target_x is None
+                or abs(x - self.target_x) >= 0.5
+                or abs(y - self.target_y) >= 0.5
+            ):
+                self._target_changed = True
             self.target_x = x
             self.target_y = y
             self.last_update_time = time.time() if timestamp is None else float(timestamp)
@@ -75,6 +148,21 @@ class MouseDriver:
                 return float(real_x), float(real_y)
             return float(self.curr_x), float(self.curr_y)
 
+    def _resync(self, curr_x, curr_y, real_x, real_y):
+        """Position to continue from when taking the real cursor back.
+
+        The real position is whole pixels; if it is still the pixel we put
+        the cursor on, keep the float position so its fraction is not lost.
+        """
+        if (
+            self.subpixel
+            and curr_x is not None
+            and abs(real_x - curr_x) < 1.0
+            and abs(real_y - curr_y) < 1.0
+        ):
+            return curr_x, curr_y
+        return real_x, real_y
+
     def step(self, now, real_x, real_y, dt):
         # Single lock acquisition to read all state
         with self.lock:
@@ -83,8 +171,22 @@ class MouseDriver:
             curr_x, curr_y = self.curr_x, self.curr_y
             last_update = self.last_update_time
             vel_x, vel_y = self.vel_x, self.vel_y
+            resuming = self._resume_pending and not is_paused
+            self._resume_pending = self._resume_pending and not resuming
+        self._moved = False
+
+        if resuming and curr_x is not None:
+            # Reads were sparse while paused; take the cursor from where it is now.
+            curr_x, curr_y = self._resync(curr_x, curr_y, real_x, real_y)
+            target_x, target_y = curr_x, curr_y
+            vel_x = vel_y = 0.0
+            with self.lock:
+                self.curr_x = self.target_x = curr_x
+                self.curr_y = self.target_y = curr_y
+                self.vel_x = self.vel_y = 0.0
 
         if is_paused:
+            real_x, real_y = self._resync(curr_x, curr_y, real_x, real_y)
             with self.lock:
                 self.curr_x = real_x
                 self.curr_y = real_y
@@ -109,6 +211,7 @@ class MouseDriver:
             return
 
         if now < self._override_until:
+            real_x, real_y = self._resync(curr_x, curr_y, real_x, real_y)
             with self.lock:
                 self.curr_x = real_x
                 self.curr_y = real_y
@@ -129,8 +232,10 @@ class MouseDriver:
             vx = diff_x * self.speed_coeff
             vy = diff_y * self.speed_coeff
 
-            move_x = vx * dt
-            move_y = vy * dt
+            # dt is measured, so a late tick must not step past the target.
+            gain = min(self.speed_coeff * dt, 1.0)
+            move_x = diff_x * gain
+            move_y = diff_y * gain
 
             curr_x += move_x
             curr_y += move_y
@@ -163,15 +268,63 @@ class MouseDriver:
             self.vel_x = vel_x
             self.vel_y = vel_y
 
+        if self.coalesce:
+            if self.subpixel:
+                pixel = (math.floor(curr_x + 0.5), math.floor(curr_y + 0.5))
+            else:
+                pixel = (int(curr_x), int(curr_y))
+            if pixel == self._sent_px:
+                return
+            self._sent_px = pixel
+        self._moved = True
         self.controller.move(curr_x, curr_y)
 
+    def _should_read(self, now):
+        """Whether this tick needs the real cursor position.
+
+        Override detection compares the real cursor with where the driver
+        put it, which only matters around moves: every tick while moving,
+        and before the first move towards a new target. At rest, nothing is
+        written, so the real position is polled at an interval that doubles
+        while it matches, up to ``idle_read_max``, and drops back to every
+        tick once someone else moves the cursor.
+        """
+        if not self.coalesce or self.curr_x is None or self._last_read is None:
+            return True
+        if self._moved or self._target_changed or self._resume_pending:
+            return True
+        return now - self._last_read >= self._read_interval
+
+    def tick(self, now, dt):
+        """One driver tick: read the real position if needed, then ``step``."""
+        if self._should_read(now):
+            real_x, real_y = self.controller.get_position()
+            with self.lock:
+                curr_x, curr_y = self.curr_x, self.curr_y
+                self._target_changed = False
+            if curr_x is None or self._moved:
+                self._read_interval = 0.0
+            elif abs(real_x - curr_x) < 1.0 and abs(real_y - curr_y) < 1.0:
+                self._read_interval = min(
+                    max(self._read_interval * 2.0, dt), self.idle_read_max
+                )
+            else:
+                # Moved by someone else. Past override_dist step() hands the
+                # cursor over; short of it the driver keeps its position, so
+                # the pixel must be sent again even though it did not change.
+                self._read_interval = 0.0
+                self._sent_px = None
+            self._last_read = now
+        else:
+            # Nothing was written since the last read: assume it is still ours.
+            with self.lock:
+                real_x, real_y = self.curr_x, self.curr_y
+        self.step(now, real_x, real_y, dt)
+
     def _loop(self):
-        dt = 1.0 / self.refresh_rate
+        pin_current_thread("service")
         while self.running:
-            start_time = time.time()
+            dt = self.scheduler.wait()
+            # Wall time, to compare with frame timestamps from update_target.
             now = time.time()
-            real_x, real_y = self.controller.get_position()
-            self.step(now, real_x, real_y, dt)
-            elapsed = time.time() - start_time
-            sleep_time = max(0, dt - elapsed)
-            time.sleep(sleep_time)
+            self.tick(now, dt)
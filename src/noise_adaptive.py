@@ -0,0 +1,97 @@
+import math
+
+
+class AdaptiveCutoff:
+    """Chooses the One Euro ``min_cutoff`` from the measured target noise.
+
+    Noise is read from the second difference of the target, which removes
+    steady motion; for white noise of std ``s`` its variance is ``6 s^2``.
+    Samples only count while the target is at rest, judged scale-free: the
+    per-frame displacement energy must be explained by noise alone
+    (first-difference variance of noise is ``2 s^2``).
+
+    A first-order low-pass at cutoff ``fc`` leaves roughly
+    ``s * sqrt(pi * fc * dt)`` of jitter, so the cutoff that holds a resting
+    cursor at ``target_jitter`` pixels is ``target^2 / (pi * s^2 * dt)``,
+    clamped to ``[min_cutoff, max_cutoff]``. Clean input gets a high cutoff
+    (little lag); noisy input gets more smoothing.
+    """
+
+    def __init__(
+        self,
+        target_jitter=0.5,
+        min_cutoff=0.3,
+        max_cutoff=3.0,
+        noise_seconds=2.0,
+        rest_seconds=0.2,
+        initial_cutoff=1.0,
+        warmup=10,
+        telemetry=None,
+    ):
+        self.target_jitter = float(target_jitter)
+        self.min_cutoff = float(min_cutoff)
+        self.max_cutoff = float(max_cutoff)
+        self.noise_seconds = float(noise_seconds)
+        self.rest_seconds = float(rest_seconds)
+        self.initial_cutoff = float(initial_cutoff)
+        self.warmup = int(warmup)
+        self.telemetry = telemetry
+        self.reset()
+
+    def reset(self):
+        self._points = []
+        self._d1 = 0.0
+        self._d2 = 0.0
+        self._noise_var = 0.0
+        self._dt = None
+        self.rest_samples = 0
+        self.resting = False
+        self.noise = None
+        self.cutoff = self.initial_cutoff
+
+    @staticmethod
+    def _blend(value, sample, dt, seconds):
+        return value + (sample - value) * min(1.0, dt / seconds)
+
+    def update(self, x, y, t):
+        """Feed one target sample; returns the cutoff to use now."""
+        self._points.append((float(x), float(y), float(t)))
+        if len(self._points) < 3:
+            return self.cutoff
+        del self._points[:-3]
+        (x0, y0, _), (x1, y1, t1), (x2, y2, t2) = self._points
+        dt = max(t2 - t1, 1e-6)
+        self._dt = dt if self._dt is None else self._blend(self._dt, dt, dt, 1.0)
+
+        d1 = (x2 - x1) ** 2 + (y2 - y1) ** 2
+        d2 = (x2 - 2.0 * x1 + x0) ** 2 + (y2 - 2.0 * y1 + y0) ** 2
+        self._d1 = self._blend(self._d1, d1, dt, self.rest_seconds)
+        self._d2 = self._blend(self._d2, d2, dt, self.rest_seconds)
+        # At rest E[d1] = 2s^2 and E[d2] = 6s^2; motion inflates d1 far more.
+        self.resting = self._d1 <= 1.5 * self._d2 / 3.0
+        if not self.resting:
+            return self.cutoff
+
+        self.rest_samples += 1
+        if self.rest_samples == 1:
+            self._noise_var = d2 / 6.0
+        else:
+            self._noise_var = self._blend(self._noise_var, d2 / 6.0, dt, self.noise_seconds)
+        # Per axis: d2 above sums both axes.
+        self.noise = math.sqrt(max(self._noise_var, 0.0) / 2.0)
+        if self.rest_samples < self.warmup:
+            return self.cutoff
+
+        if self.noise <= 1e-9:
+            wanted = self.max_cutoff
+        else:
+            wanted = self.target_jitter**2 / (math.pi * self.noise**2 * self._dt)
+        wanted = max(self.min_cutoff, min(self.max_cutoff, wanted))
+        # Glide in log space so a brief burst of noise does not pump the filter.
+        self.cutoff = math.exp(
+            self._blend(math.log(self.cutoff), math.log(wanted), dt, self.rest_seconds * 2.0)
+        )
+        if self.telemetry is not None:
+            self.telemetry.gauge("smoothing.noise_px", round(self.noise, 3))
+            self.telemetry.gauge("smoothing.cutoff_hz", round(self.cutoff, 3))
+        return self.cutoff
@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 
 class LowPassFilter:
     def __init__(self, alpha, init_value=0.0):
@@ -48,3 +50,65 @@ class OneEuroFilter:
         cutoff = self.min_cutoff + self.beta * abs(edx)
         alpha = self._alpha(cutoff, dt)
         return self.x_filter.apply(value, alpha)
+
+
+class OneEuroBank:
+    """``OneEuroFilter`` over an N-channel vector sharing one timestamp.
+
+    Each channel follows the scalar filter exactly, but all channels update
+    in a single NumPy step. ``min_cutoff``, ``beta`` and ``d_cutoff`` take a
+    scalar or one value per channel.
+    """
+
+    def __init__(self, size, min_cutoff=1.0, beta=0.0, d_cutoff=1.0):
+        self.size = int(size)
+        self.set_params(min_cutoff, beta, d_cutoff)
+        self.x = np.zeros(self.size, dtype=np.float64)
+        self.dx = np.zeros(self.size, dtype=np.float64)
+        self.last_time = None
+        self._initialized = False
+
+    def set_params(self, min_cutoff=None, beta=None, d_cutoff=None):
+        if min_cutoff is not None:
+            self.min_cutoff = self._channels(min_cutoff)
+        if beta is not None:
+            self.beta = self._channels(beta)
+        if d_cutoff is not None:
+            self.d_cutoff = self._channels(d_cutoff)
+
+    def _channels(self, value):
+        array = np.asarray(value, dtype=np.float64)
+        return np.broadcast_to(array, (self.size,)).copy()
+
+    def reset(self):
+        self.last_time = None
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def filter(self, values, timestamp):
+        values = np.asarray(values, dtype=np.float64).reshape(self.size)
+        if self.last_time is None:
+            # Like the scalar filter, the first sample only anchors time.
+            self.last_time = timestamp
+            self._initialized = False
+            return values.copy()
+
+        dt = max(timestamp - self.last_time, 1e-6)
+        self.last_time = timestamp
+
+        if not self._initialized:
+            self._initialized = True
+            self.dx[:] = 0.0
+            self.x[:] = values
+            return values.copy()
+
+        dx = (values - self.x) / dt
+        alpha_d = self._alpha(self.d_cutoff, dt)
+        self.dx = alpha_d * dx + (1.0 - alpha_d) * self.dx
+        cutoff = self.min_cutoff + self.beta * np.abs(self.dx)
+        alpha = self._alpha(cutoff, dt)
+        self.x = alpha * values + (1.0 - alpha) * self.x
+        return self.x.copy()
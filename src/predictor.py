@@ -0,0 +1,99 @@
+import math
+
+
+class LatencyPredictor:
+    """Extrapolates the smoothed cursor target forward by the pipeline latency.
+
+    An alpha-beta filter tracks position and velocity of the target at the
+    camera capture times. ``predict`` then pushes the position ahead by the
+    age of the sample (capture to now) plus ``extra_latency`` for the parts
+    that timestamps cannot see: exposure/driver buffering and the
+    ``MouseDriver`` approach. ``gain`` is the fraction of that latency to
+    compensate and ``max_horizon`` caps it.
+
+    Two dampers keep the lead from doing harm: below ``min_speed`` the
+    velocity fades out so a resting cursor is not jittered, and while the
+    target decelerates the lead shrinks in proportion to ``damping`` so the
+    cursor does not run past the end of a reach.
+    """
+
+    def __init__(
+        self,
+        alpha=0.6,
+        beta=0.15,
+        gain=0.7,
+        max_horizon=0.12,
+        extra_latency=0.04,
+        min_speed=60.0,
+        damping=4.0,
+        reset_gap=0.25,
+    ):
+        self.alpha = float(alpha)
+        self.beta = float(beta)
+        self.gain = float(gain)
+        self.max_horizon = float(max_horizon)
+        self.extra_latency = float(extra_latency)
+        self.min_speed = float(min_speed)
+        self.damping = float(damping)
+        self.reset_gap = float(reset_gap)
+        self.last_horizon = 0.0
+        self.reset()
+
+    def reset(self):
+        self._x = None
+        self._y = None
+        self._vx = 0.0
+        self._vy = 0.0
+        self._ax = 0.0
+        self._ay = 0.0
+        self._time = None
+
+    def update(self, x, y, sample_time):
+        """Feed a measurement taken at ``sample_time`` (camera clock)."""
+        sample_time = float(sample_time)
+        if self._time is None or not 0.0 < sample_time - self._time <= self.reset_gap:
+            self._x, self._y = float(x), float(y)
+            self._vx = self._vy = 0.0
+            self._ax = self._ay = 0.0
+            self._time = sample_time
+            return
+        dt = sample_time - self._time
+        self._time = sample_time
+        pred_x = self._x + self._vx * dt
+        pred_y = self._y + self._vy * dt
+        rx = x - pred_x
+        ry = y - pred_y
+        self._x = pred_x + self.alpha * rx
+        self._y = pred_y + self.alpha * ry
+        dvx = self.beta * rx / dt
+        dvy = self.beta * ry / dt
+        self._vx += dvx
+        self._vy += dvy
+        # Acceleration is only used to detect braking; a light average is enough.
+        self._ax = 0.5 * self._ax + 0.5 * dvx / dt
+        self._ay = 0.5 * self._ay + 0.5 * dvy / dt
+
+    def velocity(self):
+        return self._vx, self._vy
+
+    def predict(self, x, y, now):
+        """Position to send at wall time ``now`` for the measurement ``(x, y)``."""
+        self.last_horizon = 0.0
+        if self._time is None or self.gain <= 0.0:
+            return x, y
+        speed_sq = self._vx * self._vx + self._vy * self._vy
+        if speed_sq <= 0.0:
+            return x, y
+        age = max(float(now) - self._time, 0.0)
+        horizon = min(self.gain * (age + self.extra_latency), self.max_horizon)
+        horizon *= speed_sq / (speed_sq + self.min_speed * self.min_speed)
+        speed = math.sqrt(speed_sq)
+        along = (self._ax * self._vx + self._ay * self._vy) / speed
+        if along < 0.0:
+            horizon *= max(0.0, 1.0 + self.damping * along * horizon / speed)
+        self.last_horizon = horizon
+        return x + self._vx * horizon, y + self._vy * horizon
+
+    def apply(self, x, y, sample_time, now):
+        self.update(x, y, sample_time)
+        return self.predict(x, y, now)
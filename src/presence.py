@@ -0,0 +1,99 @@
+import time
+
+
+class PresenceMonitor:
+    """Tracks whether anyone is in front of the camera.
+
+    After ``sleep_after`` seconds without a face or hand the monitor enters
+    SLEEP; the first positive probe returns it to ACTIVE. Wall time and
+    process CPU time are accumulated per state so the power saving can be
+    measured.
+    """
+
+    ACTIVE = "ACTIVE"
+    SLEEP = "SLEEP"
+
+    def __init__(
+        self,
+        sleep_after=30.0,
+        telemetry=None,
+        event_log=None,
+        cpu_clock=time.process_time,
+    ):
+        self.sleep_after = float(sleep_after)
+        self.telemetry = telemetry
+        self.event_log = event_log
+        self.cpu_clock = cpu_clock
+        self.state = self.ACTIVE
+        self.last_seen = None
+        self.state_seconds = {self.ACTIVE: 0.0, self.SLEEP: 0.0}
+        self.cpu_seconds = {self.ACTIVE: 0.0, self.SLEEP: 0.0}
+        self._last_time = None
+        self._last_cpu = None
+
+    @property
+    def sleeping(self):
+        return self.state == self.SLEEP
+
+    def _account(self, now):
+        cpu = self.cpu_clock()
+        if self._last_time is not None:
+            self.state_seconds[self.state] += max(now - self._last_time, 0.0)
+            self.cpu_seconds[self.state] += max(cpu - self._last_cpu, 0.0)
+        self._last_time = now
+        self._last_cpu = cpu
+        if self.telemetry is not None:
+            key = self.state.lower()
+            self.telemetry.gauge(
+                f"presence.{key}.seconds", round(self.state_seconds[self.state], 1)
+            )
+            self.telemetry.gauge(f"presence.{key}.cpu_pct", round(self.cpu_percent(), 1))
+
+    def _enter(self, state, now):
+        self.state = state
+        if self.event_log is not None:
+            self.event_log.add(f"PRESENCE_{state}", now)
+        if self.telemetry is not None:
+            self.telemetry.count(f"presence.{state.lower()}")
+
+    def cpu_percent(self, state=None):
+        """Average CPU use (percent of one core) while in ``state``."""
+        state = self.state if state is None else state
+        wall = self.state_seconds[state]
+        if wall <= 0.0:
+            return 0.0
+        return 100.0 * self.cpu_seconds[state] / wall
+
+    def update(self, present, now, confirm=None):
+        """Feed one observation; ``present`` is None when nothing was probed.
+
+        ``confirm`` is an optional probe called before falling asleep, so a
+        user who is only resting their hand is not put to sleep. Returns True
+        when the state changed.
+        """
+        now = float(now)
+        self._account(now)
+        if self.last_seen is None or present:
+            self.last_seen = now
+        if self.state == self.SLEEP:
+            if present:
+                self._enter(self.ACTIVE, now)
+                return True
+            return False
+        if self.sleep_after > 0 and now - self.last_seen >= self.sleep_after:
+            if confirm is not None and confirm():
+                self.last_seen = now
+                return False
+            self._enter(self.SLEEP, now)
+            return True
+        return False
+
+    def wake(self, now):
+        """Leave SLEEP without a probe (e.g. the user pressed a key)."""
+        now = float(now)
+        self._account(now)
+        self.last_seen = now
+        if self.state == self.SLEEP:
+            self._enter(self.ACTIVE, now)
+            return True
+        return False
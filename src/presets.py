@@ -110,6 +110,29 @@ PRESETS: dict[str, Preset] = {
             "MOUSE_SPEED_COEFF": 28.0,
         },
     ),
+    "glide": Preset(
+        name="glide",
+        description="Curve-defined response: flat micro zone, long smooth ramp.",
+        overrides={
+            "HEAD_SPEED_CURVE": (
+                (0.0, 0.0),
+                (0.04, 30.0),
+                (0.12, 180.0),
+                (0.3, 700.0),
+                (0.6, 1600.0),
+                (1.0, 2600.0),
+            ),
+            "ACCEL_CURVE": (
+                (0.0, 1.0),
+                (200.0, 1.0),
+                (600.0, 1.5),
+                (1200.0, 2.6),
+                (2000.0, 3.6),
+                (3000.0, 4.0),
+            ),
+            "MOUSE_SPEED_COEFF": 38.0,
+        },
+    ),
     # Previous defaults (kept for quick A/B).
     "legacy": Preset(
         name="legacy",
@@ -127,7 +150,22 @@ PRESETS: dict[str, Preset] = {
     ),
 }
 
-PRESET_ORDER = ["precision", "balanced", "fast", "turbo", "swift", "snappy", "stable", "legacy"]
+PRESET_ORDER = [
+    "precision",
+    "balanced",
+    "fast",
+    "turbo",
+    "swift",
+    "snappy",
+    "stable",
+    "glide",
+    "legacy",
+]
+
+# Curves replace the constant-driven response entirely, so a preset that
+# does not define one goes back to whatever the config itself set (usually
+# no curve). Those values are recorded the first time a preset is applied.
+CURVE_KEYS = ("ACCEL_CURVE", "HEAD_SPEED_CURVE")
 
 
 def apply_preset(config, preset_name: str | None) -> str:
@@ -136,6 +174,13 @@ def apply_preset(config, preset_name: str | None) -> str:
         resolved = DEFAULT_PRESET_NAME
     preset = PRESETS[resolved]
 
+    defaults = vars(config).get("_CURVE_DEFAULTS")
+    if defaults is None:
+        defaults = {key: getattr(config, key) for key in CURVE_KEYS if hasattr(config, key)}
+        setattr(config, "_CURVE_DEFAULTS", defaults)
+    for key, value in defaults.items():
+        if key not in preset.overrides:
+            setattr(config, key, value)
     for key, value in preset.overrides.items():
         setattr(config, key, value)
 
@@ -0,0 +1,151 @@
+"""Order statistics over the last few seconds of a scalar signal."""
+
+import heapq
+from bisect import bisect_left, insort
+from collections import deque
+
+
+class SlidingExtrema:
+    """Min and max over the last ``window`` seconds, O(1) amortized per sample.
+
+    Two monotonic deques hold (time, value) pairs: the min deque keeps values
+    increasing from the front, the max deque decreasing, so each front is the
+    current extreme and every sample is pushed and popped at most once.
+    """
+
+    def __init__(self, window):
+        self.window = float(window)
+        self._mins = deque()
+        self._maxs = deque()
+
+    def reset(self):
+        self._mins.clear()
+        self._maxs.clear()
+
+    def push(self, value, t):
+        mins = self._mins
+        maxs = self._maxs
+        while mins and mins[-1][1] >= value:
+            mins.pop()
+        mins.append((t, value))
+        while maxs and maxs[-1][1] <= value:
+            maxs.pop()
+        maxs.append((t, value))
+        cutoff = t - self.window
+        while mins[0][0] < cutoff:
+            mins.popleft()
+        while maxs[0][0] < cutoff:
+            maxs.popleft()
+        return mins[0][1], maxs[0][1]
+
+
+class SlidingPercentiles:
+    """``trim`` and ``1 - trim`` percentiles over the last ``window`` seconds.
+
+    Keeps the window sorted with ``bisect``, so a lone spike never defines the
+    range. Finding the slot is O(log n), but ``insort`` and expiry shift the
+    list, so each push is O(n) in the window length. At a few hundred samples
+    the shift is a ``memmove`` and costs less than the Python overhead around
+    it; for a plain median use ``SlidingMedian``, which is O(log n).
+    """
+
+    def __init__(self, window, trim):
+        self.window = float(window)
+        self.trim = float(trim)
+        self._order = deque()
+        self._sorted = []
+
+    def reset(self):
+        self._order.clear()
+        self._sorted.clear()
+
+    def push(self, value, t):
+        self._order.append((t, value))
+        insort(self._sorted, value)
+        cutoff = t - self.window
+        while self._order[0][0] < cutoff:
+            _, old = self._order.popleft()
+            del self._sorted[bisect_left(self._sorted, old)]
+        last = len(self._sorted) - 1
+        low = int(self.trim * last)
+        return self._sorted[low], self._sorted[last - low]
+
+
+class SlidingMedian:
+    """Median over the last ``window`` seconds, O(log n) amortized per sample.
+
+    Two heaps split the window at the median: ``_low`` (negated, a max-heap)
+    holds the smaller half and never trails ``_high`` by more than one.
+    Entries carry their arrival number, so expired ones are recognised
+    without a search: they are popped when they reach the top of their heap,
+    and a heap that is more than half expired is rebuilt, which keeps memory
+    bounded by the window. With an even count the two middle values are
+    averaged.
+    """
+
+    def __init__(self, window):
+        self.window = float(window)
+        self._times = deque()
+        self._low = []
+        self._high = []
+        self._low_size = 0
+        self._high_size = 0
+        self._next = 0
+
+    def reset(self):
+        self._times.clear()
+        self._low.clear()
+        self._high.clear()
+        self._low_size = 0
+        self._high_size = 0
+        self._next = 0
+
+    def push(self, value, t):
+        entry = (value, self._next)
+        self._next += 1
+        self._times.append((t, entry))
+        if not self._low or entry < (-self._low[0][0], -self._low[0][1]):
+            heapq.heappush(self._low, (-value, -entry[1]))
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, entry)
+            self._high_size += 1
+        self._balance()
+        cutoff = t - self.window
+        while self._times[0][0] < cutoff:
+            _, old = self._times.popleft()
+            # Balanced with the newest sample still in, so _low has a live top.
+            if old <= (-self._low[0][0], -self._low[0][1]):
+                self._low_size -= 1
+            else:
+                self._high_size -= 1
+            self._balance()
+        if self._low_size > self._high_size:
+            return -self._low[0][0]
+        return (self._high[0][0] - self._low[0][0]) * 0.5
+
+    def _prune(self, heap, size):
+        """Drop expired entries from the top of ``heap``, or all of them."""
+        oldest = self._next - len(self._times)
+        if len(heap) > 2 * size + 16:
+            heap[:] = [item for item in heap if abs(item[1]) >= oldest]
+            heapq.heapify(heap)
+        while heap and abs(heap[0][1]) < oldest:
+            heapq.heappop(heap)
+
+    def _balance(self):
+        # One push or one expiry moves the sizes by one, so one move rebalances.
+        if self._low_size > self._high_size + 1:
+            self._prune(self._low, self._low_size)
+            value, seq = heapq.heappop(self._low)
+            heapq.heappush(self._high, (-value, -seq))
+            self._low_size -= 1
+            self._high_size += 1
+        elif self._low_size < self._high_size:
+            self._prune(self._high, self._high_size)
+            value, seq = heapq.heappop(self._high)
+            heapq.heappush(self._low, (-value, -seq))
+            self._high_size -= 1
+            self._low_size += 1
+        self._prune(self._low, self._low_size)
+        self._prune(self._high, self._high_size)
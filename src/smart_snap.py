@@ -7,6 +7,7 @@ except Exception:
     auto = None
 
 from src.config import Config
+from src.thread_budget import pin_current_thread
 
 
 class SmartSnapper(threading.Thread):
@@ -206,6 +207,7 @@ class SmartSnapper(threading.Thread):
     def run(self):
         if not self.available:
             return
+        pin_current_thread("service")
 
         init = getattr(auto, "InitializeUIAutomationInThread", None)
         uninit = getattr(auto, "UninitializeUIAutomationInThread", None)
@@ -1,4 +1,11 @@
+import math
+
+
 class MotionSmoother:
+    # Precision sub-steps per reference frame, and a cap for long gaps.
+    PRECISION_SUBSTEPS = 4
+    MAX_SUBSTEPS = 64
+
     def __init__(
         self,
         max_speed=2600.0,
@@ -7,6 +14,7 @@ class MotionSmoother:
         precision_damping=None,
         micro_radius=None,
         micro_damping=None,
+        ref_fps=None,
     ):
         self.max_speed = float(max_speed)
         self.damping = float(damping)
@@ -14,6 +22,8 @@ class MotionSmoother:
         self.precision_damping = precision_damping
         self.micro_radius = micro_radius
         self.micro_damping = micro_damping
+        # Damping values are per frame at ``ref_fps``; None applies them per call.
+        self.ref_fps = ref_fps
         self._x = None
         self._y = None
         self._last_time = None
@@ -33,16 +43,37 @@ class MotionSmoother:
         dt = max(float(timestamp) - self._last_time, 1e-6)
         self._last_time = float(timestamp)
 
-        dx = x - self._x
-        dy = y - self._y
+        ref_fps = float(self.ref_fps) if self.ref_fps else 0.0
+        substeps = 1
+        if precision and ref_fps:
+            # Precision damping depends on the distance left, which shrinks
+            # within a call. Sub-step on a grid tied to ref_fps so the rate
+            # does not decide which damping applies.
+            substeps = min(
+                max(int(math.ceil(dt * ref_fps * self.PRECISION_SUBSTEPS - 1e-6)), 1),
+                self.MAX_SUBSTEPS,
+            )
+        h = dt / substeps
+        for _ in range(substeps):
+            dx = x - self._x
+            dy = y - self._y
 
-        max_step = self.max_speed * dt
-        step = (dx * dx + dy * dy) ** 0.5
-        if step > max_step:
-            scale = max_step / step
-            dx *= scale
-            dy *= scale
+            max_step = self.max_speed * h
+            step = (dx * dx + dy * dy) ** 0.5
+            if step > max_step:
+                scale = max_step / step
+                dx *= scale
+                dy *= scale
 
+            damping = self._damping(step, precision)
+            if ref_fps:
+                damping = 1.0 - (1.0 - damping) ** (h * ref_fps)
+            self._x += dx * damping
+            self._y += dy * damping
+        return self._x, self._y
+
+    def _damping(self, step, precision):
+        """Damping per reference frame for ``step`` pixels left to the target."""
         damping = self.damping
         if precision:
             if (
@@ -68,7 +99,4 @@ class MotionSmoother:
                     damping = self.micro_damping + (self.precision_damping - self.micro_damping) * t
                 else:
                     damping = self.precision_damping
-
-        self._x += dx * damping
-        self._y += dy * damping
-        return self._x, self._y
+        return damping
@@ -5,6 +5,8 @@ Uses a tiny always-on-top window instead of drawing on desktop.
 import threading
 import tkinter as tk
 
+from src.thread_budget import pin_current_thread
+
 
 class SnapMarker:
     """Small marker window showing snap target location."""
@@ -37,6 +39,7 @@ class SnapMarker:
     
     def _run(self):
         """Main loop."""
+        pin_current_thread("service")
         try:
             self._root = tk.Tk()
             self._root.title("")
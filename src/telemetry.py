@@ -0,0 +1,74 @@
+import json
+import time
+
+
+class Telemetry:
+    """Counters, gauges and timings, appended to ``path`` as JSON lines.
+
+    Nothing is registered at exit here: benchmarks and tests build several
+    instances. The owner calls ``close`` (``main`` also registers it with
+    ``atexit``) to write the final record.
+    """
+
+    def __init__(self, path="telemetry.log", interval=5.0):
+        self.path = path
+        self.interval = float(interval)
+        self._counters = {}
+        self._gauges = {}
+        self._timings = {}
+        self._last_flush = None
+        self._closed = False
+
+    def count(self, name, value=1):
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def gauge(self, name, value):
+        self._gauges[name] = value
+
+    def timing(self, name, seconds):
+        stat = self._timings.get(name)
+        if stat is None:
+            stat = [0, 0.0, 0.0]
+            self._timings[name] = stat
+        stat[0] += 1
+        stat[1] += seconds
+        if seconds > stat[2]:
+            stat[2] = seconds
+
+    def snapshot(self):
+        timings = {}
+        for name, (count, total, peak) in self._timings.items():
+            timings[name] = {
+                "count": count,
+                "avg_ms": (total / count) * 1000.0 if count else 0.0,
+                "max_ms": peak * 1000.0,
+            }
+        return {
+            "counters": dict(self._counters),
+            "gauges": dict(self._gauges),
+            "timings": timings,
+        }
+
+    def tick(self, now=None):
+        now = time.time() if now is None else float(now)
+        if self._last_flush is None:
+            self._last_flush = now
+            return
+        if self.interval > 0 and now - self._last_flush >= self.interval:
+            self.flush(now)
+
+    def flush(self, now=None):
+        now = time.time() if now is None else float(now)
+        self._last_flush = now
+        if self._closed or not self.path or not (self._counters or self._gauges or self._timings):
+            return
+        record = {"time": round(now, 3)}
+        record.update(self.snapshot())
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record) + "\n")
+
+    def close(self):
+        """Write the final record; later flushes and closes do nothing."""
+        if not self._closed:
+            self.flush()
+            self._closed = True
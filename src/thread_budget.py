@@ -0,0 +1,121 @@
+"""Startup CPU thread budget for OpenCV, BLAS, inference and service threads.
+
+Kept free of numpy/cv2 imports so ``limit_blas_threads`` can run before
+numpy loads its BLAS pool.
+"""
+
+import os
+from dataclasses import dataclass
+
+
+BLAS_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+)
+
+
+@dataclass(frozen=True)
+class ThreadBudget:
+    cores: int
+    opencv_threads: int
+    blas_threads: int
+    # Main loop and detector loading; MediaPipe's inference pool inherits these.
+    inference_cores: tuple
+    # Camera capture, mouse driver, snapper and overlay threads.
+    service_cores: tuple
+    pinning: bool = False
+
+    def cores_for(self, role):
+        return self.service_cores if role == "service" else self.inference_cores
+
+
+_active_budget = None
+
+
+def limit_blas_threads(count=1):
+    """Cap BLAS/OpenMP pools unless the user already set them. Call before numpy loads.
+
+    ``count`` <= 0 leaves the libraries at their defaults.
+    """
+    if count <= 0:
+        return
+    for name in BLAS_ENV_VARS:
+        os.environ.setdefault(name, str(int(count)))
+
+
+def plan_thread_budget(
+    core_count, mode, blink_enabled=True, long_blink_enabled=True, pinning=False
+):
+    """Split ``core_count`` cores between inference and service threads for ``mode``."""
+    from src.frame_schedule import detectors_needed
+
+    cores = max(1, int(core_count or os.cpu_count() or 1))
+    hand_needed, face_needed = detectors_needed(mode, blink_enabled, long_blink_enabled)
+    # Camera, mouse driver, snapper and overlay are light; they share a core
+    # once there are enough to spare one.
+    service = 0
+    if cores >= 8:
+        service = 2
+    elif cores >= 4:
+        service = 1
+    inference = cores - service
+    # OpenCV only resizes and converts small frames here; a large pool costs
+    # more in wake-ups than it saves, especially next to two landmarkers.
+    opencv = 1 if (hand_needed and face_needed) or cores <= 4 else 2
+    inference_cores = tuple(range(service, service + inference))
+    service_cores = tuple(range(service)) or inference_cores
+    return ThreadBudget(
+        cores=cores,
+        opencv_threads=opencv,
+        blas_threads=1,
+        inference_cores=inference_cores,
+        service_cores=service_cores,
+        pinning=bool(pinning),
+    )
+
+
+def _set_thread_affinity(cores):
+    if not cores:
+        return False
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        mask = 0
+        for core in cores:
+            mask |= 1 << core
+        return bool(kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), mask))
+    except Exception:
+        pass
+    try:
+        # pid 0 targets only the calling thread on Linux.
+        os.sched_setaffinity(0, cores)
+        return True
+    except Exception:
+        return False
+
+
+def pin_current_thread(role):
+    """Pin the calling thread to its role's cores when pinning is enabled."""
+    budget = _active_budget
+    if budget is None or not budget.pinning:
+        return False
+    return _set_thread_affinity(budget.cores_for(role))
+
+
+def apply_thread_budget(budget):
+    """Apply ``budget`` process-wide and pin the calling (main) thread."""
+    global _active_budget
+    import cv2
+
+    _active_budget = budget
+    cv2.setNumThreads(budget.opencv_threads)
+    pin_current_thread("inference")
+    return budget
+
+
+def active_thread_budget():
+    return _active_budget
@@ -1,19 +1,53 @@
+from src.sliding_window import SlidingExtrema, SlidingPercentiles
+
+
 class TiltMapper:
-    def __init__(self, decay=0.005, min_range=0.15):
+    def __init__(self, decay=0.005, min_range=0.15, ref_fps=None, window=0.0, trim=0.0):
         self.decay = float(decay)
         self.min_range = float(min_range)
+        # ``decay`` is per frame at ``ref_fps``; without it (or a timestamp)
+        # it is applied once per update.
+        self.ref_fps = ref_fps
+        # With ``window`` seconds the range is the extent of recent tilt
+        # instead of expand-and-decay; ``trim`` drops that fraction at each end.
+        self.window = float(window)
+        self.trim = float(trim)
+        self._range_x = self._make_range()
+        self._range_y = self._make_range()
+        self._samples = 0
+        self._last_time = None
         self.min_x = None
         self.max_x = None
         self.min_y = None
         self.max_y = None
 
+    def _make_range(self):
+        if self.window <= 0.0:
+            return None
+        if self.trim > 0.0:
+            return SlidingPercentiles(self.window, self.trim)
+        return SlidingExtrema(self.window)
+
     def reset(self):
         self.min_x = None
         self.max_x = None
         self.min_y = None
         self.max_y = None
+        self._last_time = None
+        self._samples = 0
+        if self._range_x is not None:
+            self._range_x.reset()
+            self._range_y.reset()
 
-    def update(self, tilt_x, tilt_y):
+    def update(self, tilt_x, tilt_y, timestamp=None):
+        if self._range_x is not None:
+            return self._update_window(tilt_x, tilt_y, timestamp)
+        decay = self.decay
+        if timestamp is not None:
+            if self.ref_fps and self._last_time is not None:
+                dt = max(float(timestamp) - self._last_time, 1e-6)
+                decay = 1.0 - (1.0 - decay) ** (dt * float(self.ref_fps))
+            self._last_time = float(timestamp)
         if self.min_x is None:
             self.min_x = tilt_x
             self.max_x = tilt_x
@@ -23,23 +57,36 @@ class TiltMapper:
             if tilt_x < self.min_x:
                 self.min_x = tilt_x
             else:
-                self.min_x += (tilt_x - self.min_x) * self.decay
+                self.min_x += (tilt_x - self.min_x) * decay
 
             if tilt_x > self.max_x:
                 self.max_x = tilt_x
             else:
-                self.max_x += (tilt_x - self.max_x) * self.decay
+                self.max_x += (tilt_x - self.max_x) * decay
 
             if tilt_y < self.min_y:
                 self.min_y = tilt_y
             else:
-                self.min_y += (tilt_y - self.min_y) * self.decay
+                self.min_y += (tilt_y - self.min_y) * decay
 
             if tilt_y > self.max_y:
                 self.max_y = tilt_y
             else:
-                self.max_y += (tilt_y - self.max_y) * self.decay
+                self.max_y += (tilt_y - self.max_y) * decay
+
+        nx = self._normalize(tilt_x, self.min_x, self.max_x)
+        ny = self._normalize(tilt_y, self.min_y, self.max_y)
+        return nx, ny
 
+    def _update_window(self, tilt_x, tilt_y, timestamp):
+        if timestamp is None:
+            # No clock: count samples at the reference rate instead.
+            t = self._samples / float(self.ref_fps or 30.0)
+        else:
+            t = float(timestamp)
+        self._samples += 1
+        self.min_x, self.max_x = self._range_x.push(tilt_x, t)
+        self.min_y, self.max_y = self._range_y.push(tilt_y, t)
         nx = self._normalize(tilt_x, self.min_x, self.max_x)
         ny = self._normalize(tilt_y, self.min_y, self.max_y)
         return nx, ny
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from src.accel import MotionAccelerator
+from src.curves import Curve, curve_from_config
+from src.head_motion import HeadMotion
+
+
+class CurveTests(unittest.TestCase):
+    def test_linear_hits_control_points_and_clamps(self):
+        curve = Curve([(0.0, 1.0), (100.0, 2.0), (300.0, 4.0)], "linear", resolution=301)
+        self.assertAlmostEqual(curve(100.0), 2.0)
+        self.assertAlmostEqual(curve(200.0), 3.0)
+        self.assertEqual(curve(-5.0), 1.0)
+        self.assertEqual(curve(1e6), 4.0)
+
+    def test_spline_is_monotone_between_points(self):
+        points = [(0.0, 0.0), (0.1, 50.0), (0.2, 60.0), (0.5, 900.0), (1.0, 1000.0)]
+        curve = Curve(points, "spline")
+        values = curve.evaluate(np.linspace(0.0, 1.0, 2000))
+        self.assertTrue(np.all(np.diff(values) >= -1e-9))
+        for x, y in points:
+            self.assertAlmostEqual(curve(x), y, delta=1.0)
+
+    def test_scalar_and_vector_paths_agree(self):
+        curve = Curve([(0.0, 80.0), (0.3, 500.0), (1.0, 2200.0)], "spline")
+        xs = np.random.default_rng(0).uniform(-0.2, 1.2, 500)
+        np.testing.assert_allclose(curve.evaluate(xs), [curve(x) for x in xs], rtol=1e-12)
+
+    def test_from_function_tracks_legacy_pow_curve(self):
+        legacy = MotionAccelerator(min_speed=180.0, max_speed=1600.0, max_gain=4.0, exp=1.4)
+        tabled = MotionAccelerator(
+            curve=Curve.from_function(
+                lambda s: 1.0 + min(max((s - 180.0) / 1420.0, 0.0), 1.0) ** 1.4 * 3.0, 0.0, 3000.0
+            )
+        )
+        for accel in (legacy, tabled):
+            accel.apply(0.0, 0.0, 0.0)
+        a = legacy.apply(30.0, 0.0, 1.0 / 30.0)
+        b = tabled.apply(30.0, 0.0, 1.0 / 30.0)
+        self.assertAlmostEqual(a[0], b[0], places=2)
+
+    def test_head_speed_curve_replaces_pow(self):
+        motion = HeadMotion((1920, 1080), speed_curve=Curve([(0.0, 0.0), (1.0, 1000.0)]), tilt_boost=0.0)
+        self.assertAlmostEqual(motion._scale_speed(-0.25, 0.25, 0.25), -250.0, places=3)
+
+    def test_bad_definitions(self):
+        self.assertIsNone(curve_from_config(()))
+        with self.assertRaises(ValueError):
+            Curve([(0.0, 1.0)])
+        with self.assertRaises(ValueError):
+            Curve([(0.0, 1.0), (0.0, 2.0)])
+        with self.assertRaises(ValueError):
+            Curve([(0.0, 1.0), (1.0, 2.0)], "cubic")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import threading
+import time
+import unittest
+
+from src.detector_registry import DetectorRegistry, FirstMoveTimer
+from src.telemetry import Telemetry
+
+
+class FakeDetector:
+    def __init__(self, gate=None):
+        self.warmed = False
+        if gate is not None:
+            gate.wait(2.0)
+
+    def warmup(self):
+        self.warmed = True
+
+
+class FakeLog:
+    def __init__(self):
+        self.events = []
+
+    def add(self, event, _timestamp=None):
+        self.events.append(event)
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class DetectorRegistryTests(unittest.TestCase):
+    def test_load_builds_and_warms_synchronously(self):
+        registry = DetectorRegistry({"hand": FakeDetector})
+        detector = registry.load("hand")
+        self.assertTrue(detector.warmed)
+        self.assertIs(registry.get("hand"), detector)
+
+    def test_get_does_not_block_while_loading(self):
+        gate = threading.Event()
+        registry = DetectorRegistry({"face": lambda: FakeDetector(gate)})
+        registry.start()
+        try:
+            self.assertIsNone(registry.get("face"))
+            self.assertIsNone(registry.get("face"))
+            gate.set()
+            self.assertTrue(wait_for(lambda: registry.get("face") is not None))
+            self.assertTrue(registry.get("face").warmed)
+        finally:
+            registry.stop()
+
+    def test_prewarm_loads_in_background(self):
+        built = []
+
+        def factory():
+            built.append(True)
+            return FakeDetector()
+
+        registry = DetectorRegistry({"hand": factory})
+        registry.start()
+        try:
+            registry.prewarm(["hand"])
+            self.assertTrue(wait_for(lambda: registry.is_loaded("hand")))
+            registry.get("hand")
+            self.assertEqual(len(built), 1)
+        finally:
+            registry.stop()
+
+    def test_failed_factory_is_not_retried(self):
+        calls = []
+
+        def factory():
+            calls.append(True)
+            raise RuntimeError("model missing")
+
+        log = FakeLog()
+        registry = DetectorRegistry({"face": factory}, event_log=log)
+        self.assertIsNone(registry.load("face"))
+        registry.request("face")
+        self.assertEqual(len(calls), 1)
+        self.assertIn("DETECTOR_FAIL_FACE", log.events)
+
+
+class FirstMoveTimerTests(unittest.TestCase):
+    def test_reports_once_per_arm(self):
+        telemetry = Telemetry(path="")
+        log = FakeLog()
+        timer = FirstMoveTimer(event_log=log, telemetry=telemetry)
+        self.assertIsNone(timer.observe(1.0))
+
+        timer.arm("mode_head", 10.0)
+        self.assertAlmostEqual(timer.observe(10.25), 0.25)
+        self.assertIsNone(timer.observe(11.0))
+        self.assertEqual(log.events, ["TTFM_MODE_HEAD 0.25s"])
+        self.assertEqual(telemetry.snapshot()["timings"]["ttfm.mode_head"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
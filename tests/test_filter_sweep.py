@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+
+from benchmarks.filter_sweep import evaluate, expand_grid, parse_grid, score
+from src.accel import MotionAccelerator
+from src.one_euro import OneEuroFilter
+from src.smoother import MotionSmoother
+
+
+def recording(count=240, seed=3):
+    rng = np.random.default_rng(seed)
+    t = np.cumsum(rng.uniform(0.028, 0.038, count))
+    x = 800.0 + np.cumsum(rng.normal(0.0, 25.0, count))
+    y = 500.0 + np.cumsum(rng.normal(0.0, 25.0, count))
+    precision = (np.arange(count) // 40) % 3 == 1
+    return {"t": t, "x": x, "y": y, "accelerate": ~precision, "precision": precision}
+
+
+def online(rec, p):
+    accel = MotionAccelerator(
+        min_speed=p["accel_min_speed"],
+        max_speed=p["accel_max_speed"],
+        max_gain=p["accel_gain"],
+        exp=p["accel_exp"],
+    )
+    fx = OneEuroFilter(min_cutoff=p["min_cutoff"], beta=p["beta"])
+    fy = OneEuroFilter(min_cutoff=p["min_cutoff"], beta=p["beta"])
+    smoother = MotionSmoother(
+        max_speed=p["max_speed"],
+        damping=p["damping"],
+        precision_radius=p["precision_radius"],
+        precision_damping=p["precision_damping"],
+        micro_radius=p["micro_radius"],
+        micro_damping=p["micro_damping"],
+        ref_fps=p["ref_fps"],
+    )
+    out = []
+    for t, x, y, acc, prec in zip(rec["t"], rec["x"], rec["y"], rec["accelerate"], rec["precision"]):
+        if acc:
+            x, y = accel.apply(x, y, t)
+        x, y = fx.filter(x, t), fy.filter(y, t)
+        out.append(smoother.apply(x, y, t, precision=bool(prec)))
+    return np.asarray(out)
+
+
+class FilterSweepTests(unittest.TestCase):
+    def test_batch_matches_online_classes(self):
+        rec = recording()
+        grid = parse_grid(
+            "min_cutoff=0.4:1.2,beta=0.0:0.01,damping=0.3:0.7,accel_gain=1:2.5,micro_radius=2:30,"
+            "ref_fps=0:30"
+        )
+        params = expand_grid(grid)
+        outputs = evaluate(rec, params)
+        self.assertEqual(outputs.shape, (len(rec["t"]), 64, 2))
+        for index in (0, 7, 19, 31, 38, 63):
+            single = {key: float(values[index]) for key, values in params.items()}
+            # NumPy's vectorized pow can differ from libm's in the last bit.
+            np.testing.assert_allclose(outputs[:, index], online(rec, single), rtol=1e-12, atol=1e-9)
+
+    def test_unknown_grid_key_is_rejected(self):
+        with self.assertRaises(ValueError):
+            expand_grid(parse_grid("cutoff=1:2"))
+
+    def test_heavier_smoothing_trades_jitter_for_lag(self):
+        rec = recording()
+        noise = np.random.default_rng(0).normal(0.0, 2.0, (2, len(rec["t"])))
+        rec["x"] = 800.0 + noise[0]
+        rec["y"] = 500.0 + noise[1]
+        rec["x"][120:] += 400.0
+        rec["precision"][:] = False
+        params = expand_grid(parse_grid("min_cutoff=0.3:3.0,accel_gain=1"))
+        heavy, light = score(evaluate(rec, params), rec)
+        self.assertLess(heavy["jitter_px"], light["jitter_px"])
+        self.assertGreater(heavy["lag_ms"], light["lag_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
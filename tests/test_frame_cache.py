@@ -0,0 +1,78 @@
+import unittest
+
+from src.frame_cache import FrameResultCache, landmark_array
+
+
+class Landmark:
+    def __init__(self, x, y, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class FrameResultCacheTests(unittest.TestCase):
+    def test_detector_runs_once_per_frame(self):
+        calls = []
+        cache = FrameResultCache()
+
+        def detect():
+            calls.append(True)
+            return len(calls)
+
+        first = cache.run("face", 7, detect)
+        second = cache.run("face", 7, detect)
+        self.assertIs(first, second)
+        self.assertEqual(second.value, 1)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        third = cache.run("face", 8, detect)
+        self.assertEqual(third.value, 2)
+        self.assertIsNone(cache.get("face", 7))
+
+    def test_detectors_are_cached_independently(self):
+        cache = FrameResultCache()
+        cache.run("hand", 1, lambda: "hand")
+        cache.run("face", 1, lambda: "face")
+        self.assertEqual(cache.get("hand", 1).value, "hand")
+        self.assertEqual(cache.get("face", 1).value, "face")
+
+    def test_features_are_memoized_on_result(self):
+        cache = FrameResultCache()
+        entry = cache.run("hand", 3, lambda: None)
+        calls = []
+
+        def positions():
+            calls.append(True)
+            return [(8, 1.0, 2.0, 0.0)]
+
+        self.assertEqual(entry.feature("positions", positions), [(8, 1.0, 2.0, 0.0)])
+        cache.latest("hand").feature("positions", positions)
+        self.assertEqual(len(calls), 1)
+
+    def test_reports_compute_time(self):
+        recorded = []
+        cache = FrameResultCache(on_compute=lambda name, seconds: recorded.append(name))
+        entry = cache.run("hand", 1, lambda: None)
+        cache.run("hand", 1, lambda: None)
+        self.assertGreaterEqual(entry.elapsed, 0.0)
+        self.assertEqual(recorded, ["hand"])
+        cache.run("face", 1, lambda: None, record=False)
+        self.assertEqual(recorded, ["hand"])
+        self.assertIsNotNone(cache.get("face", 1))
+
+    def test_clear_drops_results(self):
+        cache = FrameResultCache()
+        cache.run("face", 1, lambda: None)
+        cache.clear()
+        self.assertIsNone(cache.latest("face"))
+
+    def test_landmark_array(self):
+        points = landmark_array([Landmark(0.1, 0.2, 0.3), Landmark(0.4, 0.5)])
+        self.assertEqual(points.shape, (2, 3))
+        self.assertAlmostEqual(float(points[1, 1]), 0.5, places=6)
+        self.assertEqual(landmark_array(None).shape, (0, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
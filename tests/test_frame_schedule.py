@@ -1,6 +1,7 @@
 import unittest
 
-from src.frame_schedule import schedule_detectors
+from src.frame_schedule import DetectorScheduler, schedule_detectors
+from src.telemetry import Telemetry
 
 
 class FrameScheduleTests(unittest.TestCase):
@@ -47,6 +48,115 @@ class FrameScheduleTests(unittest.TestCase):
         self.assertTrue(run_face)
 
 
+class DetectorSchedulerTests(unittest.TestCase):
+    def _run(self, scheduler, mode, frames, demand=None, costs=None):
+        decisions = []
+        for frame_id in range(frames):
+            run_hand, run_face = scheduler.plan(mode, frame_id, True, False, demand=demand)
+            if costs:
+                if run_hand:
+                    scheduler.record("hand", costs["hand"])
+                if run_face:
+                    scheduler.record("face", costs["face"])
+            decisions.append((run_hand, run_face))
+        return decisions
+
+    def test_runs_both_when_budget_allows(self):
+        scheduler = DetectorScheduler(budget=0.03, secondary_interval=1)
+        decisions = self._run(
+            scheduler, "EYE_HAND", 6, costs={"hand": 0.01, "face": 0.01}
+        )
+        self.assertTrue(all(run_hand and run_face for run_hand, run_face in decisions))
+        self.assertEqual(scheduler.over_budget_ratio(), 0.0)
+
+    def test_alternates_when_budget_is_tight(self):
+        scheduler = DetectorScheduler(budget=0.012, secondary_interval=1)
+        decisions = self._run(
+            scheduler, "EYE_HAND", 10, costs={"hand": 0.01, "face": 0.01}
+        )
+        for run_hand, run_face in decisions[1:]:
+            self.assertNotEqual(run_hand, run_face)
+        self.assertAlmostEqual(scheduler.run_rate("hand"), 0.5, delta=0.1)
+        self.assertAlmostEqual(scheduler.run_rate("face"), 0.5, delta=0.1)
+
+    def test_idle_interval_skips_quiet_detector(self):
+        scheduler = DetectorScheduler(idle_intervals={"face": 3}, max_stale=10)
+        decisions = self._run(scheduler, "HEAD", 9, demand={"face": 0.0})
+        self.assertEqual([run_face for _, run_face in decisions].count(True), 3)
+
+    def test_demand_runs_every_frame(self):
+        scheduler = DetectorScheduler(idle_intervals={"face": 3}, max_stale=10)
+        decisions = self._run(scheduler, "HEAD", 9, demand={"face": 1.0})
+        self.assertTrue(all(run_face for _, run_face in decisions))
+
+    def test_stale_detector_is_forced_over_budget(self):
+        scheduler = DetectorScheduler(budget=0.001, secondary_interval=1, max_stale=3)
+        decisions = self._run(
+            scheduler, "EYE_HAND", 12, costs={"hand": 0.01, "face": 0.01}
+        )
+        for name_idx in (0, 1):
+            gap = 0
+            for decision in decisions:
+                gap = 0 if decision[name_idx] else gap + 1
+                self.assertLess(gap, 3)
+
+    def test_blink_only_face_uses_secondary_interval(self):
+        scheduler = DetectorScheduler(secondary_interval=3, max_stale=10)
+        decisions = self._run(scheduler, "ABSOLUTE", 9)
+        self.assertTrue(all(run_hand for run_hand, _ in decisions))
+        self.assertEqual([run_face for _, run_face in decisions].count(True), 3)
+
+    def test_reports_telemetry(self):
+        telemetry = Telemetry(path="")
+        scheduler = DetectorScheduler(budget=0.005, telemetry=telemetry)
+        self._run(scheduler, "HEAD", 4, costs={"hand": 0.0, "face": 0.01})
+        snapshot = telemetry.snapshot()
+        self.assertEqual(snapshot["counters"]["sched.face.run"], 4)
+        self.assertIn("infer.face", snapshot["timings"])
+        self.assertEqual(snapshot["gauges"]["sched.over_budget_ratio"], 1.0)
+
+    def test_skipped_takes_back_a_planned_run(self):
+        telemetry = Telemetry(path="")
+        scheduler = DetectorScheduler(
+            idle_intervals={"face": 3}, max_stale=10, telemetry=telemetry
+        )
+        self.assertEqual(scheduler.plan("HEAD", 0, True, False), (False, True))
+        scheduler.skipped("face")
+        scheduler.skipped("face")
+        self.assertEqual(scheduler.last_decision, (False, False))
+        self.assertEqual(scheduler.runs["face"], 0)
+        self.assertEqual(scheduler.skips["face"], 1)
+        counters = telemetry.snapshot()["counters"]
+        self.assertEqual(counters["sched.face.run"], 0)
+        self.assertEqual(counters["sched.face.skip"], 1)
+        # Never counted as run, so the next frame is still due.
+        self.assertEqual(scheduler.plan("HEAD", 1, True, False), (False, True))
+        self.assertEqual(scheduler.plan("HEAD", 2, True, False), (False, False))
+
+    def test_fresh_skip_restarts_staleness(self):
+        scheduler = DetectorScheduler(idle_intervals={"face": 3}, max_stale=10)
+        scheduler.plan("HEAD", 0, True, False)
+        scheduler.skipped("face", fresh=True)
+        self.assertEqual(scheduler.runs["face"], 0)
+        self.assertEqual(scheduler.plan("HEAD", 1, True, False), (False, False))
+        self.assertEqual(scheduler.plan("HEAD", 3, True, False), (False, True))
+
+    def test_holistic_is_one_unit(self):
+        telemetry = Telemetry(path="")
+        scheduler = DetectorScheduler(budget=0.012, secondary_interval=1, telemetry=telemetry)
+        for frame_id in range(6):
+            decision = scheduler.plan("EYE_HAND", frame_id, True, False, holistic=True)
+            # Both views come from the same inference: all or nothing.
+            self.assertEqual(decision, (True, True))
+            scheduler.record("holistic", 0.01)
+        self.assertEqual(scheduler.runs, {"hand": 0, "face": 0, "holistic": 6})
+        self.assertEqual(scheduler.over_budget_ratio(), 0.0)
+        scheduler.plan("EYE_HAND", 6, True, False, holistic=True)
+        scheduler.skipped("holistic", fresh=True)
+        self.assertEqual(scheduler.last_decision, (False, False))
+        self.assertEqual(telemetry.snapshot()["counters"]["sched.holistic.skip"], 1)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -1,6 +1,9 @@
+import math
 import unittest
 
-from src.head_motion import HeadMotion
+import numpy as np
+
+from src.head_motion import HeadMotion, MedianNeutral, matrix_offset
 
 
 class Landmark:
@@ -108,6 +111,166 @@ class HeadMotionTests(unittest.TestCase):
 
         self.assertGreater(abs(boosted_dx), abs(slow_dx))
 
+    def velocities(self, rate, offset, **overrides):
+        """Per-second cursor speed at each 1/15 s tick for input sampled at ``rate``."""
+        params = dict(
+            sensitivity=1.0,
+            deadzone=0.0,
+            min_speed=0.0,
+            max_speed=100.0,
+            exp=1.0,
+            neutral_alpha=0.0,
+            micro_gain=1.0,
+            stop_threshold=0.0,
+            stop_hold=0.0,
+            return_brake=1.0,
+            return_brake_margin=0.0,
+            tilt_boost=0.0,
+            ref_fps=30.0,
+        )
+        params.update(overrides)
+        motion = HeadMotion((1920, 1080), (0, 0), **params)
+        motion.compute(make_landmarks(0.0, 0.0), 0.0)
+        step = int(rate) // 15
+        speeds = []
+        for k in range(1, int(rate) + 1):
+            t = k / rate
+            dx, _ = motion.compute(make_landmarks(offset(t), 0.0), t)
+            if k % step == 0:
+                speeds.append(dx / (1.0 / rate))
+        return speeds
+
+    def test_neutral_drift_is_rate_invariant(self):
+        runs = [self.velocities(rate, lambda t: 0.2, neutral_alpha=0.05) for rate in (15, 30, 60)]
+        self.assertLess(runs[0][-1], runs[0][0])
+        for run in runs[1:]:
+            np.testing.assert_allclose(run, runs[0], rtol=1e-9)
+
+    def test_return_brake_is_rate_invariant(self):
+        runs = [
+            self.velocities(rate, lambda t: 0.3 * math.exp(-t / 0.25), return_brake=0.5)
+            for rate in (15, 30, 60)
+        ]
+        for run in runs[1:]:
+            np.testing.assert_allclose(run[1:], runs[0][1:], rtol=1e-9)
+
+
+def head_trace(segments, fps=30.0, noise=0.001, seed=0):
+    """(t, raw_dx) for piecewise-constant poses with 0.2 s turns and tremor."""
+    rng = np.random.default_rng(seed)
+    samples = []
+    t = 0.0
+    pose = 0.0
+    for target, seconds in segments:
+        start = pose
+        for k in range(int(seconds * fps)):
+            blend = min(1.0, k / (0.2 * fps))
+            pose = start + (target - start) * blend
+            samples.append((t, pose + rng.normal(0.0, noise)))
+            t += 1.0 / fps
+        pose = target
+    return samples
+
+
+def steer(trace, **overrides):
+    params = dict(
+        sensitivity=6.0,
+        deadzone=0.005,
+        min_speed=0.0,
+        max_speed=2600.0,
+        exp=1.6,
+        neutral_alpha=0.05,
+        micro_gain=0.7,
+        stop_threshold=0.03,
+        stop_hold=0.34,
+        return_brake=1.0,
+        return_brake_margin=0.0,
+        tilt_boost=0.0,
+        ref_fps=30.0,
+    )
+    params.update(overrides)
+    motion = HeadMotion((1920, 1080), (0, 0), **params)
+    moved = 0.0
+    neutrals = []
+    for t, raw in trace:
+        delta = motion.compute(None, t, offset=(raw, 0.0))
+        moved += delta[0]
+        neutrals.append(motion._neutral[0])
+    return moved, neutrals
+
+
+class MedianNeutralTests(unittest.TestCase):
+    def test_sustained_deflection_keeps_neutral(self):
+        trace = head_trace([(0.0, 2.0), (0.06, 2.0), (0.0, 1.0)])
+        ema_moved, ema_neutral = steer(trace)
+        median_moved, median_neutral = steer(trace, neutral_estimator=MedianNeutral())
+        hold_start, hold_end = int(2.3 * 30), int(4.0 * 30) - 1
+        self.assertGreater(ema_neutral[hold_end], 0.04)
+        # The stop-hold snap may take the first frame of the turn; after that it stays put.
+        self.assertLess(abs(median_neutral[hold_end]), 0.01)
+        self.assertEqual(median_neutral[hold_end], median_neutral[hold_start])
+        # Less head rotation for the same distance: the hold keeps paying out.
+        self.assertGreater(median_moved, 2.0 * ema_moved)
+
+    def test_still_deflection_becomes_new_posture(self):
+        estimator = MedianNeutral(window=2.0, rebase_seconds=1.0)
+        for t, raw in head_trace([(0.0, 1.0), (0.04, 5.0)]):
+            neutral = estimator.update(raw, 0.0, t)
+        self.assertAlmostEqual(neutral[0], 0.04, delta=0.003)
+        self.assertFalse(estimator.frozen)
+
+    def test_turn_between_holds_restarts_rebase_clock(self):
+        estimator = MedianNeutral(window=2.0, rebase_seconds=1.0)
+        for t, raw in head_trace([(0.0, 1.0), (0.05, 0.8), (0.11, 0.8)]):
+            neutral = estimator.update(raw, 0.0, t)
+        # Two holds of 0.6 s each, split by a turn: neither is a new posture.
+        self.assertTrue(estimator.frozen)
+        self.assertLess(abs(neutral[0]), 0.005)
+
+    def test_tremor_leaves_neutral_steady(self):
+        estimator = MedianNeutral()
+        neutrals = [estimator.update(raw, 0.0, t)[0] for t, raw in head_trace([(0.0, 5.0)], noise=0.002)]
+        self.assertLess(max(abs(n) for n in neutrals[30:]), 0.002)
+
+    def test_reset_and_snap(self):
+        estimator = MedianNeutral()
+        estimator.update(0.02, 0.01, 0.0)
+        estimator.snap(0.05, -0.01, 0.1)
+        self.assertEqual(estimator.neutral, (0.05, -0.01))
+        estimator.reset()
+        self.assertIsNone(estimator.neutral)
+
+
+def pose_matrix(yaw_deg, pitch_deg):
+    yaw = math.radians(yaw_deg)
+    pitch = math.radians(pitch_deg)
+    rot_y = np.array(
+        [[math.cos(yaw), 0, math.sin(yaw)], [0, 1, 0], [-math.sin(yaw), 0, math.cos(yaw)]]
+    )
+    rot_x = np.array(
+        [[1, 0, 0], [0, math.cos(pitch), -math.sin(pitch)], [0, math.sin(pitch), math.cos(pitch)]]
+    )
+    matrix = np.eye(4)
+    matrix[:3, :3] = rot_y @ rot_x
+    matrix[:3, 3] = (0.0, 0.0, -40.0)
+    return matrix
+
+
+class MatrixOffsetTests(unittest.TestCase):
+    def test_frontal_face_is_centered(self):
+        dx, dy = matrix_offset(pose_matrix(0, 0))
+        self.assertAlmostEqual(dx, 0.0)
+        self.assertAlmostEqual(dy, 0.0)
+
+    def test_yaw_and_pitch_map_to_image_axes(self):
+        dx, dy = matrix_offset(pose_matrix(30, 0), scale=0.5)
+        self.assertAlmostEqual(dx, 0.25)
+        self.assertAlmostEqual(dy, 0.0)
+        # A face pointing up (+y in camera space) moves the cursor up.
+        _, dy = matrix_offset(pose_matrix(0, -20), scale=1.0)
+        self.assertLess(dy, 0.0)
+        self.assertIsNone(matrix_offset(None))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,90 @@
+import importlib
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.holistic_detector import HolisticDetector, HolisticFaceView, HolisticHandView
+
+
+class Landmark:
+    def __init__(self, x, y, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+def hand(x):
+    return [Landmark(x, 0.5) for _ in range(21)]
+
+
+class FakeSource:
+    model_path = "unused.task"
+
+    def __init__(self):
+        self.result = None
+        self.calls = 0
+
+    def detect(self, rgb_frame):
+        self.calls += 1
+        return self.result
+
+
+class CountingLandmarker:
+    def __init__(self):
+        self.calls = 0
+
+    def detect(self, image):
+        self.calls += 1
+        return SimpleNamespace(face_landmarks=[], left_hand_landmarks=[], right_hand_landmarks=[])
+
+
+class HolisticDetectorTests(unittest.TestCase):
+    def test_detect_runs_once_per_rgb_frame(self):
+        holistic = HolisticDetector.__new__(HolisticDetector)
+        holistic.input_size = None
+        holistic._last_rgb = None
+        holistic._last_result = None
+        holistic.mp_image = importlib.import_module("mediapipe.tasks.python.vision.core.image")
+        holistic.landmarker = CountingLandmarker()
+        rgb = np.zeros((48, 64, 3), dtype=np.uint8)
+        first = holistic.detect(rgb)
+        self.assertIs(holistic.detect(rgb), first)
+        holistic.detect(rgb.copy())
+        self.assertEqual(holistic.landmarker.calls, 2)
+
+    def test_hand_view_keeps_tracked_side(self):
+        source = FakeSource()
+        view = HolisticHandView(source, hand_side="right")
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        source.result = SimpleNamespace(left_hand_landmarks=hand(0.2), right_hand_landmarks=[])
+        view.find_hands(frame, draw=False, rgb=frame)
+        self.assertEqual(view.hand_side, "left")
+        self.assertEqual(view.find_position(frame)[8][1], 128)
+
+        source.result = SimpleNamespace(left_hand_landmarks=hand(0.2), right_hand_landmarks=hand(0.8))
+        view.find_hands(frame, draw=False, rgb=frame)
+        self.assertAlmostEqual(view.normalized_landmarks()[0].x, 0.2)
+
+        source.result = SimpleNamespace(left_hand_landmarks=[], right_hand_landmarks=[])
+        view.find_hands(frame, draw=False, rgb=frame)
+        self.assertEqual(view.find_position(frame), [])
+
+    def test_face_view_uses_shared_landmarks(self):
+        source = FakeSource()
+        view = HolisticFaceView(source, blink_threshold=0.22)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        source.result = SimpleNamespace(face_landmarks=[Landmark(0.5, 0.5)] * 478)
+        view.process(frame, 0.0, rgb=frame)
+        self.assertIsNotNone(view.last_landmarks)
+        self.assertIsNone(view.input_size)
+
+        source.result = SimpleNamespace(face_landmarks=[])
+        self.assertEqual(view.process(frame, 0.1, rgb=frame), (None, False))
+        self.assertIsNone(view.last_landmarks)
+        self.assertEqual(source.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
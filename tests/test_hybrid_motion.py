@@ -27,6 +27,32 @@ class HybridMotionTests(unittest.TestCase):
         self.assertAlmostEqual(x_target, 584.8528, places=3)
         self.assertAlmostEqual(y_target, 292.4264, places=3)
 
+    def test_tilt_decay_is_rate_invariant(self):
+        runs = []
+        for rate in (15, 30, 60):
+            mapper = TiltMapper(decay=0.05, min_range=0.1, ref_fps=30.0)
+            mapper.update(-1.0, -1.0, 0.0)
+            mapper.update(1.0, 1.0, 0.0)
+            step = rate // 15
+            values = []
+            for k in range(1, rate + 1):
+                nx, _ = mapper.update(0.5, 0.5, k / rate)
+                if k % step == 0:
+                    values.append((nx, mapper.min_x, mapper.max_x))
+            runs.append(values)
+        self.assertGreater(runs[0][-1][1], -1.0)
+        for values in runs[1:]:
+            for a, b in zip(values, runs[0]):
+                for u, v in zip(a, b):
+                    self.assertAlmostEqual(u, v, places=9)
+
+    def test_tilt_decay_without_timestamp_is_per_call(self):
+        mapper = TiltMapper(decay=0.5, min_range=0.1, ref_fps=30.0)
+        mapper.update(0.0, 0.0)
+        mapper.update(1.0, 1.0)
+        mapper.update(1.0, 1.0)
+        self.assertAlmostEqual(mapper.min_x, 0.75)
+
 
 if __name__ == "__main__":
     unittest.main()
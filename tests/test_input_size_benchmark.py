@@ -0,0 +1,84 @@
+import argparse
+import unittest
+
+import numpy as np
+
+from benchmarks.input_size import (
+    event_agreement,
+    landmark_jitter,
+    parse_sizes,
+    ratio_error,
+    recommend,
+)
+
+
+def thresholds():
+    return argparse.Namespace(
+        min_detection=0.98,
+        max_jitter_ratio=1.3,
+        min_blink_agreement=0.95,
+        max_ear_err=0.02,
+        core_tolerance=0.05,
+    )
+
+
+class InputSizeBenchmarkTests(unittest.TestCase):
+    def test_parse_sizes(self):
+        self.assertEqual(parse_sizes("native, 320x180"), [None, (320, 180)])
+
+    def test_event_agreement_allows_small_offsets(self):
+        reference = [(10, "left"), (40, "right")]
+        self.assertEqual(event_agreement(reference, [(11, "left"), (39, "right")]), 1.0)
+        self.assertEqual(event_agreement(reference, [(30, "left")]), 0.0)
+        self.assertAlmostEqual(event_agreement(reference, [(10, "left")]), 2 / 3)
+        self.assertEqual(event_agreement([], []), 1.0)
+
+    def test_jitter_ignores_constant_velocity(self):
+        track = [np.array([[0.1 + 0.01 * i, 0.5]], dtype=np.float32) for i in range(5)]
+        self.assertAlmostEqual(landmark_jitter(track, (640, 480)), 0.0, places=3)
+        track[2] = track[2] + np.float32([1.0 / 640.0, 0.0])
+        self.assertGreater(landmark_jitter(track, (640, 480)), 0.5)
+        self.assertIsNone(landmark_jitter([None, None, None], (640, 480)))
+
+    def test_ratio_error_skips_missing_faces(self):
+        self.assertAlmostEqual(ratio_error([0.3, None, 0.2], [0.31, 0.1, None]), 0.01)
+
+    def test_recommend_picks_fastest_acceptable(self):
+        references = {
+            "face": {"detection_rate": 1.0, "jitter_px": 1.0},
+            "hand": {"detection_rate": 1.0, "jitter_px": 1.0},
+        }
+        rows = [
+            {"detector": "face", "size": "320x180", "p90_ms": 9.0, "detection_rate": 1.0,
+             "jitter_px": 1.1, "blink_agreement": 1.0, "ear_err": 0.01},
+            {"detector": "face", "size": "192x108", "p90_ms": 5.0, "detection_rate": 1.0,
+             "jitter_px": 1.2, "blink_agreement": 0.5, "ear_err": 0.01},
+            {"detector": "hand", "size": "320x240", "p90_ms": 7.0, "detection_rate": 0.9,
+             "jitter_px": 1.0},
+            {"detector": "hand", "size": "native", "p90_ms": 12.0, "detection_rate": 1.0,
+             "jitter_px": 1.0},
+        ]
+        cpus, best = recommend(rows, references, thresholds())
+        self.assertEqual(cpus, 0)
+        self.assertEqual(best["face"]["size"], "320x180")
+        self.assertEqual(best["hand"]["size"], "native")
+
+    def test_recommend_prefers_fewer_cores_when_as_fast(self):
+        references = {"hand": {"detection_rate": 1.0, "jitter_px": 1.0}}
+
+        def row(cpus, size, p90, detection=1.0):
+            return {"detector": "hand", "cpus": cpus, "size": size, "p90_ms": p90,
+                    "detection_rate": detection, "jitter_px": 1.0}
+
+        rows = [
+            row(0, "native", 10.0), row(0, "256x144", 6.0),
+            row(2, "native", 14.0), row(2, "256x144", 6.2),
+            row(1, "native", 20.0), row(1, "256x144", 5.0, detection=0.5),
+        ]
+        cpus, best = recommend(rows, references, thresholds())
+        self.assertEqual(cpus, 2)
+        self.assertEqual(best["hand"]["size"], "256x144")
+
+
+if __name__ == "__main__":
+    unittest.main()
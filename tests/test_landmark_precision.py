@@ -0,0 +1,44 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from benchmarks.landmark_precision import jitter, lag_frames, sweep, synthetic_track
+from src.hand_detector import HandDetector
+
+
+class Landmark:
+    def __init__(self, x, y, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+class LandmarkPrecisionTests(unittest.TestCase):
+    def test_find_position_keeps_sub_pixel_values(self):
+        detector = HandDetector.__new__(HandDetector)
+        detector.results = SimpleNamespace(hand_landmarks=[[Landmark(0.1234, 0.5678)]])
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        _, x, y, _ = detector.find_position(frame)[0]
+        self.assertAlmostEqual(x, 0.1234 * 640)
+        self.assertAlmostEqual(y, 0.5678 * 480)
+
+    def test_jitter_of_constant_velocity_is_zero(self):
+        line = np.stack([np.arange(10.0), np.arange(10.0) * 2.0], axis=1)
+        self.assertAlmostEqual(jitter(line), 0.0)
+
+    def test_lag_frames_finds_shift(self):
+        t = np.arange(200)
+        reference = np.stack([np.sin(t * 0.1), np.cos(t * 0.1)], axis=1)
+        delayed = np.vstack([np.repeat(reference[:1], 3, axis=0), reference[:-3]])
+        self.assertAlmostEqual(lag_frames(delayed, reference), 3.0, delta=0.2)
+
+    def test_float_path_is_steadier_than_truncated(self):
+        track, times = synthetic_track(300)
+        rows = sweep(track, times, (640, 480), (2560, 1440), [1.0], beta=0.0)
+        by_path = {row["path"]: row for row in rows}
+        self.assertLess(by_path["float"]["jitter_px"], by_path["int"]["jitter_px"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.landmark_service import LandmarkClient, LandmarkPublisher
+
+
+def _name(tag):
+    return f"hs_test_{tag}_{os.getpid()}"
+
+
+class LandmarkServiceTests(unittest.TestCase):
+    def setUp(self):
+        self.publisher = None
+        self.client = None
+
+    def tearDown(self):
+        if self.client is not None:
+            self.client.close()
+        if self.publisher is not None:
+            self.publisher.close()
+
+    def test_round_trip_of_landmarks_and_ratios(self):
+        self.publisher = LandmarkPublisher(name=_name("rt"), slots=4)
+        self.client = LandmarkClient(name=_name("rt"))
+        self.assertIsNone(self.client.latest())
+
+        hand = [SimpleNamespace(x=i / 21.0, y=0.5, z=-0.1) for i in range(21)]
+        face = np.random.default_rng(0).random((478, 3)).astype(np.float32)
+        self.publisher.publish(7, 1.25, face=face, hand=hand, eye_ratio=0.3, brow_ratio=None)
+
+        frame = self.client.latest()
+        self.assertEqual(frame.index, 0)
+        self.assertEqual(frame.frame_id, 7)
+        self.assertAlmostEqual(frame.timestamp, 1.25)
+        np.testing.assert_allclose(frame.face, face)
+        self.assertAlmostEqual(float(frame.hand[3, 0]), 3 / 21.0, places=6)
+        self.assertAlmostEqual(frame.eye_ratio, 0.3, places=6)
+        self.assertIsNone(frame.brow_ratio)
+
+    def test_latest_follows_the_ring_and_skips_torn_slots(self):
+        self.publisher = LandmarkPublisher(name=_name("ring"), slots=3)
+        self.client = LandmarkClient(name=_name("ring"))
+        for frame_id in range(5):
+            self.publisher.publish(frame_id, float(frame_id))
+        self.assertEqual(self.client.latest().frame_id, 4)
+        self.assertIsNone(self.client.latest().face)
+
+        # A slot mid-write has an odd sequence number and is not returned.
+        self.publisher._ring[4 % 3]["seq"] += 1
+        self.assertEqual(self.client.latest().frame_id, 3)
+
+    def test_wait_returns_only_newer_frames(self):
+        self.publisher = LandmarkPublisher(name=_name("wait"), slots=2)
+        self.client = LandmarkClient(name=_name("wait"))
+        self.publisher.publish(1, 0.0)
+        self.assertEqual(self.client.wait(-1, timeout=0.0).frame_id, 1)
+        self.assertIsNone(self.client.wait(0, timeout=0.01))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.machine_tuning import load_machine_tuning, save_machine_tuning
+
+
+class TargetConfig:
+    BLINK_INPUT_SIZE = (320, 180)
+    HAND_INPUT_SIZE = ()
+    CAM_WIDTH = 640
+
+
+class MachineTuningTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "tuning", "box.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_round_trip_applies_tuple_sizes(self):
+        save_machine_tuning(
+            {"BLINK_INPUT_SIZE": (256, 144), "CAM_WIDTH": 1}, path=self.path
+        )
+        config = type("Config", (TargetConfig,), {})
+        applied = load_machine_tuning(config, path=self.path)
+        self.assertEqual(applied, {"BLINK_INPUT_SIZE": (256, 144)})
+        self.assertEqual(config.BLINK_INPUT_SIZE, (256, 144))
+        self.assertEqual(config.CAM_WIDTH, 640)
+
+    def test_missing_or_broken_file_is_ignored(self):
+        config = type("Config", (TargetConfig,), {})
+        self.assertEqual(load_machine_tuning(config, path=self.path), {})
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w", encoding="utf-8") as handle:
+            handle.write("{broken")
+        self.assertEqual(load_machine_tuning(config, path=self.path), {})
+
+    def test_report_is_stored(self):
+        save_machine_tuning({}, path=self.path, report={"clip": "a.mp4"})
+        with open(self.path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+        self.assertEqual(data["report"], {"clip": "a.mp4"})
+        self.assertIn("cpu_count", data["machine"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+import contextlib
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.model_store import MANIFEST_NAME, ModelSpec, ModelStore, looks_complete
+from src.model_utils import download_model
+
+
+def make_task_bytes(size=64 * 1024):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr("model.tflite", os.urandom(size))
+    return buffer.getvalue()
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves one blob with Range support; can cut the first response short."""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.headers.get("Range"))
+        body = server.body
+        start = 0
+        status = 200
+        range_header = self.headers.get("Range")
+        if range_header and server.honor_range:
+            start = int(range_header.split("=")[1].split("-")[0])
+            if start >= len(body):
+                self.send_response(416)
+                self.end_headers()
+                return
+            status = 206
+        payload = body[start:]
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        if status == 206:
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}"
+            )
+        self.end_headers()
+        if server.cut_after is not None:
+            cut = server.cut_after
+            server.cut_after = None
+            self.wfile.write(payload[:cut])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(payload)
+
+    def log_message(self, *_args):
+        return None
+
+
+class LocalServer:
+    def __init__(self, body):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+        self.httpd.body = body
+        self.httpd.requests = []
+        self.httpd.honor_range = True
+        self.httpd.cut_after = None
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/model.task"
+
+    def __enter__(self):
+        self.thread.start()
+        return self.httpd
+
+    def __exit__(self, *_exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class DownloadTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.body = make_task_bytes()
+        self.digest = hashlib.sha256(self.body).hexdigest()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_resumes_after_truncated_response(self):
+        server = LocalServer(self.body)
+        dest = os.path.join(self.tmp, "model.task")
+        with server as httpd:
+            httpd.cut_after = 10000
+            digest = download_model(server.url, dest, timeout=5.0, retry_delay=0.0)
+        self.assertEqual(digest, self.digest)
+        with open(dest, "rb") as handle:
+            self.assertEqual(handle.read(), self.body)
+        self.assertEqual(httpd.requests[0], None)
+        self.assertEqual(httpd.requests[1], "bytes=10000-")
+
+    def test_restarts_when_range_is_ignored(self):
+        server = LocalServer(self.body)
+        dest = os.path.join(self.tmp, "model.task")
+        with open(f"{dest}.part", "wb") as handle:
+            handle.write(b"garbage")
+        with server as httpd:
+            httpd.honor_range = False
+            download_model(server.url, dest, timeout=5.0)
+        with open(dest, "rb") as handle:
+            self.assertEqual(handle.read(), self.body)
+
+    def test_checksum_mismatch_discards_file(self):
+        server = LocalServer(self.body)
+        dest = os.path.join(self.tmp, "model.task")
+        with server:
+            with self.assertRaises(RuntimeError):
+                download_model(server.url, dest, timeout=5.0, expected_sha256="0" * 64)
+        self.assertFalse(os.path.exists(dest))
+        self.assertFalse(os.path.exists(f"{dest}.part"))
+
+
+class ModelStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = os.path.join(self.tmp, "cache")
+        self.bundle = os.path.join(self.tmp, "bundle")
+        os.makedirs(self.bundle)
+        self.body = make_task_bytes()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _store(self, url, sha256=None, bundle=False):
+        specs = {
+            "hand": ModelSpec("hand", "hand.task", url, sha256),
+            "face": ModelSpec("face", "face.task", url, sha256),
+        }
+        bundle_dirs = [self.bundle] if bundle else []
+        return ModelStore(self.cache, bundle_dirs, specs=specs, timeout=5.0)
+
+    def test_bundle_dir_is_used_without_network(self):
+        with open(os.path.join(self.bundle, "hand.task"), "wb") as handle:
+            handle.write(self.body)
+        with open(os.path.join(self.bundle, MANIFEST_NAME), "w", encoding="utf-8") as handle:
+            json.dump({"hand.task": hashlib.sha256(self.body).hexdigest()}, handle)
+        store = self._store("http://127.0.0.1:9/unreachable", bundle=True)
+        self.assertEqual(store.path("hand"), os.path.join(self.bundle, "hand.task"))
+
+    def test_bundle_without_digest_is_ignored(self):
+        with open(os.path.join(self.bundle, "hand.task"), "wb") as handle:
+            handle.write(self.body)
+        store = self._store("http://127.0.0.1:9/unreachable", bundle=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(store.locate("hand"))
+        digest = hashlib.sha256(self.body).hexdigest()
+        pinned = self._store("http://127.0.0.1:9/unreachable", digest, bundle=True)
+        self.assertEqual(pinned.locate("hand"), os.path.join(self.bundle, "hand.task"))
+
+    def test_pinned_digest_rejects_first_download(self):
+        server = LocalServer(self.body)
+        with server:
+            store = self._store(server.url, "0" * 64)
+            store.retries = 0
+            with self.assertRaises(Exception):
+                store.path("hand")
+        self.assertFalse(os.path.exists(os.path.join(self.cache, "hand.task")))
+
+    def test_truncated_cache_file_is_replaced(self):
+        os.makedirs(self.cache)
+        with open(os.path.join(self.cache, "hand.task"), "wb") as handle:
+            handle.write(self.body[:1000])
+        self.assertFalse(looks_complete(os.path.join(self.cache, "hand.task")))
+        server = LocalServer(self.body)
+        with server:
+            path = self._store(server.url).path("hand")
+        with open(path, "rb") as handle:
+            self.assertEqual(handle.read(), self.body)
+
+    def test_manifest_pins_digest_after_download(self):
+        server = LocalServer(self.body)
+        with server:
+            store = self._store(server.url)
+            path = store.path("hand")
+        self.assertEqual(
+            store.expected_digest("hand"), hashlib.sha256(self.body).hexdigest()
+        )
+        with open(path, "r+b") as handle:
+            handle.seek(100)
+            handle.write(b"tampered")
+        self.assertIsNone(store.locate("hand"))
+
+    def test_prefetch_fetches_all_in_parallel(self):
+        server = LocalServer(self.body)
+        with server as httpd:
+            results = self._store(server.url).prefetch()
+        self.assertEqual(set(results), {"hand", "face"})
+        for path in results.values():
+            self.assertTrue(os.path.isfile(path))
+        self.assertEqual(len(httpd.requests), 2)
+
+    def test_prefetch_reports_failures(self):
+        store = self._store("http://127.0.0.1:9/unreachable")
+        store.retries = 0
+        results = store.prefetch(["hand"])
+        self.assertIsInstance(results["hand"], Exception)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from src.motion_gate import MotionGate, make_thumbnail, roi_from_landmarks, union_roi
+
+
+class Landmark:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def thumb(value=100):
+    return np.full((48, 64), value, dtype=np.uint8)
+
+
+class MotionGateTests(unittest.TestCase):
+    def test_first_check_always_runs(self):
+        gate = MotionGate()
+        self.assertFalse(gate.should_skip(thumb(), None, 0.0))
+
+    def test_static_scene_is_skipped(self):
+        gate = MotionGate(threshold=1.0, refresh_interval=1.0)
+        gate.mark_ran(thumb(), 0.0)
+        self.assertTrue(gate.should_skip(thumb(), None, 0.1, cost=0.01))
+        self.assertEqual(gate.skips, 1)
+        self.assertAlmostEqual(gate.saved_seconds, 0.01)
+
+    def test_change_inside_roi_forces_inference(self):
+        gate = MotionGate(threshold=1.0, refresh_interval=1.0)
+        gate.mark_ran(thumb(), 0.0)
+        moved = thumb()
+        moved[0:12, 0:16] = 200
+        roi = (0.0, 0.0, 0.25, 0.25)
+        self.assertFalse(gate.should_skip(moved, roi, 0.1))
+        # The same change outside the region is ignored.
+        self.assertTrue(gate.should_skip(moved, (0.5, 0.5, 1.0, 1.0), 0.1))
+
+    def test_refresh_interval_forces_inference(self):
+        gate = MotionGate(refresh_interval=0.5)
+        gate.mark_ran(thumb(), 0.0)
+        self.assertTrue(gate.should_skip(thumb(), None, 0.4))
+        self.assertFalse(gate.should_skip(thumb(), None, 0.6))
+
+    def test_slow_drift_accumulates_against_reference(self):
+        gate = MotionGate(threshold=2.0, refresh_interval=10.0)
+        gate.mark_ran(thumb(100), 0.0)
+        self.assertTrue(gate.should_skip(thumb(101), None, 0.1))
+        self.assertFalse(gate.should_skip(thumb(103), None, 0.2))
+
+    def test_roi_and_thumbnail_helpers(self):
+        roi = roi_from_landmarks([Landmark(0.2, 0.4), Landmark(0.4, 0.6)], margin=0.5)
+        self.assertAlmostEqual(roi[0], 0.1)
+        self.assertAlmostEqual(roi[3], 0.7)
+        self.assertIsNone(roi_from_landmarks(None))
+        small = make_thumbnail(np.zeros((480, 640, 3), dtype=np.uint8), (64, 48))
+        self.assertEqual(small.shape, (48, 64))
+        self.assertEqual(union_roi((0.1, 0.2, 0.3, 0.4), None, (0.2, 0.1, 0.5, 0.3)), (0.1, 0.1, 0.5, 0.4))
+        self.assertIsNone(union_roi(None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from src.motion_pipeline import (
+    ClampStage,
+    DriverStage,
+    MotionPipeline,
+    MotionSample,
+    PredictStage,
+    Stage,
+)
+from src.predictor import LatencyPredictor
+
+
+class Offset(Stage):
+    def __init__(self, name, dx):
+        self.name = name
+        self.dx = dx
+        self.resets = 0
+
+    def process(self, sample, t):
+        return sample.moved(sample.x + self.dx, sample.y)
+
+    def reset(self):
+        self.resets += 1
+
+
+class Drop(Stage):
+    name = "drop"
+
+    def process(self, sample, t):
+        return None
+
+
+class FakeDriver:
+    def __init__(self):
+        self.targets = []
+
+    def update_target(self, x, y, timestamp=None):
+        self.targets.append((x, y, timestamp))
+
+
+class MotionPipelineTests(unittest.TestCase):
+    def test_stages_run_in_order_and_outputs_are_observable(self):
+        driver = FakeDriver()
+        seen = []
+        pipeline = MotionPipeline(
+            [Offset("a", 10.0), ClampStage(0, 0, 100, 100), DriverStage(driver)],
+            observer=lambda name, sample, t: seen.append(name),
+        )
+        result = pipeline.process(MotionSample(95.0, 50.0), 1.5)
+        self.assertEqual((result.x, result.y), (99.0, 50.0))
+        self.assertEqual(pipeline.outputs["a"].x, 105.0)
+        self.assertEqual(driver.targets, [(99.0, 50.0, 1.5)])
+        self.assertEqual(seen, ["a", "clamp", "driver"])
+        self.assertEqual(pipeline.timings["a"][0], 1)
+        self.assertEqual(set(pipeline.average_ms()), {"a", "clamp", "driver"})
+
+    def test_none_stops_the_chain(self):
+        driver = FakeDriver()
+        pipeline = MotionPipeline([Drop(), DriverStage(driver)])
+        self.assertIsNone(pipeline.process(MotionSample(1.0, 2.0), 0.0))
+        self.assertEqual(driver.targets, [])
+
+    def test_replay_without_driver(self):
+        driver = FakeDriver()
+        first = Offset("a", 1.0)
+        pipeline = MotionPipeline([first, DriverStage(driver)])
+        offline = pipeline.without("driver")
+        outputs = offline.replay([(MotionSample(0.0, 0.0), 0.0), (MotionSample(2.0, 0.0), 0.1)])
+        self.assertEqual([s.x for s in outputs], [1.0, 3.0])
+        self.assertEqual(driver.targets, [])
+        offline.reset()
+        self.assertEqual(first.resets, 1)
+        self.assertIs(offline.stage("a"), first)
+
+    def test_relative_targets_are_not_led(self):
+        def steady_speed(predict):
+            t = [0.0]
+            stage = PredictStage(LatencyPredictor(), clock=lambda: t[0] + 0.03)
+            x = 0.0
+            for frame in range(60):
+                t[0] = frame / 30.0
+                # Driver position plus this frame's head delta, as HEAD mode builds it.
+                x = stage.process(MotionSample(x + 3.6, 0.0, predict=predict), t[0]).x
+                if frame == 29:
+                    start = x
+            return x - start  # px over one second
+
+        self.assertAlmostEqual(steady_speed(False), 108.0, places=6)
+        self.assertGreater(steady_speed(True), 130.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
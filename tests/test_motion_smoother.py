@@ -44,6 +44,50 @@ class MotionSmootherTests(unittest.TestCase):
         self.assertAlmostEqual(x, 1.96, places=3)
         self.assertAlmostEqual(y, 0.0, places=3)
 
+    def test_damping_is_rate_invariant(self):
+        runs = []
+        for rate in (15, 30, 60):
+            smoother = MotionSmoother(max_speed=1e6, damping=0.4, ref_fps=30.0)
+            smoother.apply(0.0, 0.0, 0.0)
+            step = rate // 15
+            xs = []
+            for k in range(1, rate + 1):
+                x, _ = smoother.apply(100.0, 0.0, k / rate)
+                if k % step == 0:
+                    xs.append(x)
+            runs.append(xs)
+        # One reference frame at 30 Hz moves 40% of the way.
+        self.assertAlmostEqual(runs[1][0], 100.0 * (1.0 - 0.6**2), places=9)
+        for xs in runs[1:]:
+            for a, b in zip(xs, runs[0]):
+                self.assertAlmostEqual(a, b, places=9)
+
+    def test_precision_damping_is_rate_invariant(self):
+        runs = []
+        for rate in (15, 30, 60):
+            smoother = MotionSmoother(
+                max_speed=1e6,
+                damping=0.4,
+                precision_radius=16.0,
+                precision_damping=0.9,
+                micro_radius=6.0,
+                micro_damping=0.98,
+                ref_fps=30.0,
+            )
+            smoother.apply(0.0, 0.0, 0.0)
+            step = rate // 15
+            xs = []
+            for k in range(1, rate + 1):
+                x, _ = smoother.apply(20.0, 0.0, k / rate, precision=True)
+                if k % step == 0:
+                    xs.append(x)
+            runs.append(xs)
+        # The 20 px step crosses the precision and micro radii within 1/15 s.
+        self.assertGreater(runs[0][0], 19.5)
+        for xs in runs[1:]:
+            for a, b in zip(xs, runs[0]):
+                self.assertAlmostEqual(a, b, places=9)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,8 @@
+import math
 import unittest
 
-from src.mouse_driver import MouseDriver
+from src.mouse_driver import DeadlineScheduler, MouseDriver
+from src.relative_motion import RelativeMotion
 
 
 class FakeController:
@@ -101,5 +103,226 @@ class MouseDriverTests(unittest.TestCase):
         self.assertAlmostEqual(controller.position[1], 0.0, places=3)
 
 
+class TruncatingController(FakeController):
+    """Backend that keeps whole pixels only, like SetCursorPos."""
+
+    def __init__(self, pos=(0.0, 0.0), rounding=False):
+        super().__init__(pos)
+        # MouseController rounds before the backend when MOUSE_SUBPIXEL is on.
+        self.rounding = rounding
+
+    def move(self, x, y):
+        if self.rounding:
+            x, y = math.floor(x + 0.5), math.floor(y + 0.5)
+        super().move(float(math.trunc(x)), float(math.trunc(y)))
+
+
+def settle(driver, controller, now):
+    for _ in range(400):
+        driver.step(now, *controller.get_position(), 1.0 / 120.0)
+
+
+def relative_session(subpixel, frames=10000, pause_every=500):
+    """RELATIVE mode as main.py drives it: 30 Hz deltas, 120 Hz driver ticks."""
+    controller = TruncatingController(pos=(500.0, 500.0), rounding=subpixel)
+    driver = MouseDriver(controller)
+    driver.subpixel = subpixel
+    driver.speed_coeff = 35.0
+    motion = RelativeMotion((640, 480), (1920, 1080), sensitivity=1.0)
+    cursor = list(driver.get_last_pos())
+    expected = list(cursor)
+    now = 0.0
+    for frame in range(frames):
+        # Slow drift: about a tenth of a pixel per frame on screen.
+        delta = motion.update((100.0 + frame * 0.0411, 100.0 + frame * 0.0237))
+        cursor[0] += delta[0]
+        cursor[1] += delta[1]
+        expected[0] += delta[0]
+        expected[1] += delta[1]
+        driver.update_target(cursor[0], cursor[1], timestamp=now)
+        for _ in range(4):
+            driver.step(now, *controller.get_position(), 1.0 / 120.0)
+            now += 1.0 / 120.0
+        if frame % pause_every == pause_every - 1:
+            settle(driver, controller, now)
+            driver.pause()
+            driver.step(now, *controller.get_position(), 1.0 / 120.0)
+            driver.resume()
+            motion.reset()
+            cursor = list(driver.get_last_pos())
+    settle(driver, controller, now)
+    return controller.position, expected
+
+
+
+class SubpixelTests(unittest.TestCase):
+    def test_micro_motion_integrates_exactly(self):
+        (x, y), (ex, ey) = relative_session(subpixel=True)
+        self.assertLess(abs(x - ex), 1.0)
+        self.assertLess(abs(y - ey), 1.0)
+
+    def test_pause_resync_drops_fraction_without_carry(self):
+        (x, y), (ex, ey) = relative_session(subpixel=False)
+        self.assertGreater(ex - x, 3.0)
+        self.assertGreater(ey - y, 3.0)
+
+    def test_resync_keeps_float_position(self):
+        controller = TruncatingController(pos=(10.0, 10.0))
+        driver = MouseDriver(controller)
+        driver.update_target(10.0, 10.0, timestamp=0.0)
+        driver.update_target(10.7, 10.4, timestamp=0.0)
+        driver.curr_x, driver.curr_y = 10.7, 10.4
+        driver.pause()
+        driver.step(0.0, *controller.get_position(), 0.01)
+        self.assertEqual(driver.get_last_pos(), (10.7, 10.4))
+
+
+class FakeClock:
+    """Time that only moves when slept on (plus a fixed oversleep) or read."""
+
+    def __init__(self, oversleep=0.0, read_cost=0.0001):
+        self.now = 100.0
+        self.oversleep = oversleep
+        self.read_cost = read_cost
+        self.sleeps = []
+
+    def __call__(self):
+        self.now += self.read_cost
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds + (self.oversleep if seconds > 0 else 0.0)
+
+
+class DeadlineSchedulerTests(unittest.TestCase):
+    def test_oversleep_does_not_accumulate(self):
+        clock = FakeClock(oversleep=0.0015)
+        scheduler = DeadlineScheduler(100.0, spin=0.002, clock=clock, sleep=clock.sleep)
+        start = clock.now
+        dts = [scheduler.wait() for _ in range(101)]
+        # 100 periods later to within one spin step, despite 1.5 ms oversleep per tick.
+        self.assertAlmostEqual(clock.now - start, 1.0, delta=0.001)
+        self.assertAlmostEqual(sum(dts[1:]), clock.now - start, delta=0.001)
+        self.assertEqual(scheduler.missed, 0)
+        self.assertIn(0, clock.sleeps)
+
+    def test_measured_dt_and_missed_deadline(self):
+        clock = FakeClock()
+        scheduler = DeadlineScheduler(100.0, spin=0.002, clock=clock, sleep=clock.sleep)
+        scheduler.wait()
+        scheduler.wait()
+        clock.now += 0.035
+        dt = scheduler.wait()
+        self.assertEqual(scheduler.missed, 1)
+        self.assertAlmostEqual(dt, 0.035, delta=0.001)
+        # The schedule restarts from the late tick instead of bursting.
+        before = clock.now
+        self.assertAlmostEqual(scheduler.wait(), 0.01, delta=0.0005)
+        self.assertAlmostEqual(clock.now - before, 0.01, delta=0.0005)
+
+    def test_late_tick_does_not_overshoot_target(self):
+        controller = FakeController()
+        driver = MouseDriver(controller)
+        driver.speed_coeff = 35.0
+        driver.update_target(0.0, 0.0, timestamp=0.0)
+        driver.update_target(10.0, 0.0, timestamp=0.0)
+        driver.step(0.05, *controller.get_position(), 0.05)
+        self.assertAlmostEqual(controller.position[0], 10.0)
+
+
+class CountingController(FakeController):
+    def __init__(self, pos=(0.0, 0.0)):
+        super().__init__(pos)
+        self.reads = 0
+
+    def get_position(self):
+        self.reads += 1
+        return super().get_position()
+
+
+def run_ticks(driver, start, seconds, rate=120.0):
+    now = start
+    for _ in range(int(seconds * rate)):
+        driver.tick(now, 1.0 / rate)
+        now += 1.0 / rate
+    return now
+
+
+class CoalescingTests(unittest.TestCase):
+    def make_driver(self, pos=(100.0, 100.0)):
+        controller = CountingController(pos)
+        driver = MouseDriver(controller)
+        driver.speed_coeff = 35.0
+        driver.coast_window = 0.0
+        driver.idle_read_max = 0.25
+        return controller, driver
+
+    def test_rest_skips_moves_and_most_reads(self):
+        controller, driver = self.make_driver()
+        driver.update_target(100.0, 100.0, timestamp=0.0)
+        now = run_ticks(driver, 0.0, 0.5)
+        moves, reads = len(controller.moves), controller.reads
+        run_ticks(driver, now, 2.0)
+        self.assertEqual(len(controller.moves), moves)
+        # 240 ticks at rest: reads back off to every 0.25 s.
+        self.assertLessEqual(controller.reads - reads, 10)
+
+    def test_moving_reads_every_tick(self):
+        controller, driver = self.make_driver()
+        now = 0.0
+        for frame in range(30):
+            driver.update_target(100.0 + frame * 10.0, 100.0, timestamp=now)
+            reads = controller.reads
+            now = run_ticks(driver, now, 1.0 / 30.0)
+            self.assertEqual(controller.reads - reads, 4)
+
+    def test_user_motion_at_rest_is_detected(self):
+        controller, driver = self.make_driver()
+        driver.update_target(100.0, 100.0, timestamp=0.0)
+        now = run_ticks(driver, 0.0, 1.0)
+        for _ in range(10):
+            x, y = controller.position
+            controller.position = (x + driver.override_dist + 20.0, y)
+            now = run_ticks(driver, now, 1.0 / 30.0)
+        self.assertGreater(driver._override_until, 0.0)
+        # The driver did not drag the cursor back while the user moved it.
+        self.assertGreater(controller.position[0], 900.0)
+
+    def test_small_nudge_at_rest_is_undone(self):
+        controller, driver = self.make_driver()
+        driver.update_target(100.0, 100.0, timestamp=0.0)
+        now = run_ticks(driver, 0.0, 1.0)
+        controller.position = (100.0 + driver.override_dist * 0.5, 100.0)
+        # Within the current read interval the nudge is seen and corrected.
+        now = run_ticks(driver, now, 0.5)
+        self.assertEqual(controller.position, (100.0, 100.0))
+        self.assertEqual(driver._override_until, 0.0)
+        reads = controller.reads
+        run_ticks(driver, now, 2.0)
+        # In sync again, so reads back off as before the nudge.
+        self.assertLessEqual(controller.reads - reads, 10)
+
+    def test_resume_takes_cursor_from_real_position(self):
+        controller, driver = self.make_driver()
+        driver.update_target(100.0, 100.0, timestamp=0.0)
+        now = run_ticks(driver, 0.0, 0.5)
+        driver.pause()
+        now = run_ticks(driver, now, 0.5)
+        controller.position = (400.0, 300.0)
+        driver.resume()
+        driver.tick(now, 1.0 / 120.0)
+        self.assertEqual(driver.get_last_pos(), (400.0, 300.0))
+        self.assertEqual(driver._override_until, 0.0)
+
+    def test_disabled_coalescing_reads_and_moves_every_tick(self):
+        controller, driver = self.make_driver()
+        driver.coalesce = False
+        driver.update_target(100.0, 100.0, timestamp=0.0)
+        run_ticks(driver, 0.0, 1.0)
+        self.assertEqual(controller.reads, 120)
+        self.assertEqual(len(controller.moves), 120)
+
+
 if __name__ == "__main__":
     unittest.main()
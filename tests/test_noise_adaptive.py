@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from src.motion_pipeline import AdaptiveCutoffStage, MotionSample
+from src.noise_adaptive import AdaptiveCutoff
+from src.one_euro import OneEuroFilter
+
+
+def feed(adaptive, noise, frames=300, speed=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    for i in range(frames):
+        adaptive.update(
+            500.0 + speed * i / 30.0 + rng.normal(0.0, noise),
+            300.0 + rng.normal(0.0, noise),
+            i / 30.0,
+        )
+    return adaptive
+
+
+class AdaptiveCutoffTests(unittest.TestCase):
+    def test_noise_estimate_tracks_input(self):
+        for noise in (0.5, 1.5, 3.0):
+            adaptive = feed(AdaptiveCutoff(), noise)
+            self.assertAlmostEqual(adaptive.noise, noise, delta=noise * 0.15)
+
+    def test_noisier_input_gets_lower_cutoff(self):
+        clean = feed(AdaptiveCutoff(min_cutoff=0.1, max_cutoff=10.0), 0.5)
+        noisy = feed(AdaptiveCutoff(min_cutoff=0.1, max_cutoff=10.0), 2.0)
+        self.assertGreater(clean.cutoff, noisy.cutoff * 4.0)
+        self.assertAlmostEqual(feed(AdaptiveCutoff(max_cutoff=3.0), 0.1).cutoff, 3.0, places=6)
+
+    def test_motion_does_not_count_as_noise(self):
+        adaptive = feed(AdaptiveCutoff(initial_cutoff=0.8), 1.0, speed=600.0)
+        self.assertEqual(adaptive.rest_samples, 0)
+        self.assertIsNone(adaptive.noise)
+        self.assertEqual(adaptive.cutoff, 0.8)
+
+    def test_stage_sets_filter_cutoff(self):
+        fx, fy = OneEuroFilter(min_cutoff=0.6), OneEuroFilter(min_cutoff=0.6)
+        stage = AdaptiveCutoffStage(AdaptiveCutoff(min_cutoff=0.1, max_cutoff=10.0), (fx, fy))
+        rng = np.random.default_rng(2)
+        for i in range(120):
+            sample = MotionSample(400.0 + rng.normal(0.0, 0.4), 200.0 + rng.normal(0.0, 0.4))
+            self.assertIs(stage.process(sample, i / 30.0), sample)
+        self.assertGreater(fx.min_cutoff, 1.5)
+        self.assertEqual(fx.min_cutoff, fy.min_cutoff)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+import numpy as np
+
+from src.one_euro import OneEuroBank, OneEuroFilter
+
+
+class OneEuroBankTests(unittest.TestCase):
+    def test_matches_scalar_filters_per_channel(self):
+        rng = np.random.default_rng(1)
+        cutoffs = [0.5, 1.0, 2.0]
+        betas = [0.0, 0.01, 0.3]
+        bank = OneEuroBank(3, min_cutoff=cutoffs, beta=betas)
+        scalars = [OneEuroFilter(min_cutoff=c, beta=b) for c, b in zip(cutoffs, betas)]
+        t = 0.0
+        for step in range(200):
+            t += 1.0 / 30.0 + rng.uniform(-0.005, 0.005)
+            if step == 120:
+                bank.reset()
+                for f in scalars:
+                    f.last_time = None
+            values = rng.normal(100.0, 5.0, size=3)
+            out = bank.filter(values, t)
+            expected = [f.filter(v, t) for f, v in zip(scalars, values)]
+            np.testing.assert_array_equal(out, expected)
+
+    def test_scalar_parameters_broadcast(self):
+        bank = OneEuroBank(4, min_cutoff=1.5, beta=0.2)
+        self.assertEqual(bank.min_cutoff.shape, (4,))
+        bank.set_params(beta=[0.0, 0.1, 0.2, 0.3])
+        self.assertAlmostEqual(bank.beta[3], 0.3)
+        self.assertAlmostEqual(bank.min_cutoff[0], 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
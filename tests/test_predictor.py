@@ -0,0 +1,53 @@
+import unittest
+
+from src.predictor import LatencyPredictor
+
+
+class LatencyPredictorTests(unittest.TestCase):
+    def feed(self, predictor, positions, dt=1.0 / 30.0):
+        for index, x in enumerate(positions):
+            predictor.update(x, 100.0, index * dt)
+        return (len(positions) - 1) * dt
+
+    def test_constant_velocity_is_led_by_latency(self):
+        predictor = LatencyPredictor(gain=1.0, extra_latency=0.0, min_speed=1.0, max_horizon=1.0)
+        last = self.feed(predictor, [600.0 * i / 30.0 for i in range(60)])
+        x, y = predictor.predict(1200.0, 100.0, last + 0.05)
+        self.assertAlmostEqual(x, 1200.0 + 600.0 * 0.05, delta=1.0)
+        self.assertAlmostEqual(y, 100.0)
+
+    def test_horizon_is_capped_and_gain_zero_disables(self):
+        predictor = LatencyPredictor(gain=1.0, extra_latency=0.0, min_speed=1.0, max_horizon=0.1)
+        last = self.feed(predictor, [600.0 * i / 30.0 for i in range(60)])
+        predictor.predict(0.0, 0.0, last + 1.0)
+        self.assertAlmostEqual(predictor.last_horizon, 0.1, places=3)
+        predictor.gain = 0.0
+        self.assertEqual(predictor.predict(5.0, 6.0, last + 1.0), (5.0, 6.0))
+
+    def test_resting_target_gets_no_lead(self):
+        predictor = LatencyPredictor(gain=1.0)
+        last = self.feed(predictor, [500.0 + (0.5 if i % 2 else -0.5) for i in range(30)])
+        x, _ = predictor.predict(500.0, 100.0, last + 0.05)
+        self.assertAlmostEqual(x, 500.0, delta=0.1)
+
+    def test_braking_shrinks_the_lead(self):
+        positions = [600.0 * i / 30.0 for i in range(30)]
+        for i in range(1, 6):
+            positions.append(positions[-1] + 20.0 - 3.5 * i)
+        damped = LatencyPredictor(gain=1.0, damping=4.0)
+        free = LatencyPredictor(gain=1.0, damping=0.0)
+        last = self.feed(damped, positions)
+        self.feed(free, positions)
+        damped.predict(0.0, 0.0, last + 0.05)
+        free.predict(0.0, 0.0, last + 0.05)
+        self.assertLess(damped.last_horizon, free.last_horizon)
+
+    def test_gap_restarts_the_track(self):
+        predictor = LatencyPredictor(gain=1.0, reset_gap=0.25)
+        self.feed(predictor, [600.0 * i / 30.0 for i in range(30)])
+        predictor.update(0.0, 0.0, 5.0)
+        self.assertEqual(predictor.velocity(), (0.0, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from src.presence import PresenceMonitor
+
+
+class FakeClock:
+    def __init__(self):
+        self.value = 0.0
+
+    def __call__(self):
+        return self.value
+
+
+class PresenceMonitorTests(unittest.TestCase):
+    def test_sleeps_after_absence_and_wakes_on_probe(self):
+        monitor = PresenceMonitor(sleep_after=5.0, cpu_clock=FakeClock())
+        self.assertFalse(monitor.update(True, 0.0))
+        self.assertFalse(monitor.update(False, 4.0))
+        self.assertFalse(monitor.update(None, 4.5))
+        self.assertTrue(monitor.update(False, 5.0))
+        self.assertTrue(monitor.sleeping)
+        self.assertFalse(monitor.update(False, 5.5))
+        self.assertTrue(monitor.update(True, 6.0))
+        self.assertFalse(monitor.sleeping)
+
+    def test_confirm_probe_keeps_resting_user_awake(self):
+        monitor = PresenceMonitor(sleep_after=5.0, cpu_clock=FakeClock())
+        monitor.update(True, 0.0)
+        self.assertFalse(monitor.update(False, 6.0, confirm=lambda: True))
+        self.assertFalse(monitor.sleeping)
+        self.assertFalse(monitor.update(False, 10.0, confirm=lambda: False))
+        self.assertTrue(monitor.update(False, 11.0, confirm=lambda: False))
+
+    def test_wake_leaves_sleep(self):
+        monitor = PresenceMonitor(sleep_after=1.0, cpu_clock=FakeClock())
+        monitor.update(False, 0.0)
+        monitor.update(False, 1.0)
+        self.assertTrue(monitor.wake(1.2))
+        self.assertFalse(monitor.wake(1.3))
+
+    def test_time_and_cpu_are_accounted_per_state(self):
+        clock = FakeClock()
+        monitor = PresenceMonitor(sleep_after=2.0, cpu_clock=clock)
+        monitor.update(True, 0.0)
+        clock.value = 1.0
+        monitor.update(False, 2.0)
+        clock.value = 1.1
+        monitor.update(False, 4.0)
+        self.assertAlmostEqual(monitor.state_seconds["ACTIVE"], 2.0)
+        self.assertAlmostEqual(monitor.state_seconds["SLEEP"], 2.0)
+        self.assertAlmostEqual(monitor.cpu_percent("ACTIVE"), 50.0)
+        self.assertAlmostEqual(monitor.cpu_percent("SLEEP"), 5.0)
+
+    def test_zero_disables_sleep(self):
+        monitor = PresenceMonitor(sleep_after=0.0, cpu_clock=FakeClock())
+        monitor.update(False, 0.0)
+        self.assertFalse(monitor.update(False, 1000.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
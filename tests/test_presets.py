@@ -42,6 +42,32 @@ class PresetTests(unittest.TestCase):
         self.assertEqual(applied, "precision")
         self.assertEqual(DummyConfig.ACTIVE_PRESET, "precision")
 
+    def test_curve_keys_cleared_by_presets_without_curves(self):
+        class CurveConfig(DummyConfig):
+            ACCEL_CURVE = ()
+            HEAD_SPEED_CURVE = ()
+
+        apply_preset(CurveConfig, "glide")
+        self.assertTrue(CurveConfig.HEAD_SPEED_CURVE)
+        apply_preset(CurveConfig, "legacy")
+        self.assertEqual(CurveConfig.HEAD_SPEED_CURVE, ())
+        self.assertEqual(CurveConfig.ACCEL_CURVE, ())
+
+    def test_config_curves_survive_presets_without_curves(self):
+        curve = ((0.0, 1.0), (400.0, 2.0))
+
+        class CurveConfig(DummyConfig):
+            ACCEL_CURVE = curve
+            HEAD_SPEED_CURVE = ()
+
+        apply_preset(CurveConfig, "swift")
+        self.assertEqual(CurveConfig.ACCEL_CURVE, curve)
+        apply_preset(CurveConfig, "glide")
+        self.assertNotEqual(CurveConfig.ACCEL_CURVE, curve)
+        apply_preset(CurveConfig, "swift")
+        self.assertEqual(CurveConfig.ACCEL_CURVE, curve)
+        self.assertEqual(CurveConfig.HEAD_SPEED_CURVE, ())
+
     def test_next_preset_name_cycles(self):
         self.assertEqual(next_preset_name(None), "precision")
         self.assertEqual(next_preset_name("precision"), "balanced")
@@ -0,0 +1,44 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.telemetry import Telemetry
+
+
+class TelemetryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "telemetry.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def records(self):
+        with open(self.path, encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle]
+
+    def test_tick_flushes_on_interval(self):
+        telemetry = Telemetry(self.path, interval=5.0)
+        telemetry.count("frames")
+        telemetry.tick(0.0)
+        telemetry.tick(4.0)
+        self.assertFalse(os.path.exists(self.path))
+        telemetry.tick(5.0)
+        self.assertEqual(self.records()[0]["counters"], {"frames": 1})
+
+    def test_close_writes_once(self):
+        telemetry = Telemetry(self.path, interval=5.0)
+        telemetry.timing("infer.hand", 0.01)
+        telemetry.close()
+        telemetry.close()
+        telemetry.flush()
+        telemetry.tick(100.0)
+        records = self.records()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]["timings"]["infer.hand"]["count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
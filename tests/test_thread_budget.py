@@ -0,0 +1,55 @@
+import os
+import unittest
+from unittest import mock
+
+from benchmarks.thread_budget import parse_budget
+from src.thread_budget import (
+    BLAS_ENV_VARS,
+    limit_blas_threads,
+    pin_current_thread,
+    plan_thread_budget,
+)
+
+
+class ThreadBudgetTests(unittest.TestCase):
+    def test_small_machine_shares_all_cores(self):
+        budget = plan_thread_budget(2, "HEAD")
+        self.assertEqual(budget.inference_cores, (0, 1))
+        self.assertEqual(budget.service_cores, (0, 1))
+        self.assertEqual(budget.opencv_threads, 1)
+
+    def test_four_cores_reserve_one_for_service_threads(self):
+        budget = plan_thread_budget(4, "EYE_HAND")
+        self.assertEqual(budget.service_cores, (0,))
+        self.assertEqual(budget.inference_cores, (1, 2, 3))
+        self.assertEqual(budget.opencv_threads, 1)
+        self.assertEqual(budget.blas_threads, 1)
+
+    def test_single_detector_mode_allows_more_opencv_threads(self):
+        budget = plan_thread_budget(8, "ABSOLUTE", blink_enabled=False, long_blink_enabled=False)
+        self.assertEqual(budget.opencv_threads, 2)
+        self.assertEqual(len(budget.service_cores), 2)
+        self.assertEqual(plan_thread_budget(8, "EYE_HAND").opencv_threads, 1)
+
+    def test_blas_limits_respect_existing_environment(self):
+        env = {BLAS_ENV_VARS[0]: "3"}
+        with mock.patch.dict(os.environ, env, clear=True):
+            limit_blas_threads(1)
+            self.assertEqual(os.environ[BLAS_ENV_VARS[0]], "3")
+            self.assertEqual(os.environ[BLAS_ENV_VARS[1]], "1")
+        with mock.patch.dict(os.environ, {}, clear=True):
+            limit_blas_threads(0)
+            self.assertNotIn(BLAS_ENV_VARS[0], os.environ)
+
+    def test_pinning_is_noop_without_active_budget(self):
+        self.assertFalse(pin_current_thread("service"))
+
+    def test_parse_budget(self):
+        self.assertEqual(parse_budget("auto"), {"label": "auto"})
+        self.assertEqual(
+            parse_budget("cv=1:pin=1"), {"label": "cv=1:pin=1", "cv": 1, "pin": 1}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
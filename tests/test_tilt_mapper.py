@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+from src.sliding_window import SlidingExtrema, SlidingMedian, SlidingPercentiles
+from src.tilt_mapper import TiltMapper
+
+
+class SlidingWindowTests(unittest.TestCase):
+    def test_extrema_match_brute_force(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(0.0, 1.0, 400).tolist()
+        times = np.cumsum(rng.uniform(0.01, 0.05, 400)).tolist()
+        window = SlidingExtrema(0.5)
+        for i, (t, value) in enumerate(zip(times, values)):
+            low, high = window.push(value, t)
+            recent = [v for s, v in zip(times[: i + 1], values[: i + 1]) if s >= t - 0.5]
+            self.assertEqual((low, high), (min(recent), max(recent)))
+
+    def test_percentiles_match_brute_force(self):
+        rng = np.random.default_rng(1)
+        values = rng.normal(0.0, 1.0, 300).tolist()
+        window = SlidingPercentiles(2.0, 0.1)
+        for i, value in enumerate(values):
+            t = i / 30.0
+            low, high = window.push(value, t)
+            recent = sorted(v for k, v in enumerate(values[: i + 1]) if k / 30.0 >= t - 2.0)
+            cut = int(0.1 * (len(recent) - 1))
+            self.assertEqual((low, high), (recent[cut], recent[len(recent) - 1 - cut]))
+
+    def test_median_matches_brute_force(self):
+        rng = np.random.default_rng(2)
+        # Ties, a drift (expired samples buried under live ones) and a gap.
+        values = np.concatenate(
+            [rng.integers(0, 4, 200), np.arange(200) * 0.1, rng.normal(0.0, 1.0, 200)]
+        ).tolist()
+        times = np.cumsum(rng.uniform(0.0, 0.05, 600)).tolist()
+        times[400:] = [s + 5.0 for s in times[400:]]
+        window = SlidingMedian(1.0)
+        for i, (t, value) in enumerate(zip(times, values)):
+            median = window.push(value, t)
+            recent = [v for s, v in zip(times[: i + 1], values[: i + 1]) if s >= t - 1.0]
+            self.assertEqual(median, float(np.median(recent)))
+        self.assertLess(len(window._low) + len(window._high), 2 * len(recent) + 40)
+
+
+class TiltMapperWindowTests(unittest.TestCase):
+    def sweep(self, mapper, seconds, spike_at=None):
+        for k in range(int(seconds * 30)):
+            t = k / 30.0
+            value = 0.5 * np.sin(2.0 * np.pi * t / 2.0)
+            if spike_at is not None and k == int(spike_at * 30):
+                value = 3.0
+            mapper.update(value, value, t)
+
+    def test_window_forgets_spike(self):
+        mapper = TiltMapper(min_range=0.1, window=2.0)
+        self.sweep(mapper, 4.0, spike_at=1.0)
+        self.assertAlmostEqual(mapper.max_x, 0.5, places=2)
+        self.assertAlmostEqual(mapper.min_x, -0.5, places=2)
+
+    def test_decay_keeps_spike(self):
+        mapper = TiltMapper(decay=0.006, min_range=0.1, ref_fps=30.0)
+        self.sweep(mapper, 4.0, spike_at=1.0)
+        self.assertGreater(mapper.max_x, 1.5)
+
+    def test_trim_ignores_single_spike(self):
+        mapper = TiltMapper(min_range=0.1, window=2.0, trim=0.02)
+        self.sweep(mapper, 2.0, spike_at=1.5)
+        self.assertLess(mapper.max_x, 0.51)
+
+    def test_reset_clears_window(self):
+        mapper = TiltMapper(min_range=0.1, window=2.0)
+        mapper.update(1.0, 1.0, 0.0)
+        mapper.reset()
+        mapper.update(0.2, 0.2, 0.1)
+        self.assertEqual((mapper.min_x, mapper.max_x), (0.2, 0.2))
+
+
+if __name__ == "__main__":
+    unittest.main()